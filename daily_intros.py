@@ -8,10 +8,15 @@ import sys
 import os
 
 # Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-from daily_intros import main
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
 
 if __name__ == "__main__":
-    main()
-
+    from daily_intros import run_cli
+    run_cli()
+else:
+    # Imported as `daily_intros` (e.g. with the project root on sys.path):
+    # this shim is still initializing under that name, so importing it again
+    # would find itself. Load src/daily_intros.py and stand in for it.
+    del sys.modules[__name__]
+    import daily_intros as _daily_intros
+    sys.modules[__name__] = _daily_intros
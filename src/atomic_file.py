@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Atomic, Locked Sidecar Files
+
+Helpers for the small state files kept next to the reports (task budget
+history, run watermark, report index). Writes go to a temporary file in the
+same directory that replaces the target in one rename, with owner-only
+permissions, so readers never see a half-written file. A read-modify-write
+is wrapped in locked(), an exclusive fcntl lock on a companion .lock file,
+so that concurrent runs cannot overwrite each other's updates.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+# fcntl locks do not exclude threads of the same process
+_thread_locks: Dict[str, threading.Lock] = {}
+_thread_locks_lock = threading.Lock()
+
+
+def _thread_lock(path: str) -> threading.Lock:
+    """Get the in-process lock for a file"""
+    key = os.path.abspath(path)
+    with _thread_locks_lock:
+        lock = _thread_locks.get(key)
+        if lock is None:
+            lock = _thread_locks[key] = threading.Lock()
+    return lock
+
+
+@contextmanager
+def locked(path: str) -> Iterator[None]:
+    """
+    Hold an exclusive lock for a read-modify-write of a file.
+
+    Locks `<path>.lock` (created if needed) across processes where fcntl is
+    available and across threads always.
+
+    Args:
+        path: File about to be read and rewritten
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    with _thread_lock(path):
+        if fcntl is None:
+            yield
+            return
+        fd = os.open(f"{path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+
+def write_text(path: str, text: str, mode: int = 0o600):
+    """
+    Replace a file's contents atomically.
+
+    Args:
+        path: File to write (its directory is created if needed)
+        text: New contents
+        mode: Permissions of the new file (default: owner read/write only)
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    prefix = '.' + os.path.splitext(os.path.basename(path))[0] + '_'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=prefix, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def write_json(path: str, data: Any, mode: int = 0o600):
+    """Replace a JSON file atomically (see write_text)"""
+    write_text(path, json.dumps(data, indent=2), mode)
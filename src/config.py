@@ -8,6 +8,7 @@ Provides a centralized configuration system with validation and type safety.
 
 import os
 import logging
+import threading
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -17,25 +18,35 @@ class SlackConfig:
     """Slack-specific configuration settings"""
     channel_name: str = "intros"
     message_search_limit: int = 100
+    max_search_pages: int = 20
     user_profile_timeout: int = 30
     fallback_timeout: int = 45
     safe_wrapper_timeout: int = 60
+    profile_search_workers: int = 4
+    prefetch_user_directory: bool = False
+    user_directory_max_pages: int = 20
 
 @dataclass
 class LinkedInConfig:
     """LinkedIn extraction configuration"""
+    # Tried as one combined matcher: the leftmost URL in the text wins and, at
+    # the same position, earlier patterns win. Every pattern must include
+    # "linkedin.com/" within its first 13 characters ("<https://www.").
     url_patterns: List[str] = field(default_factory=lambda: [
         r'<https?://(?:www\.)?linkedin\.com/in/[^>]+>',
         r'\(https?://(?:www\.)?linkedin\.com/in/[^)]+\)',
-        r'https?://(?:www\.)?linkedin\.com/in/[\w\-\.]+/?(?=\s|$|>|LinkedIn|linkedin)',
+        r'https?://(?:www\.)?linkedin\.com/in/[\w\-\.]+/?(?=\s|$|>|linkedin)',
         r'https?://(?:www\.)?linkedin\.com/pub/[\w\-\.]+/?(?=\s|$|>)',
-        r'linkedin\.com/in/[\w\-\.]+/?(?=\s|$|>)',
-        r'linkedin\.com/pub/[\w\-\.]+/?(?=\s|$|>)'
+        r'https?://(?:www\.)?linkedin\.com/posts/[^\s>)\],]+',
+        r'(?:www\.)?linkedin\.com/in/[\w\-\.]+/?(?=\s|$|>|linkedin)',
+        r'(?:www\.)?linkedin\.com/pub/[\w\-\.]+/?(?=\s|$|>)',
+        r'https?://(?:www\.)?linkedin\.com/in/[\w\-\.]+/?'
     ])
     profile_fields: List[str] = field(default_factory=lambda: [
         'status_text', 'title', 'phone', 'skype', 'real_name_normalized',
         'display_name', 'display_name_normalized', 'real_name', 'email'
     ])
+    cache_size: int = 4096  # Memoized texts in the shared extractor (0 disables)
 
 @dataclass
 class OutputConfig:
@@ -44,6 +55,24 @@ class OutputConfig:
     file_permissions: int = 0o600
     date_format: str = "%Y-%m-%d"
     filename_template: str = "daily_intros_{date}.md"
+    watermark_filename: str = "watermark.json"
+
+@dataclass
+class CacheConfig:
+    """Persistent user profile cache configuration"""
+    enabled: bool = True
+    filename: str = "profile_cache.sqlite3"
+    ttl_hours: int = 24 * 7
+    negative_ttl_hours: int = 24
+
+@dataclass
+class TaskBudgetConfig:
+    """Zapier task quota tracking configuration"""
+    enabled: bool = True
+    filename: str = "task_budget.json"
+    monthly_task_limit: int = 0  # 0 tracks usage without limiting lookups
+    billing_day: int = 1
+    reserve_tasks: int = 0
 
 @dataclass
 class LoggingConfig:
@@ -67,6 +96,8 @@ class Config:
         self.slack = SlackConfig()
         self.linkedin = LinkedInConfig()
         self.output = OutputConfig()
+        self.cache = CacheConfig()
+        self.task_budget = TaskBudgetConfig()
         self.logging = LoggingConfig()
         self.welcome = WelcomeMessageConfig()
         
@@ -81,15 +112,36 @@ class Config:
         # Slack configuration
         self.slack.channel_name = os.getenv('SLACK_CHANNEL', self.slack.channel_name)
         self.slack.message_search_limit = int(os.getenv('SLACK_SEARCH_LIMIT', self.slack.message_search_limit))
+        self.slack.max_search_pages = int(os.getenv('SLACK_MAX_SEARCH_PAGES', self.slack.max_search_pages))
         self.slack.user_profile_timeout = int(os.getenv('SLACK_PROFILE_TIMEOUT', self.slack.user_profile_timeout))
         self.slack.fallback_timeout = int(os.getenv('SLACK_FALLBACK_TIMEOUT', self.slack.fallback_timeout))
         self.slack.safe_wrapper_timeout = int(os.getenv('SLACK_SAFE_TIMEOUT', self.slack.safe_wrapper_timeout))
+        self.slack.profile_search_workers = int(os.getenv('SLACK_PROFILE_WORKERS', self.slack.profile_search_workers))
+        self.slack.prefetch_user_directory = os.getenv('SLACK_PREFETCH_USERS', 'false').lower() == 'true'
+        self.slack.user_directory_max_pages = int(os.getenv('SLACK_USER_DIRECTORY_MAX_PAGES', self.slack.user_directory_max_pages))
+        
+        # LinkedIn extraction configuration
+        self.linkedin.cache_size = int(os.getenv('LINKEDIN_CACHE_SIZE', self.linkedin.cache_size))
         
         # Output configuration
         self.output.output_directory = os.getenv('OUTPUT_DIRECTORY', self.output.output_directory)
         self.output.file_permissions = int(os.getenv('OUTPUT_PERMISSIONS', f"0o{self.output.file_permissions:o}"), 8)
         self.output.date_format = os.getenv('DATE_FORMAT', self.output.date_format)
         self.output.filename_template = os.getenv('FILENAME_TEMPLATE', self.output.filename_template)
+        self.output.watermark_filename = os.getenv('WATERMARK_FILE', self.output.watermark_filename)
+        
+        # Profile cache configuration
+        self.cache.enabled = os.getenv('PROFILE_CACHE_ENABLED', 'true').lower() == 'true'
+        self.cache.filename = os.getenv('PROFILE_CACHE_FILE', self.cache.filename)
+        self.cache.ttl_hours = int(os.getenv('PROFILE_CACHE_TTL_HOURS', self.cache.ttl_hours))
+        self.cache.negative_ttl_hours = int(os.getenv('PROFILE_CACHE_NEGATIVE_TTL_HOURS', self.cache.negative_ttl_hours))
+        
+        # Zapier task budget configuration
+        self.task_budget.enabled = os.getenv('TASK_BUDGET_ENABLED', 'true').lower() == 'true'
+        self.task_budget.filename = os.getenv('TASK_BUDGET_FILE', self.task_budget.filename)
+        self.task_budget.monthly_task_limit = int(os.getenv('ZAPIER_MONTHLY_TASK_LIMIT', self.task_budget.monthly_task_limit))
+        self.task_budget.billing_day = int(os.getenv('ZAPIER_BILLING_DAY', self.task_budget.billing_day))
+        self.task_budget.reserve_tasks = int(os.getenv('ZAPIER_TASK_RESERVE', self.task_budget.reserve_tasks))
         
         # Logging configuration
         self.logging.level = os.getenv('LOG_LEVEL', self.logging.level)
@@ -113,9 +165,25 @@ class Config:
         if not (1 <= self.slack.safe_wrapper_timeout <= 600):
             raise ValueError("safe_wrapper_timeout must be between 1 and 600 seconds")
         
+        if not (1 <= self.slack.profile_search_workers <= 32):
+            raise ValueError("profile_search_workers must be between 1 and 32")
+        
         # Validate search limit
         if not (1 <= self.slack.message_search_limit <= 1000):
             raise ValueError("message_search_limit must be between 1 and 1000")
+
+        if not (1 <= self.slack.max_search_pages <= 500):
+            raise ValueError("max_search_pages must be between 1 and 500")
+        
+        if not (1 <= self.slack.user_directory_max_pages <= 500):
+            raise ValueError("user_directory_max_pages must be between 1 and 500")
+        
+        # Validate LinkedIn extraction settings
+        if not self.linkedin.url_patterns:
+            raise ValueError("At least one LinkedIn URL pattern is required")
+        
+        if self.linkedin.cache_size < 0:
+            raise ValueError("LinkedIn extraction cache_size cannot be negative")
         
         # Validate output directory
         if not os.path.exists(self.output.output_directory):
@@ -124,6 +192,17 @@ class Config:
             except OSError as e:
                 raise ValueError(f"Cannot create output directory: {e}")
         
+        # Validate cache TTLs
+        if self.cache.ttl_hours < 0 or self.cache.negative_ttl_hours < 0:
+            raise ValueError("Profile cache TTLs cannot be negative")
+        
+        # Validate task budget
+        if self.task_budget.monthly_task_limit < 0 or self.task_budget.reserve_tasks < 0:
+            raise ValueError("Zapier task limit and reserve cannot be negative")
+        
+        if not (1 <= self.task_budget.billing_day <= 28):
+            raise ValueError("billing_day must be between 1 and 28")
+        
         # Validate welcome message template
         if not self.welcome.template.strip():
             raise ValueError("Welcome message template cannot be empty")
@@ -173,19 +252,38 @@ class Config:
             'slack': {
                 'channel_name': self.slack.channel_name,
                 'message_search_limit': self.slack.message_search_limit,
+                'max_search_pages': self.slack.max_search_pages,
                 'user_profile_timeout': self.slack.user_profile_timeout,
                 'fallback_timeout': self.slack.fallback_timeout,
-                'safe_wrapper_timeout': self.slack.safe_wrapper_timeout
+                'safe_wrapper_timeout': self.slack.safe_wrapper_timeout,
+                'profile_search_workers': self.slack.profile_search_workers,
+                'prefetch_user_directory': self.slack.prefetch_user_directory,
+                'user_directory_max_pages': self.slack.user_directory_max_pages
             },
             'linkedin': {
                 'url_patterns_count': len(self.linkedin.url_patterns),
+                'cache_size': self.linkedin.cache_size,
                 'profile_fields': self.linkedin.profile_fields
             },
             'output': {
                 'output_directory': self.output.output_directory,
                 'file_permissions': f"0o{self.output.file_permissions:o}",
                 'date_format': self.output.date_format,
-                'filename_template': self.output.filename_template
+                'filename_template': self.output.filename_template,
+                'watermark_filename': self.output.watermark_filename
+            },
+            'cache': {
+                'enabled': self.cache.enabled,
+                'filename': self.cache.filename,
+                'ttl_hours': self.cache.ttl_hours,
+                'negative_ttl_hours': self.cache.negative_ttl_hours
+            },
+            'task_budget': {
+                'enabled': self.task_budget.enabled,
+                'filename': self.task_budget.filename,
+                'monthly_task_limit': self.task_budget.monthly_task_limit,
+                'billing_day': self.task_budget.billing_day,
+                'reserve_tasks': self.task_budget.reserve_tasks
             },
             'logging': {
                 'level': self.logging.level,
@@ -199,18 +297,31 @@ class Config:
             }
         }
 
-# Global configuration instance
-config = Config()
+# Global configuration instance (built on first use: Config() creates the output directory)
+_config: Optional[Config] = None
+_config_lock = threading.Lock()
 
 def get_config() -> Config:
     """Get the global configuration instance"""
-    return config
+    global _config
+    if _config is None:
+        with _config_lock:
+            if _config is None:
+                _config = Config()
+    return _config
 
 def reload_config():
     """Reload configuration from environment variables"""
-    global config
-    config = Config()
-    return config
+    global _config
+    with _config_lock:
+        _config = Config()
+    return _config
+
+def __getattr__(name: str):
+    """Keep `from config import config` working without building it at import time"""
+    if name == 'config':
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -11,9 +11,11 @@ See DUAL_MODE_USAGE.md for detailed usage instructions
 """
 
 import json
-import re
 import os
 import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 
@@ -22,33 +24,26 @@ if __name__ == "__main__" or not __package__:
     # Direct execution - use absolute imports
     from user_profile_search import safe_profile_search_for_daily_intros
     from dual_mode.mcp_adapter import get_mcp_adapter
+    from linkedin_extractor import extract_linkedin_link
+    from intro_classifier import get_intro_classifier
+    from task_budget import get_task_budget
+    from retry_policy import get_retry_policy_registry
+    from user_directory import get_user_directory
+    from watermark import get_watermark_store
+    from deadline import Deadline
+    from report_index import build_report_entry, get_report_index
 else:
     # Package import - use relative imports
     from .user_profile_search import safe_profile_search_for_daily_intros
     from .dual_mode.mcp_adapter import get_mcp_adapter
-
-# Pre-compile regex patterns for better performance
-_LINKEDIN_PATTERNS = [
-    # Handle URLs in angle brackets or parentheses first
-    re.compile(r'<https?://(?:www\.)?linkedin\.com/in/[^>]+>', re.IGNORECASE),
-    re.compile(r'\(https?://(?:www\.)?linkedin\.com/in/[^)]+\)', re.IGNORECASE),
-    # Standard LinkedIn profile URLs - more restrictive pattern
-    re.compile(r'https?://(?:www\.)?linkedin\.com/in/[\w\-\.]+/?(?=\s|$|>|LinkedIn|linkedin)', re.IGNORECASE),
-    re.compile(r'https?://(?:www\.)?linkedin\.com/posts/[^\s>)\],]+', re.IGNORECASE),
-    # LinkedIn URLs without protocol - more restrictive
-    re.compile(r'(?:www\.)?linkedin\.com/in/[\w\-\.]+/?(?=\s|$|>|LinkedIn|linkedin)', re.IGNORECASE),
-    # Handle URLs with various punctuation
-    re.compile(r'https?://(?:www\.)?linkedin\.com/in/[\w\-\.]+/?', re.IGNORECASE),
-]
-
-# Pre-compile cleanup patterns
-_CLEANUP_PATTERNS = [
-    (re.compile(r'[.,;!?]+$'), ''),
-    (re.compile(r'LinkedIn>$'), ''),
-    (re.compile(r'linkedin>$', re.IGNORECASE), ''),
-    (re.compile(r'This$'), ''),
-    (re.compile(r'/+$'), '/'),
-]
+    from .linkedin_extractor import extract_linkedin_link
+    from .intro_classifier import get_intro_classifier
+    from .task_budget import get_task_budget
+    from .retry_policy import get_retry_policy_registry
+    from .user_directory import get_user_directory
+    from .watermark import get_watermark_store
+    from .deadline import Deadline
+    from .report_index import build_report_entry, get_report_index
 
 # Cache for security manager and config
 _security_manager_cache = None
@@ -76,35 +71,13 @@ def _get_cached_config():
         _config_cache = Config()
     return _config_cache
 
-def extract_linkedin_link(text: str) -> Optional[str]:
-    """Extract LinkedIn profile link from message text using pre-compiled patterns"""
-    for pattern in _LINKEDIN_PATTERNS:
-        match = pattern.search(text)
-        if match:
-            url = match.group(0)
-            # Clean up the URL
-            if url.startswith('<') and url.endswith('>'):
-                url = url[1:-1]
-            elif url.startswith('(') and url.endswith(')'):
-                url = url[1:-1]
-            
-            # Apply cleanup patterns
-            for cleanup_pattern, replacement in _CLEANUP_PATTERNS:
-                url = cleanup_pattern.sub(replacement, url)
-            
-            # Add protocol if missing
-            if not url.startswith('http'):
-                url = 'https://' + url
-            return url
-    return None
-
-# Pre-define intro keywords as module constant for better performance
-_INTRO_KEYWORDS = frozenset([
-    'hi everyone', 'hello everyone', 'hey everyone', 'hey all', 'hi all',
-    'i\'m ', 'my name is', 'introduction', 'nice to meet',
-    'pleased to meet', 'excited to be here', 'happy to be here',
-    'i am', 'i have been', 'based', 'working', 'fun fact'
-])
+def _report_directory() -> str:
+    """Directory holding the daily reports and their index (OUTPUT_DIRECTORY, like the other run state)"""
+    if __name__ == "__main__" or not __package__:
+        from config import get_config
+    else:
+        from .config import get_config
+    return get_config().output.output_directory
 
 def extract_first_name(real_name: str, username: str) -> str:
     """Extract first name from user data (optimized to avoid double split)"""
@@ -114,51 +87,65 @@ def extract_first_name(real_name: str, username: str) -> str:
     return username if username else "there"
 
 def is_intro_message(text: str) -> bool:
-    """Check if message looks like an introduction using pre-defined keywords"""
-    text_lower = text.lower()
-    return any(keyword in text_lower for keyword in _INTRO_KEYWORDS)
+    """Check if message looks like an introduction using the shared keyword classifier"""
+    return get_intro_classifier().is_intro(text)
 
 
 def parse_intro_message(message: Dict) -> Optional[Dict]:
     """Parse a Slack message to extract intro information with security validation"""
-    security = _get_cached_security_manager()
-    
-    user = message.get('user', {})
-    text = message.get('text', '') or message.get('raw_text', '')
+    records = parse_intro_messages([message])
+    return records[0] if records else None
 
-    if not is_intro_message(text):
-        return None
-
-    # Validate and sanitize input data
-    raw_data = {
-        'real_name': user.get('real_name', ''),
-        'username': user.get('name', ''),
-        'message_text': text,
-        'timestamp': message.get('ts_time', ''),
-        'user_id': user.get('id', ''),
-        'permalink': message.get('permalink', '')
-    }
+def parse_intro_messages(batch: List[Dict]) -> List[Dict]:
+    """
+    Parse a page of Slack messages into intro records with security validation.
+    
+    Non-intro messages are dropped before any sanitization, and the remaining
+    messages are sanitized and scanned for LinkedIn links in one batch.
+    
+    Args:
+        batch: Slack messages (e.g. one page from iter_message_pages)
+    
+    Returns:
+        Intro records in message order (same shape as parse_intro_message)
+    """
+    classifier = get_intro_classifier()
+    raw_records = []
+    for message in batch:
+        text = message.get('text', '') or message.get('raw_text', '')
+        if not classifier.is_intro(text):
+            continue
+        user = message.get('user', {})
+        raw_records.append({
+            'real_name': user.get('real_name', ''),
+            'username': user.get('name', ''),
+            'message_text': text,
+            'timestamp': message.get('ts_time', ''),
+            'user_id': user.get('id', ''),
+            'permalink': message.get('permalink', '')
+        })
+    
+    if not raw_records:
+        return []
     
     # Apply security validation and sanitization
-    sanitized_data = security.validate_and_sanitize_input(raw_data)
+    sanitized_records = _get_cached_security_manager().validate_and_sanitize_batch(raw_records)
     
-    first_name = extract_first_name(sanitized_data['real_name'], sanitized_data['username'])
-    linkedin_link = extract_linkedin_link(sanitized_data['message_text'])
-
     # Note: Profile search will be done later for users without LinkedIn links
-    profile_checked = False
-
-    return {
-        'first_name': first_name,
-        'real_name': sanitized_data['real_name'],
-        'username': sanitized_data['username'],
-        'linkedin_link': linkedin_link,
-        'message_text': sanitized_data['message_text'],
-        'timestamp': sanitized_data['timestamp'],
-        'user_id': sanitized_data['user_id'],
-        'permalink': sanitized_data['permalink'],
-        'profile_checked': profile_checked
-    }
+    return [
+        {
+            'first_name': extract_first_name(record['real_name'], record['username']),
+            'real_name': record['real_name'],
+            'username': record['username'],
+            'linkedin_link': extract_linkedin_link(record['message_text']),
+            'message_text': record['message_text'],
+            'timestamp': record['timestamp'],
+            'user_id': record['user_id'],
+            'permalink': record['permalink'],
+            'profile_checked': False
+        }
+        for record in sanitized_records
+    ]
 
 def generate_welcome_message(intro_data: Dict) -> str:
     """Generate personalized welcome message using cached config"""
@@ -166,9 +153,21 @@ def generate_welcome_message(intro_data: Dict) -> str:
     first_name = intro_data['first_name'].capitalize()
     return config.welcome_message_template.format(first_name=first_name)
 
-def save_daily_intro_report(welcome_messages: List[tuple], output_dir: str = "./welcome_messages", output_date: str = None, error_info: str = None):
-    """Save daily intro report with security validation and optimized I/O"""
+def report_filename(output_date: str = None) -> str:
+    """Filename of the report for a date (default: today)"""
+    date_str = output_date if output_date else datetime.now().strftime('%Y-%m-%d')
+    return f"daily_intros_{date_str}.md"
+
+def save_daily_intro_report(welcome_messages: List[tuple], output_dir: str = None, output_date: str = None, error_info: str = None, cutoff: str = None):
+    """Save daily intro report with security validation and optimized I/O
+
+    The report goes to output_dir (default: the configured output
+    directory) and is indexed there with its run's cutoff, so a rerun that
+    rewrites it can search the same window again (see get_cutoff_timestamp).
+    """
     security = _get_cached_security_manager()
+    if output_dir is None:
+        output_dir = _report_directory()
 
     # Validate output directory path (treat as directory, not file)
     if not security.validate_file_operation(output_dir, "create"):
@@ -178,7 +177,7 @@ def save_daily_intro_report(welcome_messages: List[tuple], output_dir: str = "./
     date_str = output_date if output_date else datetime.now().strftime('%Y-%m-%d')
 
     # Validate filename
-    filename = f"daily_intros_{date_str}.md"
+    filename = report_filename(date_str)
     if not security.validator.validate_filename(filename, ['.md']):
         raise ValueError(f"Invalid filename: {filename}")
 
@@ -189,9 +188,10 @@ def save_daily_intro_report(welcome_messages: List[tuple], output_dir: str = "./
         raise ValueError(f"Invalid file path: {filepath}")
 
     # Build content in memory for better I/O performance
+    generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     content_parts = [
         f"# Daily Introductions - {date_str}\n\n",
-        f"Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        f"Generated at: {generated_at}\n\n",
         "**🚀 This report was generated using LIVE Slack data via MCP Zapier integration!**\n\n"
     ]
 
@@ -207,6 +207,7 @@ def save_daily_intro_report(welcome_messages: List[tuple], output_dir: str = "./
             "---\n\n"
         ])
 
+        section_starts = []  # Index into content_parts where each intro begins
         for i, (intro_data, welcome_msg) in enumerate(welcome_messages, 1):
             intro_parts = [f"## {i}. {intro_data['real_name']}\n\n"]
             
@@ -249,77 +250,120 @@ def save_daily_intro_report(welcome_messages: List[tuple], output_dir: str = "./
             if i < len(welcome_messages):
                 intro_parts.append("---\n\n")
             
+            section_starts.append(len(content_parts))
             content_parts.extend(intro_parts)
 
     # Write all content at once
+    content = ''.join(content_parts)
     with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(''.join(content_parts))
+        f.write(content)
 
     # Set restrictive permissions (owner read/write only)
     os.chmod(filepath, 0o600)
+
+    # Record the report in the directory's index
+    sections = []
+    if welcome_messages and not error_info:
+        offsets = [0]
+        for part in content_parts:
+            offsets.append(offsets[-1] + len(part.encode('utf-8')))
+        bounds = section_starts + [len(content_parts)]
+        for (intro_data, _), start, end in zip(welcome_messages, bounds, bounds[1:]):
+            sections.append({
+                'user_id': intro_data.get('user_id', ''),
+                'username': intro_data.get('username', ''),
+                'timestamp': intro_data.get('timestamp', ''),
+                'offset': offsets[start],
+                'length': offsets[end] - offsets[start]
+            })
+    try:
+        get_report_index(output_dir).record(build_report_entry(
+            filename, date_str, sections, len(content.encode('utf-8')),
+            generated_at=generated_at, error=bool(error_info), cutoff=cutoff or ''
+        ))
+    except Exception as e:
+        print(f"⚠️  Could not update report index: {e}")
     return filepath
 
-def get_cutoff_timestamp(start_date=None):
-    """Get the cutoff timestamp - either from parameter or yesterday's file"""
+def _report_window_start(entry: Dict) -> Optional[str]:
+    """Cutoff a report's run searched after (for reports indexed without one: the day of its oldest intro)"""
+    if entry.get('cutoff'):
+        return entry['cutoff']
+    timestamps = [intro['timestamp'] for intro in entry.get('intros', []) if intro.get('timestamp')]
+    return f"{min(timestamps)[:10]}T00:00:00.000Z" if timestamps else None
+
+def get_cutoff_timestamp(start_date=None, output_date=None):
+    """Get the cutoff timestamp - from the parameter, the report being rewritten, or the channel's run watermark
+
+    A rerun for a date whose report already exists searches that report's
+    window again, so the rewritten report keeps the intros it already had.
+    """
     if start_date:
         print(f"📅 Using provided start date: {start_date}")
         return f"{start_date}T00:00:00.000Z"
 
-    # Auto-detect from the latest MD file by finding the most recent date in filename
     cutoff_timestamp = "2025-09-17T00:00:00.000Z"  # Default fallback
-    timestamp_pattern = re.compile(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z)')
-    date_pattern = re.compile(r'(\d{4}-\d{2}-\d{2})')
-    
+    channel = _get_cached_config().slack.channel_name
+
     try:
-        # Use os.scandir for better performance than glob
-        welcome_dir = "./welcome_messages"
-        if not os.path.exists(welcome_dir):
-            return cutoff_timestamp
-        
-        md_files = []
-        with os.scandir(welcome_dir) as entries:
-            for entry in entries:
-                if entry.is_file() and entry.name.startswith("daily_intros_") and entry.name.endswith(".md"):
-                    md_files.append(entry.path)
-        
-        if md_files:
-            # Sort files by the date in their filename (not modification time)
-            md_files.sort(key=lambda x: date_pattern.search(x).group(1) if date_pattern.search(x) else "")
-
-            # Find the most recent file that's not today (to avoid reading empty/partial files)
-            today_str = datetime.now().strftime('%Y-%m-%d')
-            latest_file = None
-            for file in reversed(md_files):  # Start from latest
-                file_date_match = date_pattern.search(file)
-                if file_date_match and file_date_match.group(1) != today_str:
-                    latest_file = file
-                    break
-
-            # If no file found before today, use the latest file anyway
-            if not latest_file:
-                latest_file = md_files[-1]
-
-            print(f"📅 Found latest MD file: {latest_file}")
-
-            # Read file and find timestamps efficiently
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Find ALL timestamps in the file and use the latest one
-                timestamps = timestamp_pattern.findall(content)
-                if timestamps:
-                    cutoff_timestamp = max(timestamps)
-                    print(f"📅 Auto-detected latest timestamp from {latest_file}: {cutoff_timestamp}")
+        existing_report = get_report_index().get(report_filename(output_date))
+        window_start = _report_window_start(existing_report) if existing_report else None
+        if window_start:
+            print(f"📅 Rewriting {existing_report['report']} - searching its window again after {window_start}")
+            return window_start
+
+        store = get_watermark_store()
+        watermark = store.get(channel)
+        if watermark is not None:
+            print(f"📅 Resuming after last processed message: {watermark.ts}")
+            return watermark.ts
+
+        # No watermark yet: seed it once from the newest reported message
+        latest_timestamp = get_report_index().latest_timestamp()
+        if latest_timestamp:
+            cutoff_timestamp = latest_timestamp
+            print(f"📅 Auto-detected latest timestamp from reports: {cutoff_timestamp}")
+            store.advance(channel, cutoff_timestamp)
     except Exception as e:
-        print(f"⚠️  Could not parse latest MD file, using default cutoff: {e}")
+        print(f"⚠️  Could not read run watermark or report index, using default cutoff: {e}")
 
     return cutoff_timestamp
 
-def get_messages_for_timestamp_range(start_timestamp, end_date=None):
-    """Get messages for a specific timestamp range using Slack API search
-
-    Returns:
-        tuple: (messages_list, error_message) where error_message is None if successful
-    """
+def _advance_watermark(newest_message: Optional[Dict]):
+    """Record the newest message processed by a successful run"""
+    if newest_message is None:
+        return
+    channel = _get_cached_config().slack.channel_name
+    message_id = newest_message.get('ts') or newest_message.get('permalink', '')
+    try:
+        if get_watermark_store().advance(channel, newest_message['ts_time'], message_id):
+            print(f"📌 Watermark for #{channel} advanced to {newest_message['ts_time']}")
+    except Exception as e:
+        print(f"⚠️  Could not save run watermark: {e}")
+
+class MessageFetchError(Exception):
+    """Raised when the Slack message search fails; str(error) is a markdown error report"""
+    pass
+
+_QUOTA_ERROR_MESSAGE = (
+    "**Zapier API Error: Insufficient Tasks/Quota**\n\n"
+    "The Zapier integration has run out of available tasks for this billing period.\n\n"
+    "**Solutions:**\n"
+    "- Upgrade your Zapier plan to get more tasks\n"
+    "- Wait until your task quota resets (usually monthly)\n"
+    "- Use the Slack API directly instead of through Zapier\n"
+)
+
+_MCP_CONFIG_ERROR_MESSAGE = (
+    "**MCP Configuration Error**\n\n"
+    "The Slack search function is not available. This usually means:\n"
+    "- MCP Zapier server is not connected\n"
+    "- Check your MCP server configuration\n"
+    "- Verify your Zapier integration is properly set up\n"
+)
+
+def build_search_query(start_timestamp: str, end_date: str = None) -> str:
+    """Build the day-granular Slack search query for a timestamp range"""
     # Extract date part once (more efficient than multiple splits)
     start_date = start_timestamp.split('T', 1)[0]
 
@@ -329,133 +373,265 @@ def get_messages_for_timestamp_range(start_timestamp, end_date=None):
         end_date_part = end_date.split('T', 1)[0] if 'T' in end_date else end_date
 
         if start_date == end_date_part:
-            search_query = f"in:intros during:{start_date}"
-        else:
-            # Convert to datetime objects for proper date arithmetic
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-            end_dt = datetime.strptime(end_date_part, '%Y-%m-%d')
-
-            # Adjust dates: start_date-1 and end_date+2
-            adjusted_start = (start_dt - timedelta(days=1)).strftime('%Y-%m-%d')
-            adjusted_end = (end_dt + timedelta(days=2)).strftime('%Y-%m-%d')
+            return f"in:intros during:{start_date}"
 
-            search_query = f"in:intros after:{adjusted_start} before:{adjusted_end}"
-    else:
-        # For open-ended searches, subtract 1 day from start
+        # Convert to datetime objects for proper date arithmetic
         start_dt = datetime.strptime(start_date, '%Y-%m-%d')
+        end_dt = datetime.strptime(end_date_part, '%Y-%m-%d')
+
+        # Adjust dates: start_date-1 and end_date+2
         adjusted_start = (start_dt - timedelta(days=1)).strftime('%Y-%m-%d')
-        search_query = f"in:intros after:{adjusted_start}"
+        adjusted_end = (end_dt + timedelta(days=2)).strftime('%Y-%m-%d')
 
-    print(f"🔍 Searching Slack with: {search_query}")
+        return f"in:intros after:{adjusted_start} before:{adjusted_end}"
+
+    # For open-ended searches, subtract 1 day from start
+    start_dt = datetime.strptime(start_date, '%Y-%m-%d')
+    adjusted_start = (start_dt - timedelta(days=1)).strftime('%Y-%m-%d')
+    return f"in:intros after:{adjusted_start}"
+
+def message_time_filter(start_timestamp: str, end_date: str = None):
+    """
+    Build the exact ts_time filter for a timestamp range.
 
-    # Use actual Slack API search via MCP Zapier (auto-detected server)
+    Slack's after:/before: operators are day-granular and the query widens
+    the window further, so this keeps only messages strictly after the
+    cutoff and up to the end date (a whole YYYY-MM-DD day, or a full
+    timestamp, inclusive). ISO 8601 UTC timestamps compare as strings.
+
+    Returns:
+        Predicate taking a normalized message
+    """
+    if end_date and 'T' not in end_date:
+        end_before = (datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+        return lambda message: start_timestamp < message['ts_time'] < end_before
+    if end_date:
+        return lambda message: start_timestamp < message['ts_time'] <= end_date
+    return lambda message: start_timestamp < message['ts_time']
+
+def normalize_message(msg: Dict) -> Dict:
+    """Convert a Zapier search result into the message format used by the pipeline"""
+    return {
+        "user": {
+            "id": msg['user']['id'],
+            "real_name": msg['user']['real_name'],
+            "name": msg['user']['name']
+        },
+        "text": msg.get('raw_text', msg.get('text', '')),
+        "ts_time": msg['ts_time'],
+        "ts": msg.get('ts', ''),
+        "permalink": msg['permalink']
+    }
+
+def _next_page_params(result: Dict) -> Optional[Dict]:
+    """
+    Work out the request parameters for the next result page.
+
+    Supports both Slack pagination styles as passed through by Zapier:
+    cursor-based (response_metadata.next_cursor) and page-based (paging.page/pages).
+
+    Returns:
+        Extra keyword arguments for the next slack_find_message call, or None on the last page
+    """
+    metadata = result.get('response_metadata') or {}
+    cursor = metadata.get('next_cursor') or result.get('next_cursor')
+    if cursor:
+        return {'cursor': cursor}
+
+    paging = result.get('paging') or result.get('pagination') or {}
     try:
-        mcp = get_mcp_adapter()
-        result = mcp.slack_find_message(
-            instructions=f"Search for introduction messages in the intros channel using query: {search_query}",
-            query=search_query,
-            sort_by="timestamp",
-            sort_dir="desc"
-        )
+        page = int(paging.get('page') or 0)
+        pages = int(paging.get('pages') or 0)
+    except (TypeError, ValueError):
+        return None
+    if page and page < pages:
+        return {'page': page + 1}
+    return None
+
+def iter_message_pages(start_timestamp, end_date=None, max_pages: int = None, outcome: Optional[Dict] = None):
+    """Stream messages for a timestamp range one result page at a time
+
+    Follows Slack/Zapier pagination cursors and yields each page as a list of
+    normalized messages as soon as it arrives, so callers can start processing
+    before later pages have been fetched. Messages outside the exact range
+    (see message_time_filter) are dropped before they are yielded.
+
+    Results arrive newest first, so when the page limit stops the fetch the
+    messages not fetched are the oldest ones in the range. If given, the
+    outcome dict's 'truncated' is set to True in that case.
+
+    Raises:
+        MessageFetchError: If the search fails; the message is a markdown error report
+    """
+    if max_pages is None:
+        max_pages = _get_cached_config().slack.max_search_pages
+
+    search_query = build_search_query(start_timestamp, end_date)
+    in_range = message_time_filter(start_timestamp, end_date)
+    print(f"🔍 Searching Slack with: {search_query}")
+
+    page_params = {}
+    seen_params = []
+    for page_number in range(1, max_pages + 1):
+        # Use actual Slack API search via MCP Zapier (auto-detected server)
+        try:
+            mcp = get_mcp_adapter()
+            result = mcp.slack_find_message(
+                instructions=f"Search for introduction messages in the intros channel using query: {search_query}",
+                query=search_query,
+                sort_by="timestamp",
+                sort_dir="desc",
+                **page_params
+            )
+        except NameError:
+            print("❌ Slack search function not available")
+            print("💡 This usually means MCP Zapier server is not connected")
+            print("💡 Check your MCP server configuration and Zapier integration")
+            raise MessageFetchError(_MCP_CONFIG_ERROR_MESSAGE)
+        except Exception as e:
+            print(f"❌ Error searching Slack: {e}")
+            raise MessageFetchError(f"**Unexpected Error**\n\nError searching Slack: {str(e)}\n")
 
         # Check if result is None (indicates an error in mcp_adapter)
         if result is None:
-            error_msg = (
-                "**Zapier API Error: Insufficient Tasks/Quota**\n\n"
-                "The Zapier integration has run out of available tasks for this billing period.\n\n"
-                "**Solutions:**\n"
-                "- Upgrade your Zapier plan to get more tasks\n"
-                "- Wait until your task quota resets (usually monthly)\n"
-                "- Use the Slack API directly instead of through Zapier\n"
-            )
             print("❌ Zapier quota exceeded - cannot retrieve messages")
-            return [], error_msg
-
-        if result and 'results' in result:
-            messages = []
-            for msg in result['results']:
-                # Convert Zapier message format to our expected format
-                message = {
-                    "user": {
-                        "id": msg['user']['id'],
-                        "real_name": msg['user']['real_name'],
-                        "name": msg['user']['name']
-                    },
-                    "text": msg.get('raw_text', msg.get('text', '')),
-                    "ts_time": msg['ts_time'],
-                    "permalink": msg['permalink']
-                }
-                messages.append(message)
-
-            print(f"📨 Found {len(messages)} messages from Slack API")
-            return messages, None
-        else:
-            print("⚠️  No messages found in API response")
-            return [], None
-
-    except NameError:
-        error_msg = (
-            "**MCP Configuration Error**\n\n"
-            "The Slack search function is not available. This usually means:\n"
-            "- MCP Zapier server is not connected\n"
-            "- Check your MCP server configuration\n"
-            "- Verify your Zapier integration is properly set up\n"
-        )
-        print("❌ Slack search function not available")
-        print("💡 This usually means MCP Zapier server is not connected")
-        print("💡 Check your MCP server configuration and Zapier integration")
-        return [], error_msg
+            raise MessageFetchError(_QUOTA_ERROR_MESSAGE)
+
+        if 'results' not in result:
+            if page_number == 1:
+                print("⚠️  No messages found in API response")
+            return
+
+        fetched = [normalize_message(msg) for msg in result['results']]
+        messages = [message for message in fetched if in_range(message)]
+        print(f"📨 Page {page_number}: {len(fetched)} messages from Slack API, "
+              f"{len(fetched) - len(messages)} outside {start_timestamp} - {end_date or 'now'}")
+        if messages:
+            yield messages
+
+        # Results are newest first: once a whole page is at or before the
+        # cutoff, every later page is too
+        if fetched and all(message['ts_time'] <= start_timestamp for message in fetched):
+            print("📨 Reached messages before the cutoff - stopping")
+            return
+
+        page_params = _next_page_params(result)
+        if not page_params:
+            return
+        if page_params in seen_params:
+            print("⚠️  Slack returned a repeated pagination cursor - stopping")
+            return
+        seen_params.append(page_params)
+
+    print(f"⚠️  Reached page limit ({max_pages}) - remaining results were not fetched")
+    if outcome is not None:
+        outcome['truncated'] = True
+
+def get_messages_for_timestamp_range(start_timestamp, end_date=None):
+    """Get messages for a specific timestamp range using Slack API search
+
+    Collects every page from iter_message_pages() into a single list.
+
+    Returns:
+        tuple: (messages_list, error_message) where error_message is None if successful
+    """
+    messages = []
+    try:
+        for page in iter_message_pages(start_timestamp, end_date):
+            messages.extend(page)
+    except MessageFetchError as e:
+        return [], str(e)
+
+    print(f"📨 Found {len(messages)} messages from Slack API")
+    return messages, None
+
+def _get_task_budget():
+    """Get the Zapier task budget, treating an unusable budget as tracking disabled"""
+    try:
+        return get_task_budget()
     except Exception as e:
-        error_msg = f"**Unexpected Error**\n\nError searching Slack: {str(e)}\n"
-        print(f"❌ Error searching Slack: {e}")
-        return [], error_msg
+        print(f"⚠️  Zapier task budget unavailable: {e}")
+        return None
+
+def _finish_task_budget(budget):
+    """Persist this run's Zapier task usage and print a summary"""
+    if budget is None:
+        return
+    try:
+        run = budget.finish_run()
+    except OSError as e:
+        print(f"⚠️  Could not save Zapier task usage: {e}")
+        return
+    remaining = budget.remaining()
+    summary = f"💰 Zapier tasks used this run: {run['tasks']}"
+    if remaining is not None:
+        summary += f" ({remaining} left this billing period)"
+    print(summary)
+    if run['lookups_skipped']:
+        print(f"💰 Skipped {run['lookups_skipped']} profile lookups to stay within the Zapier task budget")
+
+def _print_retry_summary():
+    """Report MCP calls that needed retries during this run"""
+    stats = get_retry_policy_registry().get_stats()
+    if stats['retries']:
+        print(f"🔁 MCP retries: {stats['retries']} "
+              f"({stats['recovered']} calls recovered, {stats['gave_up']} gave up)")
 
 def print_usage():
     """Print usage information"""
     print("""
-Usage: python3 daily_intros.py [start_date] [end_date] [output_date]
+Usage: python3 daily_intros.py [--include-seen] [start_date] [end_date] [output_date]
 
 Parameters:
   start_date   - Start cutoff date (YYYY-MM-DD) or 'auto' for auto-detection
-                 If omitted or 'auto', automatically finds latest timestamp from most recent MD file
+                 If omitted or 'auto', resumes after the last message processed by a previous run
   end_date     - End date for filtering (YYYY-MM-DD), optional
   output_date  - Date for output filename (YYYY-MM-DD), optional (defaults to today)
 
+Options:
+  --include-seen - Also report intros that an earlier run already reported
+
 Examples:
-  python3 daily_intros.py                    # Auto-detect from latest MD file
+  python3 daily_intros.py                    # Resume from the last run
   python3 daily_intros.py auto               # Same as above
   python3 daily_intros.py 2025-09-18         # Manual start date
   python3 daily_intros.py 2025-09-18 2025-09-19  # Date range
   python3 daily_intros.py 2025-09-18 2025-09-19 2025-09-20  # With custom output date
+  python3 daily_intros.py --include-seen 2025-09-18  # Re-report a day's intros
 """)
 
-def main(start_date=None, end_date=None, output_date=None):
+def main(start_date=None, end_date=None, output_date=None, include_seen=False):
     """
     Main function - call this to generate introduction report
 
     Parameters:
-    - start_date: Override cutoff date (YYYY-MM-DD). If None, auto-detects from latest MD file
+    - start_date: Override cutoff date (YYYY-MM-DD). If None, resumes from the run watermark
     - end_date: End date for filtering (YYYY-MM-DD). If None, includes all messages after start_date
     - output_date: Override output filename date (YYYY-MM-DD). If None, uses today's date
+    - include_seen: Also report intros already reported by an earlier run
     """
     import sys
 
+    # Handle command line arguments
+    if len(sys.argv) > 1 and sys.argv[1].lower() in ['help', '--help', '-h']:
+        print_usage()
+        return
+
     print("🚀 Generating introduction report...")
     print("=" * 50)
 
-    # Handle command line arguments
-    if len(sys.argv) > 1:
-        if sys.argv[1].lower() in ['help', '--help', '-h']:
-            print_usage()
-            return
-        start_date = sys.argv[1] if sys.argv[1].lower() != 'auto' else None
-        if len(sys.argv) > 2:
-            end_date = sys.argv[2]
-        if len(sys.argv) > 3:
-            output_date = sys.argv[3]
+    args = [arg for arg in sys.argv[1:] if arg != '--include-seen']
+    if len(args) < len(sys.argv) - 1:
+        include_seen = True
+    if args:
+        start_date = args[0] if args[0].lower() != 'auto' else None
+        if len(args) > 1:
+            end_date = args[1]
+        if len(args) > 2:
+            output_date = args[2]
 
     # Get the cutoff timestamp (auto-detect if start_date is None)
-    cutoff_timestamp = get_cutoff_timestamp(start_date)
+    cutoff_timestamp = get_cutoff_timestamp(start_date, output_date)
 
     if end_date:
         search_query = f"in:intros after:{cutoff_timestamp} before:{end_date}"
@@ -466,69 +642,152 @@ def main(start_date=None, end_date=None, output_date=None):
 
     print(f"🔎 Search query: {search_query}")
 
-    # Get messages for the specified timestamp range
+    # Stream messages for the specified timestamp range page by page
     print("📡 Filtering messages by timestamp range...")
-    recent_messages, error_message = get_messages_for_timestamp_range(cutoff_timestamp, end_date)
-
-    # If there was an error, save report with error info and exit
-    if error_message:
-        print("❌ Error occurred while fetching messages")
-        filename = save_daily_intro_report([], output_date=output_date, error_info=error_message)
-        print(f"📁 Error report saved to: {filename}")
-        return filename
-
-    if recent_messages:
-        print(f"✅ Found {len(recent_messages)} messages in date range")
-        for msg in recent_messages:
-            print(f"   📅 {msg['user']['real_name']} at {msg['ts_time']}")
-    else:
-        print("ℹ️  No messages found in specified date range")
 
     # Phase 1: Process messages and extract LinkedIn links from message content
     print("\n🔄 Phase 1: Processing messages for LinkedIn links in content...")
     intro_data_list = []
     intro_data_by_username = {}  # Use dict for O(1) lookups instead of nested loop
     users_needing_profile_search = []  # Track users who need profile search (order preserved)
-    
-    for i, message in enumerate(recent_messages, 1):
-        print(f"\n📨 Processing message {i}:")
-        intro_data = parse_intro_message(message)
-        if intro_data:
-            intro_data_list.append(intro_data)
-            username = intro_data['username']
-            intro_data_by_username[username] = intro_data
-            
-            print(f"✅ Processed: {intro_data['first_name']}")
-            if intro_data['linkedin_link']:
-                print(f"   🔗 LinkedIn found in message: {intro_data['linkedin_link']}")
-            else:
-                # This user needs profile search
-                user_id = message.get('user', {}).get('id', '')
-                if user_id:
-                    users_needing_profile_search.append((user_id, username))
-                    print(f"   ⏳ No LinkedIn in message - will search profile for {user_id}")
-        else:
-            print("❌ Not recognized as intro message")
-    
-    # Phase 2: Profile search for users without LinkedIn links (optimized with O(1) dict lookup)
-    if users_needing_profile_search:
-        print(f"\n🔄 Phase 2: Searching profiles for {len(users_needing_profile_search)} users without LinkedIn...")
-        for user_id, username in users_needing_profile_search:
-            print(f"\n🔍 Searching profile for user {user_id} ({username})...")
-            try:
-                profile_linkedin = safe_profile_search_for_daily_intros(user_id, username)
-                if profile_linkedin:
-                    # Update the intro data for this user using O(1) dict lookup
-                    if username in intro_data_by_username:
-                        intro_data_by_username[username]['linkedin_link'] = profile_linkedin
-                        print(f"✅ Found LinkedIn in profile: {profile_linkedin}")
+    message_count = 0
+    seen_skipped = 0
+    newest_message = None  # Becomes the channel watermark once the run succeeds
+    fetch_outcome = {}
+
+    # Profile searches start as soon as a page is parsed, so they overlap with
+    # fetching later pages; the global RateLimiter throttles the MCP calls
+    slack_config = _get_cached_config().slack
+    budget = _get_task_budget()
+    if budget is not None:
+        remaining = budget.remaining()
+        average = budget.average_run_tasks()
+        if remaining is not None:
+            print(f"💰 Zapier task budget: {remaining} tasks left this billing period"
+                  + (f" (recent runs averaged {average:.0f})" if average is not None else ""))
+    # The report index records what earlier runs reported; the report this run
+    # rewrites does not count, so a same-day rerun keeps its own intros
+    report_index = get_report_index()
+    rewritten_report = report_filename(output_date)
+    executor = ThreadPoolExecutor(
+        max_workers=slack_config.profile_search_workers,
+        thread_name_prefix="profile-search"
+    )
+    if slack_config.prefetch_user_directory:
+        # Index the workspace directory in bulk while the first pages stream in;
+        # profile searches wait for it instead of looking users up one by one
+        executor.submit(get_user_directory().prefetch, max_pages=slack_config.user_directory_max_pages)
+
+    try:
+        for page in iter_message_pages(cutoff_timestamp, end_date, outcome=fetch_outcome):
+            print(f"✅ Fetched {len(page)} messages in date range")
+            for message in page:
+                print(f"   📅 {message['user']['real_name']} at {message['ts_time']}")
+
+            if not page:
+                continue
+            page_newest = max(page, key=lambda message: message['ts_time'])
+            if newest_message is None or page_newest['ts_time'] > newest_message['ts_time']:
+                newest_message = page_newest
+            page_intros = parse_intro_messages(page)
+            print(f"\n📨 Processed messages {message_count + 1}-{message_count + len(page)}: "
+                  f"{len(page_intros)} intros, {len(page) - len(page_intros)} not recognized as intro messages")
+
+            # Intros an earlier run already reported need no lookups and no report entry
+            if not include_seen:
+                page_intros, already_seen = report_index.partition(page_intros, exclude_report=rewritten_report)
+                for intro_data in already_seen:
+                    print(f"⏭️  Already reported: {intro_data['first_name']} at {intro_data['timestamp']}")
+                seen_skipped += len(already_seen)
+
+            # Spend the remaining Zapier tasks on this page's lookups, newest
+            # intros first, keeping one task back (reserved) for the next page's search
+            lookups_wanted = sum(1 for intro in page_intros if not intro['linkedin_link'] and intro['user_id'])
+            plan = budget.plan_run(lookups_wanted, search_pages=1) if budget is not None else None
+            if plan is not None and lookups_wanted and plan.is_limited:
+                print(f"💰 Task budget is tight ({plan.remaining_tasks} left): "
+                      f"{plan.lookups_allowed}/{lookups_wanted} profile lookups, no fallback searches")
+            lookups_submitted = 0
+
+            for intro_data in page_intros:
+                intro_data_list.append(intro_data)
+                username = intro_data['username']
+                intro_data_by_username[username] = intro_data
+
+                print(f"✅ Processed: {intro_data['first_name']}")
+                if intro_data['linkedin_link']:
+                    print(f"   🔗 LinkedIn found in message: {intro_data['linkedin_link']}")
                 else:
-                    print(f"ℹ️  No LinkedIn found in profile for {username}")
-            except Exception as e:
-                print(f"⚠️  Error during profile search for {user_id}: {e}")
-                print(f"🏁 Profile search process completed with error for {user_id}")
-    else:
-        print("\n✅ All users already have LinkedIn links in their messages - skipping profile search")
+                    # This user needs profile search
+                    user_id = intro_data['user_id']
+                    if user_id and plan is not None and lookups_submitted >= plan.lookups_allowed:
+                        print(f"   💰 No LinkedIn in message - skipping profile search for {user_id} (task budget)")
+                    elif user_id:
+                        use_fallbacks = plan.use_fallbacks if plan is not None else True
+                        future = executor.submit(safe_profile_search_for_daily_intros, user_id, username,
+                                                 use_fallbacks=use_fallbacks)
+                        users_needing_profile_search.append((user_id, username, future))
+                        lookups_submitted += 1
+                        print(f"   ⏳ No LinkedIn in message - searching profile for {user_id}")
+            message_count += len(page)
+
+        if not message_count:
+            print("ℹ️  No messages found in specified date range")
+        if seen_skipped:
+            print(f"⏭️  Skipped {seen_skipped} intros reported by earlier runs (use --include-seen to report them again)")
+
+        # Phase 2: Collect concurrent profile searches for users without LinkedIn links (in original order)
+        if users_needing_profile_search:
+            print(f"\n🔄 Phase 2: Searching profiles for {len(users_needing_profile_search)} users without LinkedIn "
+                  f"({slack_config.profile_search_workers} workers, up to {slack_config.safe_wrapper_timeout}s)...")
+            # One budget for the whole phase, not a fresh timeout per search
+            phase_deadline = Deadline(slack_config.safe_wrapper_timeout, name="Phase 2 profile searches")
+            wait([future for _, _, future in users_needing_profile_search], timeout=phase_deadline.remaining())
+            searches_timed_out = searches_not_started = 0
+            for user_id, username, future in users_needing_profile_search:
+                if not future.done():
+                    if future.cancel():
+                        # Still queued behind busy workers when the budget ran out
+                        searches_not_started += 1
+                        print(f"⏭️  Profile search for {user_id} never started (all workers busy)")
+                    else:
+                        searches_timed_out += 1
+                        print(f"⏰ Profile search for {user_id} did not finish within the Phase 2 budget")
+                    continue
+                try:
+                    profile_linkedin = future.result()
+                    if profile_linkedin:
+                        # Update the intro data for this user using O(1) dict lookup
+                        if username in intro_data_by_username:
+                            intro_data_by_username[username]['linkedin_link'] = profile_linkedin
+                            print(f"✅ Found LinkedIn in profile: {profile_linkedin}")
+                    else:
+                        print(f"ℹ️  No LinkedIn found in profile for {username}")
+                except Exception as e:
+                    print(f"⚠️  Error during profile search for {user_id}: {e}")
+                    print(f"🏁 Profile search process completed with error for {user_id}")
+            if searches_timed_out or searches_not_started:
+                print(f"⏰ Phase 2 used its {slack_config.safe_wrapper_timeout}s budget "
+                      f"({phase_deadline.describe_usage()}): {searches_timed_out} searches timed out, "
+                      f"{searches_not_started} never started")
+        else:
+            print("\n✅ All users already have LinkedIn links in their messages - skipping profile search")
+    except MessageFetchError as e:
+        # If there was an error, save report with error info and exit
+        print("❌ Error occurred while fetching messages")
+        for _, _, future in users_needing_profile_search:
+            future.cancel()
+        _print_retry_summary()
+        filename = save_daily_intro_report([], output_date=output_date, error_info=str(e),
+                                           cutoff=cutoff_timestamp)
+        print(f"📁 Error report saved to: {filename}")
+        return filename
+    finally:
+        executor.shutdown(wait=False)
+        # Also releases the tasks reserved for lookups that cost nothing (cache
+        # hits) or never ran, even when the run fails
+        _finish_task_budget(budget)
+    _print_retry_summary()
     
     # Phase 3: Generate welcome messages
     print(f"\n🔄 Phase 3: Generating welcome messages...")
@@ -544,17 +803,53 @@ def main(start_date=None, end_date=None, output_date=None):
 
     # Generate the report
     if welcome_messages:
-        filename = save_daily_intro_report(welcome_messages, output_date=output_date)
+        filename = save_daily_intro_report(welcome_messages, output_date=output_date, cutoff=cutoff_timestamp)
         print(f"\n💾 Report saved to: {filename}")
         print(f"📊 Total introductions: {len(welcome_messages)}")
         print(f"🔗 LinkedIn profiles found: {sum(1 for intro_data, _ in welcome_messages if intro_data['linkedin_link'])}")
-        return filename
     else:
         print("\n📭 No introductions found in date range")
         # Create empty report
-        filename = save_daily_intro_report([], output_date=output_date)
+        filename = save_daily_intro_report([], output_date=output_date, cutoff=cutoff_timestamp)
         print(f"📁 Empty report saved to: {filename}")
-        return filename
+
+    if fetch_outcome.get('truncated'):
+        # The oldest messages after the cutoff were not fetched; moving the
+        # watermark past them would skip them on every later run
+        print("📌 Watermark not advanced: the search stopped at the page limit "
+              "(raise SLACK_MAX_SEARCH_PAGES or pass an end date to cover the rest)")
+    else:
+        _advance_watermark(newest_message)
+    return filename
+
+def _abandoned_workers() -> List[threading.Thread]:
+    """Non-daemon threads still running, e.g. profile searches abandoned past their budget"""
+    return [thread for thread in threading.enumerate()
+            if thread is not threading.main_thread() and not thread.daemon and thread.is_alive()]
+
+def _exit_abandoning_workers(exit_code: int):
+    """Exit at once, without joining the abandoned workers
+
+    Interpreter shutdown joins ThreadPoolExecutor workers, so a search stuck
+    in a hung MCP call would keep the CLI from exiting after the report was
+    written.
+    """
+    print(f"⏹️  Exiting without waiting for {len(_abandoned_workers())} abandoned worker thread(s)")
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(exit_code)
+
+def run_cli():
+    """Command line entry point: main(), then exit without waiting for abandoned searches"""
+    try:
+        main()
+    except Exception:
+        if _abandoned_workers():
+            traceback.print_exc()
+            _exit_abandoning_workers(1)
+        raise
+    if _abandoned_workers():
+        _exit_abandoning_workers(0)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_cli()
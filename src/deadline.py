@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Deadlines for Bounded Operations
+
+Provides a thread-safe deadline/cancellation primitive that replaces
+signal-based timeouts. Deadlines compose across nested calls (a child can
+never outlive its parent), work from worker threads and asyncio tasks, and
+report how much of each budget was consumed.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional
+
+# Innermost active deadline for the current thread / asyncio task
+_current_deadline: contextvars.ContextVar = contextvars.ContextVar('current_deadline', default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when an operation runs past its deadline or is cancelled"""
+
+    def __init__(self, deadline: 'Deadline'):
+        self.deadline = deadline
+        reason = "cancelled" if deadline.cancelled() else "timed out"
+        super().__init__(
+            f"{deadline.name} {reason} after {deadline.elapsed():.1f}s "
+            f"(budget: {deadline.budget:g}s)"
+        )
+
+
+class Deadline:
+    """
+    A time budget for an operation.
+
+    Features:
+    - Monotonic clock, no signals (safe in any thread)
+    - Nested budgets: a child expires no later than its parent
+    - Cooperative cancellation that propagates to children
+    - Budget usage reporting
+
+    Blocking calls cannot be interrupted, so long operations should call
+    check() between steps.
+    """
+
+    def __init__(
+        self,
+        seconds: float,
+        name: str = "operation",
+        parent: Optional['Deadline'] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize deadline.
+
+        Args:
+            seconds: Budget for this operation
+            name: Label used in messages and usage reports
+            parent: Enclosing deadline; this deadline never extends past it
+            clock: Monotonic time source (injectable for testing)
+        """
+        self.budget = seconds
+        self.name = name
+        self.parent = parent
+        self._clock = clock
+        self._started = clock()
+        self._cancelled = threading.Event()
+
+        own_expiry = self._started + seconds
+        if parent is not None and parent.expires_at < own_expiry:
+            self.expires_at = parent.expires_at
+            self.bounded_by_parent = True
+        else:
+            self.expires_at = own_expiry
+            self.bounded_by_parent = False
+
+    @classmethod
+    def current(cls) -> Optional['Deadline']:
+        """Get the innermost deadline entered in this thread or task"""
+        return _current_deadline.get()
+
+    @classmethod
+    def within(cls, seconds: float, name: str = "operation", parent: Optional['Deadline'] = None) -> 'Deadline':
+        """Create a deadline nested in ``parent`` or, if omitted, the current deadline"""
+        return cls(seconds, name=name, parent=parent if parent is not None else cls.current())
+
+    def child(self, seconds: float, name: str = "operation") -> 'Deadline':
+        """Create a nested deadline bounded by this one"""
+        return Deadline(seconds, name=name, parent=self, clock=self._clock)
+
+    def elapsed(self) -> float:
+        """Seconds since this deadline was created"""
+        return self._clock() - self._started
+
+    def remaining(self) -> float:
+        """Seconds left before expiry (0 if expired or cancelled)"""
+        if self.cancelled():
+            return 0.0
+        return max(0.0, self.expires_at - self._clock())
+
+    def cancel(self):
+        """Cancel this deadline and every deadline nested in it"""
+        self._cancelled.set()
+
+    def cancelled(self) -> bool:
+        """Check whether this deadline or any parent was cancelled"""
+        deadline = self
+        while deadline is not None:
+            if deadline._cancelled.is_set():
+                return True
+            deadline = deadline.parent
+        return False
+
+    def expired(self) -> bool:
+        """Check whether the budget is used up or cancelled"""
+        return self.remaining() <= 0
+
+    def check(self):
+        """
+        Raise DeadlineExceeded if the budget is used up.
+
+        Call between steps of a long operation.
+        """
+        if self.expired():
+            raise DeadlineExceeded(self)
+
+    def usage(self) -> Dict[str, Any]:
+        """Get a report of how much of the budget was consumed"""
+        elapsed = self.elapsed()
+        return {
+            'name': self.name,
+            'budget_seconds': self.budget,
+            'elapsed_seconds': round(elapsed, 3),
+            'remaining_seconds': round(self.remaining(), 3),
+            'consumed_percent': round(100.0 * elapsed / self.budget, 1) if self.budget > 0 else 100.0,
+            'expired': self.expired(),
+            'cancelled': self.cancelled(),
+            'bounded_by_parent': self.bounded_by_parent
+        }
+
+    def describe_usage(self) -> str:
+        """Short human-readable usage summary"""
+        usage = self.usage()
+        return (
+            f"{usage['elapsed_seconds']:.1f}s of {usage['budget_seconds']:g}s "
+            f"({usage['consumed_percent']:.0f}%)"
+        )
+
+    async def wait_for(self, awaitable: Awaitable) -> Any:
+        """
+        Await ``awaitable`` within the remaining budget.
+
+        Raises:
+            DeadlineExceeded: If the budget runs out first
+        """
+        if self.expired():
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise DeadlineExceeded(self)
+        try:
+            return await asyncio.wait_for(awaitable, timeout=self.remaining())
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(self) from None
+
+    @contextlib.contextmanager
+    def scope(self) -> Iterator['Deadline']:
+        """
+        Make this the current deadline for the enclosed block.
+
+        Nested Deadline.within() calls in the same thread or asyncio task pick
+        it up as their parent. Worker threads do not inherit it; pass the
+        deadline explicitly (or run the worker in contextvars.copy_context()).
+        """
+        token = _current_deadline.set(self)
+        try:
+            yield self
+        finally:
+            _current_deadline.reset(token)
+
+    def __repr__(self) -> str:
+        return f"Deadline(name={self.name!r}, budget={self.budget}, remaining={self.remaining():.3f})"
@@ -4,22 +4,36 @@ Dual Mode Package
 Provides dual-mode support for running intro extraction in both:
 - Cursor IDE (request generation mode)
 - Claude Code (direct execution mode with MCP tools)
+
+Submodules are imported on first attribute access, so importing one
+submodule (e.g. dual_mode.mcp_adapter) does not pull in the others.
 """
 
-from .intro_extraction_api import (
-    detect_execution_environment,
-    generate_mcp_request,
-    extract_intros_mcp_mode,
-    extract_intros_auto
-)
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'detect_execution_environment': 'intro_extraction_api',
+    'generate_mcp_request': 'intro_extraction_api',
+    'extract_intros_mcp_mode': 'intro_extraction_api',
+    'extract_intros_auto': 'intro_extraction_api',
+    'get_mcp_adapter': 'mcp_adapter',
+    'get_async_mcp_adapter': 'mcp_adapter',
+    'AsyncMCPAdapter': 'mcp_adapter'
+}
+
+__all__ = list(_EXPORTS)
+
 
-from .mcp_adapter import get_mcp_adapter
+def __getattr__(name: str):
+    """Import the defining submodule the first time a public name is used"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
 
-__all__ = [
-    'detect_execution_environment',
-    'generate_mcp_request',
-    'extract_intros_mcp_mode',
-    'extract_intros_auto',
-    'get_mcp_adapter'
-]
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
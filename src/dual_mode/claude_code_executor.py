@@ -14,6 +14,14 @@ import json
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
+try:
+    from ..intro_classifier import get_intro_classifier
+    from ..linkedin_extractor import extract_linkedin_link
+except ImportError:
+    # Direct execution fallback (src/ on sys.path)
+    from intro_classifier import get_intro_classifier
+    from linkedin_extractor import extract_linkedin_link
+
 
 def search_slack_messages_mcp(query: str, sort_by: str = "timestamp", sort_dir: str = "desc") -> Optional[Dict]:
     """
@@ -208,48 +216,25 @@ def process_mcp_search_results(mcp_results: Dict) -> List[Dict]:
     Returns:
         List of processed intro data
     """
-    import re
-    
     print("\n🔄 Processing MCP search results...")
     
     # Extract messages from MCP results
     messages = mcp_results.get('results', [])
     print(f"📨 Found {len(messages)} messages")
     
-    # Intro detection keywords
-    intro_keywords = [
-        'hi everyone', 'hello everyone', 'hey everyone', 'hey all', 'hi all',
-        'i\'m ', 'my name is', 'introduction', 'nice to meet',
-        'pleased to meet', 'excited to be here', 'happy to be here',
-        'i am', 'based', 'working', 'fun fact'
-    ]
-    
-    # LinkedIn URL patterns
-    linkedin_patterns = [
-        re.compile(r'https?://(?:www\.)?linkedin\.com/in/[\w\-\.]+/?', re.IGNORECASE),
-        re.compile(r'linkedin\.com/in/[\w\-\.]+/?', re.IGNORECASE),
-    ]
+    classifier = get_intro_classifier()
     
     intro_messages = []
     
     for msg in messages:
-        text = msg.get('raw_text', msg.get('text', '')).lower()
+        original_text = msg.get('raw_text', msg.get('text', ''))
         
-        # Check if it's an intro message
-        is_intro = any(keyword in text for keyword in intro_keywords)
+        # Check if it's an intro message (keywords kept for debugging)
+        matched_keywords = classifier.matched_keywords(original_text)
         
-        if is_intro:
+        if matched_keywords:
             # Extract LinkedIn URL
-            linkedin_url = None
-            original_text = msg.get('raw_text', msg.get('text', ''))
-            
-            for pattern in linkedin_patterns:
-                match = pattern.search(original_text)
-                if match:
-                    linkedin_url = match.group(0)
-                    if not linkedin_url.startswith('http'):
-                        linkedin_url = 'https://' + linkedin_url
-                    break
+            linkedin_url = extract_linkedin_link(original_text)
             
             user = msg.get('user', {})
             intro_data = {
@@ -260,7 +245,8 @@ def process_mcp_search_results(mcp_results: Dict) -> List[Dict]:
                 'message': original_text,
                 'timestamp': msg.get('ts_time', ''),
                 'permalink': msg.get('permalink', ''),
-                'needs_profile_search': not linkedin_url
+                'needs_profile_search': not linkedin_url,
+                'matched_keywords': matched_keywords
             }
             
             intro_messages.append(intro_data)
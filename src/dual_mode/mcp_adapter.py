@@ -8,18 +8,123 @@ the correct function calls based on the execution environment.
 Supports:
 - Claude Code Environment (mcp_Zapier_* functions)
 - Cursor Code Editor (mcp__zapier__* functions)
+- Async callers via AsyncMCPAdapter (bounded concurrent calls)
 """
 
+import asyncio
+import contextvars
+import functools
 import inspect
-from typing import Dict, Any, Optional, Callable
+import os
+import re
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Callable, Tuple
+
+try:
+    from ..deadline import Deadline, DeadlineExceeded
+    from ..rate_limiter import RateLimiter, get_rate_limiter
+    from ..retry_policy import CallFailure, get_retry_policy
+    from ..task_budget import get_task_budget
+except ImportError:
+    # Direct execution fallback (src/ on sys.path)
+    from deadline import Deadline, DeadlineExceeded
+    from rate_limiter import RateLimiter, get_rate_limiter
+    from retry_policy import CallFailure, get_retry_policy
+    from task_budget import get_task_budget
+
+_RATE_LIMIT_TEXT = re.compile(r'ratelimited|rate[ _-]?limit|too many requests|\b429\b', re.IGNORECASE)
+_RETRY_AFTER_TEXT = re.compile(r'retry[ _-]?after\W{0,3}(\d+(?:\.\d+)?)', re.IGNORECASE)
+_TRANSIENT_ERROR_TEXT = re.compile(
+    r'time[ds]? ?out|temporar|unavailable|connection|network|reset by peer|try again|'
+    r'internal server error|bad gateway|\b50[234]\b',
+    re.IGNORECASE
+)
+
+
+def _retry_after_header(headers: Any) -> Optional[float]:
+    """Read a numeric Retry-After value from a header mapping"""
+    if not hasattr(headers, 'items'):
+        return None
+    for name, value in headers.items():
+        if str(name).lower() == 'retry-after':
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+def classify_rate_limit(outcome: Any) -> Tuple[bool, Optional[float]]:
+    """
+    Decide whether an MCP call outcome is a rate-limit rejection.
+    
+    Recognizes HTTP 429 status codes, Slack's ``ratelimited`` error and
+    rate-limit wording in Zapier error payloads or exception messages.
+    
+    Args:
+        outcome: Result returned by an MCP function, or the exception it raised
+    
+    Returns:
+        Tuple of (rate limited, Retry-After seconds if the server sent one)
+    """
+    if isinstance(outcome, BaseException):
+        response = getattr(outcome, 'response', None)
+        status = getattr(outcome, 'status_code', None) or getattr(response, 'status_code', None)
+        headers = getattr(outcome, 'headers', None) or getattr(response, 'headers', None)
+        retry_after = None
+        text = str(outcome)
+    elif isinstance(outcome, dict):
+        status = outcome.get('status_code') or outcome.get('status')
+        headers = outcome.get('headers') or outcome.get('response_headers')
+        retry_after = outcome.get('retry_after')
+        # Only error payloads are inspected: message text may mention rate limits
+        is_error = outcome.get('isError') or outcome.get('ok') is False
+        text = str(outcome) if is_error else ''
+    else:
+        return False, None
+    
+    if str(status) != '429' and not _RATE_LIMIT_TEXT.search(text):
+        return False, None
+    
+    if retry_after is None:
+        retry_after = _retry_after_header(headers)
+    if retry_after is None:
+        match = _RETRY_AFTER_TEXT.search(text)
+        retry_after = match.group(1) if match else None
+    try:
+        return True, float(retry_after) if retry_after is not None else None
+    except (TypeError, ValueError):
+        return True, None
 
 class MCPAdapter:
-    """Adapter class to handle different MCP server function naming conventions"""
+    """
+    Adapter class to handle different MCP server function naming conventions.
     
-    def __init__(self):
+    Server detection runs once and the resolved MCP callables are bound
+    directly onto the slack_* methods, so the per-call path does no
+    detection or name lookup. Call invalidate() to force re-detection, or
+    set a detection TTL to re-detect periodically.
+    """
+    
+    def __init__(self, detection_ttl: Optional[float] = None):
+        """
+        Initialize MCP adapter.
+        
+        Args:
+            detection_ttl: Seconds after which server detection is re-run
+                (default: MCP_DETECTION_TTL environment variable, or never)
+        """
+        if detection_ttl is None and os.getenv('MCP_DETECTION_TTL'):
+            detection_ttl = float(os.getenv('MCP_DETECTION_TTL'))
+        self.detection_ttl = detection_ttl
         self.function_map = {}
-        self.server_type = self._detect_mcp_server()
-        self._setup_function_mapping()
+        self.server_type = None
+        self._detected_at: Optional[float] = None
+        self._detection_lock = threading.Lock()
+        self._resolve_functions()
     
     def _detect_mcp_server(self) -> str:
         """Detect which MCP server is available"""
@@ -86,19 +191,45 @@ class MCPAdapter:
         print(f"🔧 MCP Server detected: {self.server_type.upper()}")
         print(f"📋 Function mapping: {self.function_map}")
     
+    def _resolve_functions(self):
+        """Detect the MCP server and bind the resolved callables"""
+        with self._detection_lock:
+            old_server_type = self.server_type
+            self.server_type = self._detect_mcp_server()
+            
+            if old_server_type != self.server_type:
+                if old_server_type is not None:
+                    print(f"🔄 MCP Server type changed from {old_server_type} to {self.server_type}")
+                self._setup_function_mapping()
+            
+            namespace = globals()
+            for function_key, function_name in self.function_map.items():
+                self._bind(function_key, function_name, namespace.get(function_name))
+            self._detected_at = time.monotonic()
+    
+    def _bind(self, function_key: str, function_name: str, func: Optional[Callable]):
+        """Bind a resolved MCP function directly onto the public method name"""
+        setattr(self, function_key, functools.partial(self._invoke, function_key, function_name, func))
+    
+    def _detection_stale(self) -> bool:
+        """Check whether detection was invalidated or its TTL has passed"""
+        if self._detected_at is None:
+            return True
+        return self.detection_ttl is not None and time.monotonic() - self._detected_at > self.detection_ttl
+    
+    def invalidate(self):
+        """Discard cached detection; the next call re-detects the MCP server"""
+        self._detected_at = None
+    
     def _refresh_detection(self):
         """Refresh server detection and function mapping"""
-        old_server_type = self.server_type
-        self.server_type = self._detect_mcp_server()
-        
-        if old_server_type != self.server_type:
-            print(f"🔄 MCP Server type changed from {old_server_type} to {self.server_type}")
-            self._setup_function_mapping()
+        self.invalidate()
+        self._resolve_functions()
     
     def get_function(self, function_key: str) -> Optional[Callable]:
         """Get the actual function based on the detected server type"""
-        # Refresh detection before getting function
-        self._refresh_detection()
+        if self._detection_stale():
+            self._resolve_functions()
         
         function_name = self.function_map.get(function_key)
         if not function_name:
@@ -113,30 +244,140 @@ class MCPAdapter:
     
     def call_function(self, function_key: str, **kwargs) -> Optional[Any]:
         """Call the appropriate MCP function based on the detected server type"""
-        func = self.get_function(function_key)
-        if not func:
+        if function_key not in self.function_map:
+            print(f"⚠️  Function key '{function_key}' not found in mapping")
             print(f"❌ Cannot call function '{function_key}' - function not available")
             return None
+        return getattr(self, function_key)(**kwargs)
+    
+    def call_function_unthrottled(self, function_key: str, **kwargs) -> Optional[Any]:
+        """
+        Call an MCP function without waiting on the rate limiter.
+        
+        For callers that already reserved a slot themselves, such as
+        AsyncMCPAdapter awaiting RateLimiter.acquire() on the event loop.
+        """
+        if function_key not in self.function_map:
+            print(f"⚠️  Function key '{function_key}' not found in mapping")
+            print(f"❌ Cannot call function '{function_key}' - function not available")
+            return None
+        return self._call(*getattr(self, function_key).args, kwargs, throttle=False)
+    
+    def _invoke(self, function_key: str, function_name: str, func: Optional[Callable], **kwargs) -> Optional[Any]:
+        """Call a bound MCP function (the per-call hot path)"""
+        return self._call(function_key, function_name, func, kwargs, throttle=True)
+    
+    def _call(self, function_key: str, function_name: str, func: Optional[Callable],
+              kwargs: Dict[str, Any], throttle: bool) -> Optional[Any]:
+        """Resolve, rate limit and execute an MCP function call"""
+        if self._detection_stale():
+            self._resolve_functions()
+            function_name = self.function_map[function_key]
+            func = globals().get(function_name)
+
+        if func is None:
+            # Slow path: the function may have been registered after detection
+            func = globals().get(function_name)
+            if func is None:
+                print(f"⚠️  Function '{function_name}' not available in global namespace")
+                print(f"❌ Cannot call function '{function_key}' - function not available")
+                return None
+            self._bind(function_key, function_name, func)
         
+        limiter = get_rate_limiter(function_key)
+        policy = get_retry_policy(function_key)
+        # Nested in the caller's scoped deadline, so retries never outlast its search
+        deadline = Deadline.within(policy.total_deadline, name=f"{function_name} retries")
+        attempt = 0
+        while True:
+            attempt += 1
+            # Respect this method's Slack API budget (shared by all worker threads);
+            # retries always wait, even when the caller reserved the first slot
+            if throttle or attempt > 1:
+                limiter.wait_if_needed()
+            
+            result, failure = self._attempt(function_key, function_name, func, kwargs, limiter)
+            if failure is None:
+                policy.record(attempt, succeeded=True)
+                if attempt > 1:
+                    print(f"✅ {function_name} succeeded on attempt {attempt}")
+                return result
+            
+            delay = policy.next_delay(attempt, failure, deadline.remaining())
+            if delay is None:
+                policy.record(attempt, succeeded=False, fatal=not failure.retryable)
+                if failure.retryable and attempt > 1:
+                    print(f"❌ Giving up on {function_name} after {attempt} attempts ({failure.reason})")
+                return None
+            
+            print(f"🔁 Retrying {function_name} in {delay:.1f}s "
+                  f"(attempt {attempt + 1}/{policy.max_attempts}, {failure.reason})")
+            policy.sleep(delay)
+    
+    def _attempt(self, function_key: str, function_name: str, func: Callable,
+                 kwargs: Dict[str, Any], limiter: RateLimiter) -> Tuple[Optional[Any], Optional[CallFailure]]:
+        """
+        Make one MCP call and classify its outcome.
+        
+        Returns:
+            Tuple of (result, None) on success, or (None, CallFailure) on failure
+        """
         try:
-            print(f"📞 Calling {self.function_map[function_key]} with {len(kwargs)} parameters")
+            print(f"📞 Calling {function_name} with {len(kwargs)} parameters")
             result = func(**kwargs)
             
+            # Feed Slack's pushback into the limiter so the budget adapts
+            rate_limited, retry_after = classify_rate_limit(result)
+            if rate_limited:
+                self._report_rate_limited(limiter, function_name, retry_after)
+                return None, CallFailure(True, "rate limited", retry_after)
+            
             # Check for Zapier account limitations
             if isinstance(result, dict) and result.get('isError'):
                 error_msg = result.get('error', ['Unknown error'])
                 if 'insufficient tasks' in str(error_msg).lower():
+                    self._update_task_budget(function_key, exhausted=True)
                     print("❌ Zapier account has insufficient tasks/quota")
                     print("💡 Solution: Upgrade Zapier plan or wait for quota reset")
                     print(f"📊 Error details: {error_msg}")
-                else:
-                    print(f"⚠️  Zapier API error: {error_msg}")
-                return None
+                    return None, CallFailure(False, "insufficient Zapier tasks")
+                print(f"⚠️  Zapier API error: {error_msg}")
+                return None, CallFailure(bool(_TRANSIENT_ERROR_TEXT.search(str(error_msg))), "Zapier API error")
             
-            return result
+            limiter.record_success()
+            self._update_task_budget(function_key)
+            return result, None
+        except DeadlineExceeded as e:
+            print(f"⚠️  Error calling {function_name}: {e}")
+            return None, CallFailure(False, "deadline exceeded")
         except Exception as e:
-            print(f"⚠️  Error calling {self.function_map[function_key]}: {e}")
-            return None
+            rate_limited, retry_after = classify_rate_limit(e)
+            if rate_limited:
+                self._report_rate_limited(limiter, function_name, retry_after)
+                return None, CallFailure(True, "rate limited", retry_after)
+            print(f"⚠️  Error calling {function_name}: {e}")
+            retryable = isinstance(e, (ConnectionError, TimeoutError)) or bool(_TRANSIENT_ERROR_TEXT.search(str(e)))
+            return None, CallFailure(retryable, type(e).__name__)
+    
+    def _update_task_budget(self, function_key: str, exhausted: bool = False):
+        """Count a completed call against the Zapier task budget (best effort)"""
+        try:
+            budget = get_task_budget()
+            if budget is None:
+                return
+            if exhausted:
+                budget.mark_exhausted()
+            else:
+                budget.record_call(function_key)
+        except Exception as e:
+            print(f"⚠️  Task budget update failed: {e}")
+    
+    def _report_rate_limited(self, limiter: RateLimiter, function_name: str,
+                             retry_after: Optional[float]):
+        """Tell the limiter a call was rejected as rate limited"""
+        limiter.record_rate_limited(retry_after)
+        hint = f", retry after {retry_after:g}s" if retry_after is not None else ""
+        print(f"⏳ {function_name} was rate limited by Slack{hint}")
     
     def slack_find_message(self, **kwargs) -> Optional[Dict]:
         """Find Slack messages using the appropriate MCP server"""
@@ -154,9 +395,113 @@ class MCPAdapter:
         """Make Slack API request using the appropriate MCP server"""
         return self.call_function('slack_api_request_beta', **kwargs)
 
-# Global instance
-mcp_adapter = MCPAdapter()
+class AsyncMCPAdapter:
+    """
+    Awaitable front-end for MCPAdapter.
+    
+    MCP functions are blocking, so each call runs on a dedicated thread pool
+    while a semaphore bounds how many calls are in flight at once. This lets
+    an asyncio pipeline overlap message search, user lookups and username
+    fallbacks instead of waiting on each round-trip.
+    """
+    
+    def __init__(
+        self,
+        adapter: Optional[MCPAdapter] = None,
+        max_concurrency: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
+        """
+        Initialize async adapter.
+        
+        Args:
+            adapter: Synchronous adapter to delegate to (default: global adapter)
+            max_concurrency: Maximum concurrent MCP calls
+                (default: MCP_MAX_CONCURRENCY environment variable or 4)
+            rate_limiter: Limiter awaited before every call (default: the global
+                per-method limiters, shared with threaded callers)
+        """
+        self.adapter = adapter or get_mcp_adapter()
+        self.rate_limiter = rate_limiter
+        self.max_concurrency = max_concurrency or int(os.getenv('MCP_MAX_CONCURRENCY', 4))
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="mcp-async")
+        # One per event loop, dropped once the loop is closed or collected
+        self._semaphores: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]' = \
+            weakref.WeakKeyDictionary()
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency semaphore for the running event loop"""
+        # asyncio primitives are bound to one loop, so keep one per loop
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            # A semaphore that ever made a caller wait references its loop, which
+            # keeps the weak key alive; closed loops (e.g. from asyncio.run) go here
+            for closed in [other for other in self._semaphores.keys() if other.is_closed()]:
+                del self._semaphores[closed]
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+    
+    async def call_function(self, function_key: str, **kwargs) -> Optional[Any]:
+        """Await an MCP function call, waiting for a concurrency slot and rate budget first"""
+        async with self._get_semaphore():
+            # Wait for the budget on the event loop rather than sleeping in a worker
+            await (self.rate_limiter or get_rate_limiter(function_key)).acquire()
+            call = getattr(self.adapter, 'call_function_unthrottled', None) or self.adapter.call_function
+            loop = asyncio.get_running_loop()
+            # Run in the caller's context so its scoped deadline bounds the call's retries
+            context = contextvars.copy_context()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(context.run, call, function_key, **kwargs)
+            )
+    
+    async def slack_find_message(self, **kwargs) -> Optional[Dict]:
+        """Find Slack messages using the appropriate MCP server"""
+        return await self.call_function('slack_find_message', **kwargs)
+    
+    async def slack_find_user_by_id(self, **kwargs) -> Optional[Dict]:
+        """Find Slack user by ID using the appropriate MCP server"""
+        return await self.call_function('slack_find_user_by_id', **kwargs)
+    
+    async def slack_find_user_by_username(self, **kwargs) -> Optional[Dict]:
+        """Find Slack user by username using the appropriate MCP server"""
+        return await self.call_function('slack_find_user_by_username', **kwargs)
+    
+    async def slack_api_request_beta(self, **kwargs) -> Optional[Dict]:
+        """Make Slack API request using the appropriate MCP server"""
+        return await self.call_function('slack_api_request_beta', **kwargs)
+    
+    def close(self):
+        """Shut down the worker threads"""
+        self._executor.shutdown(wait=False)
+
+# Global instances (built on first use: MCPAdapter() probes and reports the MCP server)
+_mcp_adapter: Optional[MCPAdapter] = None
+_mcp_adapter_lock = threading.Lock()
+_async_mcp_adapter: Optional[AsyncMCPAdapter] = None
+_async_mcp_adapter_lock = threading.Lock()
 
 def get_mcp_adapter() -> MCPAdapter:
     """Get the global MCP adapter instance"""
-    return mcp_adapter
+    global _mcp_adapter
+    if _mcp_adapter is None:
+        with _mcp_adapter_lock:
+            if _mcp_adapter is None:
+                _mcp_adapter = MCPAdapter()
+    return _mcp_adapter
+
+def get_async_mcp_adapter() -> AsyncMCPAdapter:
+    """Get the global async MCP adapter instance (shares the global MCP adapter)"""
+    global _async_mcp_adapter
+    with _async_mcp_adapter_lock:
+        if _async_mcp_adapter is None:
+            _async_mcp_adapter = AsyncMCPAdapter()
+    return _async_mcp_adapter
+
+def __getattr__(name: str):
+    """Keep `from dual_mode.mcp_adapter import mcp_adapter` working without building it at import time"""
+    if name == 'mcp_adapter':
+        return get_mcp_adapter()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Intro Message Classifier
+
+Decides whether a Slack message is an introduction by matching a set of
+keywords. The keywords are merged into a trie and compiled into a single
+regular expression (an Aho–Corasick-style automaton run by the C regex
+engine), so each message is lowercased once and scanned once no matter how
+many keywords are configured. Shared by the daily pipeline and the Claude
+Code executor.
+"""
+
+import re
+import threading
+from typing import Dict, Iterable, List, Optional
+
+# Phrases that mark a message as an introduction (matched as lowercase substrings)
+INTRO_KEYWORDS = (
+    'hi everyone', 'hello everyone', 'hey everyone', 'hey all', 'hi all',
+    'i\'m ', 'my name is', 'introduction', 'nice to meet',
+    'pleased to meet', 'excited to be here', 'happy to be here',
+    'i am', 'i have been', 'based', 'working', 'fun fact'
+)
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Build a regex whose alternatives share common keyword prefixes"""
+    trie: Dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def emit(node: Dict) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # A keyword ends here; longer keywords sharing this prefix are optional
+        return f'(?:{body})?' if '' in node else body
+
+    return emit(trie)
+
+
+class IntroClassifier:
+    """
+    Single-scan multi-keyword intro detector.
+
+    Features:
+    - One pass over the lowercased text regardless of keyword count
+    - Early exit for yes/no classification
+    - Reports which keywords matched, for scoring and debugging
+    """
+
+    def __init__(self, keywords: Iterable[str] = INTRO_KEYWORDS):
+        """
+        Initialize classifier.
+
+        Args:
+            keywords: Intro phrases; matching is case-insensitive
+        """
+        self.keywords = tuple(dict.fromkeys(keyword.lower() for keyword in keywords if keyword))
+        if not self.keywords:
+            raise ValueError("At least one intro keyword is required")
+        self._pattern = re.compile(_trie_pattern(self.keywords))
+
+    def is_intro(self, text: Optional[str]) -> bool:
+        """Check whether text contains any intro keyword"""
+        if not text:
+            return False
+        return self._pattern.search(text.lower()) is not None
+
+    def matched_keywords(self, text: Optional[str]) -> List[str]:
+        """
+        Return the distinct keywords found in text, in order of first occurrence.
+
+        Where keywords overlap in the text, the leftmost (and then longest)
+        occurrence is reported.
+        """
+        if not text:
+            return []
+        return list(dict.fromkeys(match.group(0) for match in self._pattern.finditer(text.lower())))
+
+
+# Global classifier instance
+_intro_classifier: Optional[IntroClassifier] = None
+_intro_classifier_lock = threading.Lock()
+
+
+def get_intro_classifier() -> IntroClassifier:
+    """Get the global intro classifier built from INTRO_KEYWORDS"""
+    global _intro_classifier
+    if _intro_classifier is None:
+        with _intro_classifier_lock:
+            if _intro_classifier is None:
+                _intro_classifier = IntroClassifier()
+    return _intro_classifier
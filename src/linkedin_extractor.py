@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+LinkedIn URL Extraction Engine
+
+Single extractor shared by message parsing, Slack profile search and the
+Claude Code executor. The URL patterns from LinkedInConfig are compiled once
+into one alternation, so each text is scanned a single time, and results are
+memoized per input text because the same profile fields and messages are
+seen repeatedly within a run.
+"""
+
+import re
+import threading
+from functools import lru_cache
+from typing import Callable, List, Optional
+
+# Longest text a pattern may match before "linkedin.com/" ("<https://www.")
+_MAX_PREFIX = 13
+
+
+class LinkedInExtractor:
+    """
+    Combined LinkedIn URL matcher compiled from an ordered pattern list.
+
+    Features:
+    - One regex scan per text (leftmost URL wins, earlier patterns break ties)
+    - Substring pre-check so texts without "linkedin.com/" skip the regex
+    - Consistent normalization: brackets and trailing junk removed,
+      https:// added when missing, lowercased
+    """
+
+    def __init__(self, url_patterns: List[str], cache_size: int = 4096):
+        """
+        Initialize extractor.
+
+        Args:
+            url_patterns: Regex patterns for LinkedIn URLs, in priority order
+            cache_size: Number of distinct texts to memoize (0 disables)
+        """
+        self.url_patterns = list(url_patterns)
+        self._pattern = re.compile(
+            '|'.join(f'(?:{pattern})' for pattern in self.url_patterns), re.IGNORECASE
+        )
+        self.extract: Callable[[Optional[str]], Optional[str]] = (
+            lru_cache(maxsize=cache_size)(self._extract) if cache_size else self._extract
+        )
+
+    def _extract(self, text: Optional[str]) -> Optional[str]:
+        """Find and normalize the first LinkedIn URL in text"""
+        if not text:
+            return None
+
+        lowered = text.lower()
+        hint = lowered.find('linkedin.com/')
+        if hint == -1:
+            return None
+        # Some characters change length when lowercased; then the offset is unreliable
+        start = max(0, hint - _MAX_PREFIX) if len(lowered) == len(text) else 0
+        match = self._pattern.search(text, start)
+        if not match:
+            return None
+
+        url = match.group(0)
+        if (url[0] == '<' and url[-1] == '>') or (url[0] == '(' and url[-1] == ')'):
+            url = url[1:-1]
+
+        # Trim trailing punctuation, a "LinkedIn>" label and a run-on "This",
+        # then collapse repeated trailing slashes
+        url = url.rstrip('.,;!?')
+        if url[-9:].lower() == 'linkedin>':
+            url = url[:-9]
+        if url.endswith('This'):
+            url = url[:-4]
+        if url.endswith('//'):
+            url = url.rstrip('/') + '/'
+
+        url = url.lower()
+        if not url.startswith('http'):
+            url = 'https://' + url
+        return url
+
+    def cache_info(self):
+        """Return memoization statistics (None when caching is disabled)"""
+        return self.extract.cache_info() if hasattr(self.extract, 'cache_info') else None
+
+    def cache_clear(self):
+        """Drop memoized results"""
+        if hasattr(self.extract, 'cache_clear'):
+            self.extract.cache_clear()
+
+
+# Global extractor instance
+_extractor: Optional[LinkedInExtractor] = None
+_extractor_lock = threading.Lock()
+
+
+def get_linkedin_extractor() -> LinkedInExtractor:
+    """Get the global LinkedIn extractor, compiled from LinkedInConfig on first use"""
+    global _extractor
+    if _extractor is None:
+        with _extractor_lock:
+            if _extractor is None:
+                try:
+                    from .config import get_config
+                except ImportError:
+                    from config import get_config
+                linkedin_config = get_config().linkedin
+                _extractor = LinkedInExtractor(linkedin_config.url_patterns, linkedin_config.cache_size)
+    return _extractor
+
+
+def extract_linkedin_link(text: Optional[str]) -> Optional[str]:
+    """Extract a normalized LinkedIn URL from text using the shared engine"""
+    return get_linkedin_extractor().extract(text)
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Persistent User Profile Cache
+
+Stores the outcome of Slack profile LinkedIn lookups in a small SQLite file
+in the output directory, so users looked up on a previous run do not cost
+another round of MCP calls. Both found LinkedIn URLs and "no LinkedIn"
+results are cached, each with its own TTL.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import logging
+from typing import Callable, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CachedProfile(NamedTuple):
+    """A cached lookup result; linkedin_url is None for a negative entry"""
+    linkedin_url: Optional[str]
+    checked_at: float
+
+
+class ProfileCache:
+    """
+    SQLite-backed LinkedIn lookup cache keyed by user ID and username.
+
+    Features:
+    - Separate TTLs for found URLs and negative results
+    - Lookups by user ID first, then username
+    - Safe to share between worker threads
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float = 7 * 24 * 3600,
+        negative_ttl_seconds: float = 24 * 3600,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize profile cache.
+
+        Args:
+            path: SQLite database file (created if missing)
+            ttl_seconds: How long a found LinkedIn URL stays valid
+            negative_ttl_seconds: How long a "no LinkedIn" result stays valid
+            clock: Wall-clock time source (injectable for testing)
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        is_new = not os.path.exists(path)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS profiles ("
+            " key TEXT PRIMARY KEY,"
+            " linkedin_url TEXT,"
+            " checked_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+        if is_new:
+            # Set restrictive permissions (owner read/write only)
+            os.chmod(path, 0o600)
+
+    @staticmethod
+    def _keys(user_id: Optional[str], username: Optional[str]):
+        keys = []
+        if user_id:
+            keys.append(f"id:{user_id}")
+        if username:
+            keys.append(f"username:{username.lower()}")
+        return keys
+
+    def _is_fresh(self, linkedin_url: Optional[str], checked_at: float, now: float) -> bool:
+        ttl = self.ttl_seconds if linkedin_url else self.negative_ttl_seconds
+        return now - checked_at < ttl
+
+    def get(self, user_id: Optional[str] = None, username: Optional[str] = None) -> Optional[CachedProfile]:
+        """
+        Look up a cached result by user ID, falling back to username.
+
+        Returns:
+            CachedProfile if a fresh entry exists (linkedin_url may be None for a
+            cached negative result), or None on a cache miss
+        """
+        now = self._clock()
+        with self._lock:
+            for key in self._keys(user_id, username):
+                row = self._conn.execute(
+                    "SELECT linkedin_url, checked_at FROM profiles WHERE key = ?", (key,)
+                ).fetchone()
+                if row and self._is_fresh(row[0], row[1], now):
+                    self.hits += 1
+                    return CachedProfile(row[0], row[1])
+            self.misses += 1
+        return None
+
+    def put(self, user_id: Optional[str], username: Optional[str], linkedin_url: Optional[str]):
+        """Store a lookup result (None records that the profile has no LinkedIn)"""
+        now = self._clock()
+        rows = [(key, linkedin_url, now) for key in self._keys(user_id, username)]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO profiles (key, linkedin_url, checked_at) VALUES (?, ?, ?)", rows
+            )
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """Delete expired entries, returning how many were removed"""
+        now = self._clock()
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM profiles WHERE "
+                "(linkedin_url IS NOT NULL AND checked_at <= ?) OR "
+                "(linkedin_url IS NULL AND checked_at <= ?)",
+                (now - self.ttl_seconds, now - self.negative_ttl_seconds)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def clear(self):
+        """Remove every entry (for testing)"""
+        with self._lock:
+            self._conn.execute("DELETE FROM profiles")
+            self._conn.commit()
+
+    def get_stats(self) -> dict:
+        """Get cache statistics"""
+        with self._lock:
+            entries, negatives = self._conn.execute(
+                "SELECT COUNT(*), SUM(linkedin_url IS NULL) FROM profiles"
+            ).fetchone()
+        return {
+            'path': self.path,
+            'entries': entries,
+            'negative_entries': negatives or 0,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+# Global profile cache instance
+_profile_cache: Optional[ProfileCache] = None
+_profile_cache_lock = threading.Lock()
+
+
+def get_profile_cache() -> Optional[ProfileCache]:
+    """
+    Get the global profile cache, or None if caching is disabled.
+
+    Configured via environment variables (see CacheConfig):
+    - PROFILE_CACHE_ENABLED: Enable the cache (default: true)
+    - PROFILE_CACHE_FILE: Database filename inside OUTPUT_DIRECTORY
+    - PROFILE_CACHE_TTL_HOURS: TTL for found LinkedIn URLs (default: 168)
+    - PROFILE_CACHE_NEGATIVE_TTL_HOURS: TTL for "no LinkedIn" results (default: 24)
+    """
+    global _profile_cache
+    with _profile_cache_lock:
+        if _profile_cache is None:
+            from config import get_config
+            cfg = get_config()
+            if not cfg.cache.enabled:
+                return None
+            try:
+                _profile_cache = ProfileCache(
+                    os.path.join(cfg.output.output_directory, cfg.cache.filename),
+                    ttl_seconds=cfg.cache.ttl_hours * 3600,
+                    negative_ttl_seconds=cfg.cache.negative_ttl_hours * 3600
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"Profile cache unavailable, continuing without it: {e}")
+                return None
+
+    return _profile_cache
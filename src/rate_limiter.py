@@ -6,15 +6,164 @@ Implements rate limiting and burst protection for external API calls
 to prevent abuse and quota exhaustion.
 """
 
+import asyncio
+import inspect
+import math
+import mmap
 import time
 import os
-from collections import deque
+import threading
+from contextlib import contextmanager
 from functools import wraps
-from typing import Callable, Deque, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import logging
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
+_NO_BUCKET = -1
+
+# Without an explicit ceiling, successes may raise the adaptive limit this far
+# above the configured rate
+DEFAULT_CEILING_FACTOR = 1.5
+
+
+class _LocalBucketState:
+    """Bucket ring and running totals held in this process"""
+    
+    def __init__(self, size: int):
+        self.size = size
+        self.counts: List[int] = [0] * size
+        self.head = _NO_BUCKET  # Index of the newest bucket
+        self.oldest = 0  # No bucket before this one holds calls
+        self.window_total = 0
+        self.burst_total = 0
+        self.recent_total = 0
+        self.rate_limit = 0.0  # Adapted calls per minute (0: not adapted yet)
+        self.blocked_until = 0.0  # Clock time before which no call may start
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Guard a read-modify-write of the state"""
+        with self._lock:
+            yield
+    
+    def clear(self):
+        """Forget every recorded call (adaptive state is kept)"""
+        self.counts[:] = [0] * self.size
+        self.head = _NO_BUCKET
+        self.oldest = 0
+        self.window_total = self.burst_total = self.recent_total = 0
+
+
+def _slot(index: int) -> property:
+    """Expose one int64 header slot of a shared state file as an attribute"""
+    return property(
+        lambda self: self._slots[index],
+        lambda self, value: self._slots.__setitem__(index, value)
+    )
+
+
+def _float_slot(index: int) -> property:
+    """Expose one float64 header slot of a shared state file as an attribute"""
+    return property(
+        lambda self: self._floats[index],
+        lambda self, value: self._floats.__setitem__(index, value)
+    )
+
+
+class SharedBucketState:
+    """
+    Bucket ring and running totals in a memory-mapped file.
+    
+    Every process that maps the same file draws from one window. Updates are
+    serialized with an exclusive fcntl lock on the file (plus a thread lock,
+    since fcntl locks do not exclude threads of the same process), so this
+    backend is for processes on one host only.
+    """
+    
+    # Header slots: layout check, head, oldest, window/burst/recent totals,
+    # adapted rate and block deadline
+    _HEADER_SLOTS = 8
+    head = _slot(1)
+    oldest = _slot(2)
+    window_total = _slot(3)
+    burst_total = _slot(4)
+    recent_total = _slot(5)
+    rate_limit = _float_slot(6)
+    blocked_until = _float_slot(7)
+    
+    def __init__(self, path: str, size: int):
+        """
+        Open (creating if needed) a shared state file.
+        
+        Args:
+            path: State file; processes sharing a budget must use the same path
+            size: Number of buckets in the ring
+        """
+        if fcntl is None:
+            raise RuntimeError("Shared rate limiter state requires fcntl (POSIX only)")
+        
+        self.path = path
+        self.size = size
+        self._lock = threading.Lock()
+        length = (self._HEADER_SLOTS + size) * 8
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(self._fd).st_size != length:
+                    # New file or one written with a different bucket layout
+                    os.ftruncate(self._fd, 0)
+                    os.ftruncate(self._fd, length)
+                self._mmap = mmap.mmap(self._fd, length)
+                self._slots = memoryview(self._mmap).cast('q')
+                self._floats = memoryview(self._mmap).cast('d')
+                self.counts = self._slots[self._HEADER_SLOTS:]
+                if self._slots[0] != size:
+                    self.clear()
+                    self.rate_limit = self.blocked_until = 0.0
+                    self._slots[0] = size
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        except Exception:
+            os.close(self._fd)
+            raise
+    
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Guard a read-modify-write of the state across threads and processes"""
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+    
+    def clear(self):
+        """Forget every recorded call (adaptive state is kept)"""
+        self._mmap[self._HEADER_SLOTS * 8:] = bytes(self.size * 8)
+        self.head = _NO_BUCKET
+        self.oldest = 0
+        self.window_total = self.burst_total = self.recent_total = 0
+    
+    def close(self):
+        """Unmap and close the state file"""
+        self.counts.release()
+        self._slots.release()
+        self._floats.release()
+        self._mmap.close()
+        os.close(self._fd)
+
 
 class RateLimiter:
     """
@@ -25,13 +174,33 @@ class RateLimiter:
     - Burst protection
     - Configurable limits
     - Thread-safe implementation
+    - Optional window shared by all processes on the host
+    - Adaptive rate driven by server rate-limit responses (AIMD)
+    
+    Calls are counted in fixed-width time buckets kept in a ring, with running
+    totals for the burst (1s), 10s and full-window horizons. Recording a call
+    and checking the limits are O(1) regardless of the limits configured; the
+    lock only guards that bookkeeping and is never held while sleeping.
+    
+    The per-window limit starts at calls_per_minute. Each rate-limited
+    response (record_rate_limited) halves it and pauses calls for the
+    server's Retry-After; successful calls (record_success) raise it again by
+    about one call per window's worth of successes, up to max_calls_per_minute
+    (by default DEFAULT_CEILING_FACTOR times the configured rate).
     """
     
     def __init__(
         self,
         calls_per_minute: int = 20,
         burst_limit: int = 5,
-        window_seconds: int = 60
+        window_seconds: int = 60,
+        resolution: float = 0.1,
+        clock: Optional[Callable[[], float]] = None,
+        shared_state_path: Optional[str] = None,
+        max_calls_per_minute: Optional[int] = None,
+        min_calls_per_minute: int = 1,
+        backoff_factor: float = 0.5,
+        additive_increase: float = 1.0
     ):
         """
         Initialize rate limiter.
@@ -40,69 +209,232 @@ class RateLimiter:
             calls_per_minute: Maximum calls allowed per minute
             burst_limit: Maximum calls allowed in rapid succession
             window_seconds: Time window for rate limiting (default: 60)
+            resolution: Bucket width in seconds; windows slide in these steps
+            clock: Time source (default: monotonic, or wall clock when shared)
+            shared_state_path: File holding a window shared with other processes
+                (default: in-process state)
+            max_calls_per_minute: Ceiling the adaptive limit may grow to
+                (default: DEFAULT_CEILING_FACTOR x calls_per_minute; pass
+                calls_per_minute to never exceed the configured rate)
+            min_calls_per_minute: Floor the adaptive limit may shrink to
+            backoff_factor: Multiplier applied to the limit on a rate-limit response
+            additive_increase: Calls per window the limit grows per window of successes
         """
         self.calls_per_minute = calls_per_minute
+        default_ceiling = int(calls_per_minute * DEFAULT_CEILING_FACTOR)
+        self.max_calls_per_minute = max(max_calls_per_minute or default_ceiling, calls_per_minute)
+        self.min_calls_per_minute = max(1, min(min_calls_per_minute, calls_per_minute))
+        self.backoff_factor = backoff_factor
+        self.additive_increase = additive_increase
         self.burst_limit = burst_limit
         self.window_seconds = window_seconds
-        self.call_times: Deque[float] = deque(maxlen=max(calls_per_minute, burst_limit))
+        self.resolution = resolution
+        
+        # One extra bucket per horizon so a call is never forgotten early:
+        # limits hold over every true sliding window, at most one bucket late
+        self._window_buckets = math.ceil(window_seconds / resolution) + 1
+        self._burst_buckets = math.ceil(1.0 / resolution) + 1
+        self._recent_buckets = math.ceil(10.0 / resolution) + 1
+        self._size = max(self._window_buckets, self._burst_buckets, self._recent_buckets)
+        
+        if shared_state_path:
+            # Monotonic clocks are not comparable between processes
+            self._clock = clock or time.time
+            self._state = SharedBucketState(shared_state_path, self._size)
+        else:
+            self._clock = clock or time.monotonic
+            self._state = _LocalBucketState(self._size)
+        self.shared_state_path = shared_state_path
         
         logger.info(
             f"Rate limiter initialized: {calls_per_minute} calls/min, "
-            f"burst limit: {burst_limit}"
+            f"burst limit: {burst_limit}" + (f", shared via {shared_state_path}" if shared_state_path else "")
         )
     
-    def _clean_old_calls(self, now: float):
-        """Remove calls outside the time window"""
-        while self.call_times and now - self.call_times[0] > self.window_seconds:
-            self.call_times.popleft()
+    def _advance(self, now: float) -> int:
+        """Move the ring forward to the bucket containing `now`, expiring old counts"""
+        state = self._state
+        bucket = int(now // self.resolution)
+        head = state.head
+        if head != _NO_BUCKET and bucket <= head:
+            return head
+        
+        if head == _NO_BUCKET or bucket - head >= self._size:
+            # Everything has expired
+            state.clear()
+            state.head = state.oldest = bucket
+            return bucket
+        
+        counts, size = state.counts, self._size
+        burst_total, recent_total, window_total = state.burst_total, state.recent_total, state.window_total
+        while head < bucket:
+            head += 1
+            # Subtract the bucket that just left each horizon, then reuse the slot
+            burst_total -= counts[(head - self._burst_buckets) % size]
+            recent_total -= counts[(head - self._recent_buckets) % size]
+            window_total -= counts[(head - self._window_buckets) % size]
+            counts[head % size] = 0
+        state.burst_total, state.recent_total, state.window_total = burst_total, recent_total, window_total
+        state.head = head
+        return head
+    
+    def _wait_for_horizon(self, head: int, horizon_buckets: int, now: float) -> float:
+        """Seconds until the oldest call within the horizon expires from it"""
+        state = self._state
+        oldest = max(state.oldest, head - horizon_buckets + 1)
+        while oldest < head and not state.counts[oldest % self._size]:
+            oldest += 1
+        if horizon_buckets == self._window_buckets:
+            state.oldest = oldest
+        # A microsecond of slack keeps float rounding from landing a retry
+        # just short of the bucket boundary
+        return (oldest + horizon_buckets) * self.resolution - now + 1e-6
     
-    def _get_sleep_time(self, now: float) -> float:
-        """Calculate how long to sleep before next call"""
-        if len(self.call_times) >= self.calls_per_minute:
+    def _current_limit(self) -> float:
+        """Adapted calls per window (calls_per_minute until adapted)"""
+        return self._state.rate_limit or self.calls_per_minute
+    
+    def _reserve(self, now: float) -> float:
+        """Record a call if allowed; otherwise return how long to wait"""
+        state = self._state
+        head = self._advance(now)
+        
+        if now < state.blocked_until:
+            # The server asked us to back off
+            return max(state.blocked_until - now, 0.001)
+        
+        if state.window_total >= int(self._current_limit()):
             # Rate limit exceeded
-            oldest_call = self.call_times[0]
-            return self.window_seconds - (now - oldest_call) + 0.1
+            return max(self._wait_for_horizon(head, self._window_buckets, now), 0.001)
         
-        # Check burst limit (calls within 1 second)
-        recent_calls = sum(1 for t in self.call_times if now - t < 1)
-        if recent_calls >= self.burst_limit:
-            return 1.0
+        if state.burst_total >= self.burst_limit:
+            # Burst limit exceeded (calls within 1 second)
+            return max(self._wait_for_horizon(head, self._burst_buckets, now), 0.001)
         
+        state.counts[head % self._size] += 1
+        state.window_total += 1
+        state.burst_total += 1
+        state.recent_total += 1
         return 0.0
     
+    def try_acquire(self) -> float:
+        """
+        Reserve a call slot without blocking.
+        
+        Returns:
+            0.0 if the call may proceed now, otherwise the seconds to wait
+            before trying again
+        """
+        with self._state.locked():
+            return self._reserve(self._clock())
+    
     def wait_if_needed(self) -> Optional[float]:
         """
         Check rate limit and wait if necessary.
         
+        The call slot is reserved under a lock, but the lock is never held
+        while sleeping so concurrent callers keep making progress.
+        
         Returns:
             Time waited in seconds, or None if no wait was needed
         """
-        now = time.time()
-        self._clean_old_calls(now)
+        waited = 0.0
+        while True:
+            with self._state.locked():
+                sleep_time = self._reserve(self._clock())
+                if sleep_time <= 0:
+                    return waited if waited > 0 else None
+                window_calls = self._state.window_total
+                limit = int(self._current_limit())
+            
+            logger.warning(
+                f"Rate limit reached, waiting {sleep_time:.1f}s "
+                f"({window_calls}/{limit} calls)"
+            )
+            time.sleep(sleep_time)
+            waited += sleep_time
+    
+    async def acquire(self) -> Optional[float]:
+        """
+        Awaitable counterpart of wait_if_needed().
         
-        sleep_time = self._get_sleep_time(now)
+        Shares the same window state, so coroutines and threads draw on one
+        budget; waiting yields to the event loop instead of blocking it.
         
-        if sleep_time > 0:
+        Returns:
+            Time waited in seconds, or None if no wait was needed
+        """
+        waited = 0.0
+        while True:
+            with self._state.locked():
+                sleep_time = self._reserve(self._clock())
+                if sleep_time <= 0:
+                    return waited if waited > 0 else None
+                window_calls = self._state.window_total
+                limit = int(self._current_limit())
+            
             logger.warning(
                 f"Rate limit reached, waiting {sleep_time:.1f}s "
-                f"({len(self.call_times)}/{self.calls_per_minute} calls)"
+                f"({window_calls}/{limit} calls)"
             )
-            time.sleep(sleep_time)
-            now = time.time()
-            self._clean_old_calls(now)
+            await asyncio.sleep(sleep_time)
+            waited += sleep_time
+    
+    def record_success(self):
+        """Additive increase: a call went through without being rate limited"""
+        with self._state.locked():
+            rate = self._current_limit()
+            if rate < self.max_calls_per_minute:
+                self._state.rate_limit = min(self.max_calls_per_minute, rate + self.additive_increase / rate)
+    
+    def record_rate_limited(self, retry_after: Optional[float] = None):
+        """
+        Multiplicative decrease: the server rejected a call as rate limited.
+        
+        Responses arriving while already backing off (other in-flight calls
+        rejected by the same server decision) extend the pause but do not
+        shrink the limit again.
+        
+        Args:
+            retry_after: Seconds the server asked us to wait (default: the
+                spacing of one call at the reduced rate)
+        """
+        with self._state.locked():
+            state = self._state
+            now = self._clock()
+            rate = self._current_limit()
+            if now >= state.blocked_until:
+                rate = max(self.min_calls_per_minute, rate * self.backoff_factor)
+                state.rate_limit = rate
+            pause = retry_after if retry_after is not None else self.window_seconds / rate
+            state.blocked_until = max(state.blocked_until, now + pause)
         
-        self.call_times.append(now)
-        return sleep_time if sleep_time > 0 else None
+        logger.warning(
+            f"Server rate limit hit, pausing {pause:.1f}s and "
+            f"lowering limit to {rate:.1f} calls/min"
+        )
     
     def __call__(self, func: Callable) -> Callable:
         """
         Decorator to apply rate limiting to a function.
         
+        Coroutine functions await acquire() instead of blocking.
+        
         Usage:
             @rate_limiter
             def my_api_call():
                 ...
         """
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                wait_time = await self.acquire()
+                if wait_time:
+                    logger.info(f"Rate limit applied, waited {wait_time:.1f}s")
+                return await func(*args, **kwargs)
+            
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             wait_time = self.wait_if_needed()
@@ -114,47 +446,172 @@ class RateLimiter:
     
     def get_stats(self) -> dict:
         """Get rate limiter statistics"""
-        now = time.time()
-        self._clean_old_calls(now)
-        
-        recent_calls_1s = sum(1 for t in self.call_times if now - t < 1)
-        recent_calls_10s = sum(1 for t in self.call_times if now - t < 10)
+        with self._state.locked():
+            self._advance(self._clock())
+            window_calls = self._state.window_total
+            recent_calls_1s = self._state.burst_total
+            recent_calls_10s = self._state.recent_total
+            limit = int(self._current_limit())
         
         return {
-            'total_calls': len(self.call_times),
+            'total_calls': window_calls,
             'calls_per_minute_limit': self.calls_per_minute,
+            'effective_calls_per_minute': limit,
             'burst_limit': self.burst_limit,
             'calls_last_second': recent_calls_1s,
             'calls_last_10_seconds': recent_calls_10s,
-            'calls_last_minute': len(self.call_times),
-            'available_capacity': max(0, self.calls_per_minute - len(self.call_times))
+            'calls_last_minute': window_calls,
+            'available_capacity': max(0, limit - window_calls)
         }
     
     def reset(self):
         """Reset rate limiter (for testing)"""
-        self.call_times.clear()
+        with self._state.locked():
+            self._state.clear()
+            self._state.rate_limit = self._state.blocked_until = 0.0
         logger.info("Rate limiter reset")
 
 
-# Global rate limiter instance
-_rate_limiter: Optional[RateLimiter] = None
+# Default (calls per minute, burst) per MCP method, following Slack's rate
+# tiers: search.messages is Tier 2, users.info Tier 4, users.list Tier 2.
+# Generic API requests use the conservative global default.
+DEFAULT_METHOD_LIMITS: Dict[str, Tuple[int, int]] = {
+    'slack_find_message': (20, 5),
+    'slack_find_user_by_id': (100, 10),
+    'slack_find_user_by_username': (20, 5),
+}
+
+
+class RateLimiterRegistry:
+    """
+    Keyed collection of rate limiters, one per API method.
+    
+    Methods in different Slack rate tiers get separate budgets, so slow-tier
+    searches do not hold back fast-tier user lookups. Limiters are created on
+    first use from DEFAULT_METHOD_LIMITS and environment overrides; an explicit
+    SLACK_API_RATE_LIMIT / SLACK_API_BURST_LIMIT replaces the per-method defaults.
+    
+    With a shared directory, each key's window lives in a state file there, so
+    every process on the host using that directory draws from one budget.
+    """
+    
+    def __init__(
+        self,
+        default_limits: Optional[Dict[str, Tuple[int, int]]] = None,
+        shared_dir: Optional[str] = None
+    ):
+        """
+        Initialize registry.
+        
+        Args:
+            default_limits: (calls per minute, burst) per key, used unless
+                SLACK_API_RATE_LIMIT / SLACK_API_BURST_LIMIT is set; unknown keys
+                default to 20 / 5
+            shared_dir: Directory for cross-process state files
+                (default: RATE_LIMIT_SHARED_DIR, unset means per-process limits)
+        """
+        self.default_limits = dict(DEFAULT_METHOD_LIMITS if default_limits is None else default_limits)
+        self.shared_dir = shared_dir if shared_dir is not None else os.getenv('RATE_LIMIT_SHARED_DIR') or None
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._lock = threading.Lock()
+    
+    def _limits_for(self, key: str) -> Tuple[int, int]:
+        """Resolve limits for a key (per-method, then global environment overrides win)"""
+        rate_limit, burst_limit = self.default_limits.get(key, (20, 5))
+        rate_limit = int(os.getenv('SLACK_API_RATE_LIMIT', rate_limit))
+        burst_limit = int(os.getenv('SLACK_API_BURST_LIMIT', burst_limit))
+        
+        suffix = key.upper()
+        rate_limit = int(os.getenv(f'SLACK_API_RATE_LIMIT_{suffix}', rate_limit))
+        burst_limit = int(os.getenv(f'SLACK_API_BURST_LIMIT_{suffix}', burst_limit))
+        return rate_limit, burst_limit
+    
+    def _ceiling_for(self, key: str) -> Optional[int]:
+        """Resolve how far a key's adaptive limit may grow (None: the limiter's default ceiling)"""
+        ceiling = os.getenv(f'SLACK_API_MAX_RATE_LIMIT_{key.upper()}', os.getenv('SLACK_API_MAX_RATE_LIMIT'))
+        return int(ceiling) if ceiling else None
+    
+    def _create(self, key: str) -> RateLimiter:
+        """Build the limiter for a key, shared across processes if configured"""
+        rate_limit, burst_limit = self._limits_for(key)
+        ceiling = self._ceiling_for(key)
+        if self.shared_dir:
+            path = os.path.join(self.shared_dir, f'rate_limit_{key}.bin')
+            try:
+                return RateLimiter(rate_limit, burst_limit, shared_state_path=path, max_calls_per_minute=ceiling)
+            except (OSError, RuntimeError) as e:
+                logger.warning(f"Shared rate limit state unavailable for {key} ({e}), using per-process limits")
+        return RateLimiter(rate_limit, burst_limit, max_calls_per_minute=ceiling)
+    
+    def get(self, key: str) -> RateLimiter:
+        """Get (creating if needed) the limiter for a key"""
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            with self._lock:
+                limiter = self._limiters.get(key)
+                if limiter is None:
+                    limiter = self._limiters[key] = self._create(key)
+        return limiter
+    
+    def get_stats(self) -> dict:
+        """Get per-key statistics plus totals across all limiters"""
+        with self._lock:
+            limiters = dict(self._limiters)
+        
+        per_key = {key: limiter.get_stats() for key, limiter in limiters.items()}
+        totals = {
+            field: sum(stats[field] for stats in per_key.values())
+            for field in ('calls_last_second', 'calls_last_10_seconds', 'calls_last_minute')
+        }
+        return {
+            'limiters': per_key,
+            'total_calls': totals['calls_last_minute'],
+            **totals
+        }
+    
+    def reset(self):
+        """Reset every limiter (for testing)"""
+        with self._lock:
+            limiters = list(self._limiters.values())
+        for limiter in limiters:
+            limiter.reset()
+
+
+# Global rate limiter registry
+_registry: Optional[RateLimiterRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_rate_limiter_registry() -> RateLimiterRegistry:
+    """Get the global rate limiter registry"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = RateLimiterRegistry()
+    return _registry
 
 
-def get_rate_limiter() -> RateLimiter:
+def get_rate_limiter(key: str = 'default') -> RateLimiter:
     """
-    Get the global rate limiter instance.
+    Get a global rate limiter.
     
     Configured via environment variables:
     - SLACK_API_RATE_LIMIT: Calls per minute (default: 20)
     - SLACK_API_BURST_LIMIT: Burst limit (default: 5)
-    """
-    global _rate_limiter
-    if _rate_limiter is None:
-        rate_limit = int(os.getenv('SLACK_API_RATE_LIMIT', 20))
-        burst_limit = int(os.getenv('SLACK_API_BURST_LIMIT', 5))
-        _rate_limiter = RateLimiter(rate_limit, burst_limit)
+    - SLACK_API_RATE_LIMIT_<KEY> / SLACK_API_BURST_LIMIT_<KEY>: Per-method
+      overrides, e.g. SLACK_API_RATE_LIMIT_SLACK_FIND_USER_BY_ID=100
+    - SLACK_API_MAX_RATE_LIMIT / SLACK_API_MAX_RATE_LIMIT_<KEY>: Calls per
+      minute the adaptive limit may grow to while Slack accepts calls
+      (default: DEFAULT_CEILING_FACTOR x the starting limit, i.e. 1.5x)
+    - RATE_LIMIT_SHARED_DIR: Directory for state shared by every process on
+      the host (default: unset, limits are per process)
     
-    return _rate_limiter
+    Args:
+        key: Limiter name, normally an MCPAdapter method such as
+            'slack_find_user_by_id' (default: the shared general limiter)
+    """
+    return get_rate_limiter_registry().get(key)
 
 
 def rate_limited(func: Callable) -> Callable:
@@ -176,6 +633,26 @@ def rate_limited(func: Callable) -> Callable:
     return wrapper
 
 
+def async_rate_limited(func: Callable) -> Callable:
+    """
+    Decorator to apply rate limiting to a coroutine function using the global
+    rate limiter (shares its budget with rate_limited functions).
+    
+    Usage:
+        @async_rate_limited
+        async def my_api_call():
+            ...
+    """
+    limiter = get_rate_limiter()
+    
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        await limiter.acquire()
+        return await func(*args, **kwargs)
+    
+    return wrapper
+
+
 # Example usage and testing
 if __name__ == "__main__":
     import sys
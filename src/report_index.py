@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Report Index
+
+A compact JSONL index of the daily_intros_*.md reports, appended to by
+save_daily_intro_report(). Each line describes one report: its date, the
+cutoff its run started from, intro count, and per intro the user ID,
+username, message timestamp and the byte range of its section in the
+markdown file. The index is the record of what has been reported:
+
+- partition() splits a run's intros into new and already reported ones
+- latest_timestamp() is the newest reported message (seeds the watermark)
+- get() returns a report's entry, e.g. to re-cover its window on a rerun
+
+Rewriting a report (re-running the same day) appends a new line that
+supersedes the old one; the file is compacted once superseded lines dominate.
+Reports written before the index existed are indexed once from their
+markdown, without user IDs (the reports do not contain them).
+"""
+
+import json
+import os
+import re
+import threading
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from atomic_file import locked, write_text
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "report_index.jsonl"
+
+_REPORT_NAME_PATTERN = re.compile(r'^daily_intros_(\d{4}-\d{2}-\d{2})\.md$')
+_SECTION_PATTERN = re.compile(rb'^## \d+\. ', re.MULTILINE)
+_USERNAME_PATTERN = re.compile(rb'^- \*\*Username:\*\* @(\S*)', re.MULTILINE)
+_POSTED_PATTERN = re.compile(rb'^- \*\*Posted:\*\* (\S+)', re.MULTILINE)
+
+
+def build_report_entry(report: str, date: str, sections: List[Dict], size: int,
+                       generated_at: str = '', error: bool = False, cutoff: str = '') -> Dict:
+    """
+    Build the index line for one report.
+
+    Args:
+        report: Report filename (e.g. daily_intros_2025-09-18.md)
+        date: Report date (YYYY-MM-DD)
+        sections: Per intro: user_id, username, timestamp, offset, length
+        size: Report size in bytes
+        generated_at: When the report was written
+        error: Whether the report records a failed run
+        cutoff: Timestamp the run searched after ('' if unknown)
+
+    Returns:
+        Index entry
+    """
+    return {
+        'report': report,
+        'date': date,
+        'generated_at': generated_at,
+        'cutoff': cutoff,
+        'error': error,
+        'size': size,
+        'intro_count': len(sections),
+        'intros': sections
+    }
+
+
+def _intro_keys(intro: Dict) -> List[str]:
+    """Identities of an intro: its author (user ID and username) at its message timestamp"""
+    timestamp = intro.get('timestamp', '')
+    return [f"{author}@{timestamp}" for author in (intro.get('user_id'), intro.get('username')) if author]
+
+
+def index_markdown_report(path: str) -> Optional[Dict]:
+    """Index an existing markdown report (user IDs are not recoverable)"""
+    match = _REPORT_NAME_PATTERN.match(os.path.basename(path))
+    if not match:
+        return None
+    with open(path, 'rb') as f:
+        content = f.read()
+
+    starts = [m.start() for m in _SECTION_PATTERN.finditer(content)]
+    sections = []
+    for i, start in enumerate(starts):
+        end = starts[i + 1] if i + 1 < len(starts) else len(content)
+        section = content[start:end]
+        username = _USERNAME_PATTERN.search(section)
+        posted = _POSTED_PATTERN.search(section)
+        sections.append({
+            'user_id': '',
+            'username': username.group(1).decode('utf-8', 'replace') if username else '',
+            'timestamp': posted.group(1).decode('utf-8', 'replace') if posted else '',
+            'offset': start,
+            'length': end - start
+        })
+    return build_report_entry(os.path.basename(path), match.group(1), sections, len(content),
+                              error=b'## \xe2\x9a\xa0\xef\xb8\x8f Error' in content)
+
+
+class ReportIndex:
+    """
+    Append-only JSONL index of a report directory.
+
+    Features:
+    - One line per written report; the newest line per report wins
+    - In-memory "already reported?" checks by user ID or username and timestamp
+    - Newest reported message timestamp
+    - Updates are serialized across threads and processes by a file lock
+    """
+
+    def __init__(self, report_dir: str, filename: str = INDEX_FILENAME):
+        """
+        Initialize report index.
+
+        Args:
+            report_dir: Directory holding the daily_intros_*.md reports
+            filename: Index filename inside report_dir
+        """
+        self.report_dir = report_dir
+        self.path = os.path.join(report_dir, filename)
+        self._lock = threading.Lock()
+        self._reports: Dict[str, Dict] = {}
+        self._reported: Dict[str, str] = {}  # Intro key -> report that contains it
+        self._lines = 0
+        self._loaded = False
+
+    def _read(self) -> Optional[Tuple[Dict[str, Dict], int]]:
+        """Read the index file: (newest entry per report, line count), or None if missing"""
+        reports = {}
+        lines = 0
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # Torn final line from an interrupted append
+                    if isinstance(entry, dict) and entry.get('report'):
+                        reports[entry['report']] = entry
+                        lines += 1
+        except FileNotFoundError:
+            return None
+        return reports, lines
+
+    def _set_reports(self, reports: Dict[str, Dict], lines: int):
+        """Replace the in-memory index (caller holds the lock)"""
+        self._reports = reports
+        self._lines = lines
+        self._reported = {}
+        for entry in self._sorted_reports():
+            for intro in entry.get('intros', []):
+                for key in _intro_keys(intro):
+                    self._reported[key] = entry['report']
+
+    def _sorted_reports(self) -> List[Dict]:
+        """Indexed reports, oldest first (caller holds the lock)"""
+        return sorted(self._reports.values(), key=lambda e: (e.get('date', ''), e['report']))
+
+    def _load(self):
+        """Read the index once (building it from the reports if it does not exist yet)"""
+        if self._loaded:
+            return
+        try:
+            indexed = self._read()
+            if indexed is None and not os.path.isdir(self.report_dir):
+                indexed = ({}, 0)
+            elif indexed is None:
+                with locked(self.path):
+                    # Another run may have built it while we waited for the lock
+                    indexed = self._read() or self._rebuild()
+        except OSError as e:
+            logger.warning(f"Report index unreadable, starting empty: {e}")
+            indexed = ({}, 0)
+        self._set_reports(*indexed)
+        self._loaded = True
+
+    def _rebuild(self) -> Tuple[Dict[str, Dict], int]:
+        """Index every existing markdown report and write a fresh index file (caller holds the file lock)"""
+        reports = {}
+        if os.path.isdir(self.report_dir):
+            with os.scandir(self.report_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and _REPORT_NAME_PATTERN.match(entry.name):
+                        try:
+                            indexed = index_markdown_report(entry.path)
+                        except OSError as e:
+                            logger.warning(f"Could not index {entry.path}: {e}")
+                            continue
+                        if indexed:
+                            reports[indexed['report']] = indexed
+        if reports:
+            logger.info(f"Indexed {len(reports)} existing reports in {self.report_dir}")
+            self._write_all(reports)
+        return reports, len(reports)
+
+    def _write_all(self, reports: Dict[str, Dict]):
+        """Rewrite the index atomically with one line per report (caller holds the file lock)"""
+        ordered = sorted(reports.values(), key=lambda e: (e.get('date', ''), e['report']))
+        write_text(self.path, ''.join(json.dumps(entry, separators=(',', ':')) + '\n' for entry in ordered))
+
+    def record(self, entry: Dict):
+        """Add or replace a report's entry (appends one line to the index)"""
+        with self._lock:
+            self._load()
+            with locked(self.path):
+                # Re-read under the file lock: other runs may have appended since we loaded
+                reports, lines = self._read() or (dict(self._reports), 0)
+                reports[entry['report']] = entry
+                if lines + 1 > 2 * len(reports) + 10:
+                    self._write_all(reports)
+                    lines = len(reports)
+                else:
+                    fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+                    with os.fdopen(fd, 'a', encoding='utf-8') as f:
+                        f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+                    lines += 1
+            self._set_reports(reports, lines)
+
+    def get(self, report: str) -> Optional[Dict]:
+        """Get a report's entry by filename, or None if it is not indexed"""
+        with self._lock:
+            self._load()
+            return self._reports.get(report)
+
+    def partition(self, intros: List[Dict], exclude_report: Optional[str] = None) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Split intros into new and already reported ones (order preserved).
+
+        Args:
+            intros: Intro records with user_id, username and timestamp
+            exclude_report: Report being rewritten; its intros do not count as reported
+
+        Returns:
+            (new_intros, reported_intros)
+        """
+        with self._lock:
+            self._load()
+            new, reported = [], []
+            for intro in intros:
+                reports = {self._reported.get(key) for key in _intro_keys(intro)} - {None, exclude_report}
+                (reported if reports else new).append(intro)
+        return new, reported
+
+    def latest_timestamp(self) -> Optional[str]:
+        """Newest message timestamp in any indexed report"""
+        with self._lock:
+            self._load()
+            timestamps = [intro['timestamp'] for entry in self._reports.values()
+                          for intro in entry.get('intros', []) if intro.get('timestamp')]
+        return max(timestamps) if timestamps else None
+
+    def get_stats(self) -> dict:
+        """Get index statistics"""
+        with self._lock:
+            self._load()
+            return {
+                'path': self.path,
+                'reports': len(self._reports),
+                'intros': sum(entry.get('intro_count', 0) for entry in self._reports.values()),
+                'lines': self._lines
+            }
+
+
+# Global report indexes, one per report directory
+_report_indexes: Dict[str, ReportIndex] = {}
+_report_indexes_lock = threading.Lock()
+
+
+def get_report_index(report_dir: Optional[str] = None) -> ReportIndex:
+    """
+    Get the global index for a report directory (loaded on first lookup).
+
+    Args:
+        report_dir: Directory holding the reports (default: OUTPUT_DIRECTORY,
+            next to the watermark and task budget files)
+    """
+    if report_dir is None:
+        from config import get_config
+        report_dir = get_config().output.output_directory
+    key = os.path.abspath(report_dir)
+    index = _report_indexes.get(key)
+    if index is None:
+        with _report_indexes_lock:
+            index = _report_indexes.get(key)
+            if index is None:
+                index = _report_indexes[key] = ReportIndex(report_dir)
+    return index
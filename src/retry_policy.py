@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Retry Policies for MCP Calls
+
+Transient failures (network blips, gateway errors, Slack rate limiting) are
+retried with exponential backoff and jitter, within a per-method attempt
+limit and a total deadline. Fatal errors (bad arguments, exhausted Zapier
+quota) are never retried. Each policy keeps statistics on how often retries
+happened and whether they recovered the call.
+"""
+
+import os
+import random
+import threading
+import time
+import logging
+from typing import Callable, Dict, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CallFailure(NamedTuple):
+    """Why an MCP call attempt failed"""
+    retryable: bool
+    reason: str
+    retry_after: Optional[float] = None  # Server-requested wait, if any
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with jitter for one API method.
+
+    The delay before retry n (n = 1, 2, ...) is
+    min(max_delay, base_delay * multiplier ** (n - 1)), reduced by a random
+    fraction of up to `jitter` so that workers retrying the same outage do
+    not stampede the server together. A server-requested Retry-After is
+    never undercut.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.5,
+        total_deadline: float = 60.0,
+        rng: Callable[[], float] = random.random,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize retry policy.
+
+        Args:
+            max_attempts: Total attempts including the first call (1 disables retries)
+            base_delay: Delay before the first retry in seconds
+            max_delay: Upper bound for a single backoff delay
+            multiplier: Backoff growth factor per retry
+            jitter: Fraction (0-1) of each delay that is randomized away
+            total_deadline: Seconds after the first attempt when no retry may start
+            rng: Uniform [0, 1) source for jitter (injectable for testing)
+            sleep: Sleep function (injectable for testing)
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.total_deadline = total_deadline
+        self._rng = rng
+        self.sleep = sleep
+
+        self._lock = threading.Lock()
+        self._stats = {'calls': 0, 'attempts': 0, 'retries': 0, 'recovered': 0, 'gave_up': 0, 'fatal_errors': 0}
+
+    def backoff(self, retry_number: int, retry_after: Optional[float] = None) -> float:
+        """
+        Delay before the given retry.
+
+        Args:
+            retry_number: 1 for the first retry, 2 for the second, ...
+            retry_after: Server-requested minimum wait
+
+        Returns:
+            Seconds to wait
+        """
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (retry_number - 1))
+        delay *= 1.0 - self.jitter * self._rng()
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def next_delay(self, attempt: int, failure: CallFailure, remaining: float) -> Optional[float]:
+        """
+        Decide whether to retry after a failed attempt.
+
+        Args:
+            attempt: Attempts made so far (1 after the first call)
+            failure: Why the attempt failed
+            remaining: Seconds left in the call's total deadline
+
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        if not failure.retryable or attempt >= self.max_attempts:
+            return None
+        delay = self.backoff(attempt, failure.retry_after)
+        if delay >= remaining:
+            return None
+        return delay
+
+    def record(self, attempts: int, succeeded: bool, fatal: bool = False):
+        """Record the outcome of one call that took `attempts` attempts"""
+        with self._lock:
+            self._stats['calls'] += 1
+            self._stats['attempts'] += attempts
+            self._stats['retries'] += attempts - 1
+            if succeeded:
+                if attempts > 1:
+                    self._stats['recovered'] += 1
+            elif fatal:
+                self._stats['fatal_errors'] += 1
+            else:
+                self._stats['gave_up'] += 1
+
+    def get_stats(self) -> dict:
+        """Get retry statistics"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['max_attempts'] = self.max_attempts
+        return stats
+
+    def reset(self):
+        """Reset statistics (for testing)"""
+        with self._lock:
+            for key in self._stats:
+                self._stats[key] = 0
+
+
+# Default (max attempts, total deadline seconds) per MCP method. The message
+# search gets an extra attempt: losing it loses the whole day's intros.
+DEFAULT_METHOD_POLICIES: Dict[str, tuple] = {
+    'slack_find_message': (4, 90.0),
+    'slack_find_user_by_id': (3, 30.0),
+    'slack_find_user_by_username': (2, 20.0),
+}
+
+
+class RetryPolicyRegistry:
+    """
+    Keyed collection of retry policies, one per API method.
+
+    Policies are created on first use from DEFAULT_METHOD_POLICIES and
+    environment overrides.
+    """
+
+    def __init__(self, default_policies: Optional[Dict[str, tuple]] = None):
+        """
+        Initialize registry.
+
+        Args:
+            default_policies: (max attempts, total deadline) per key; unknown
+                keys use MCP_RETRY_ATTEMPTS / MCP_RETRY_DEADLINE (default: 3 / 60)
+        """
+        self.default_policies = dict(DEFAULT_METHOD_POLICIES if default_policies is None else default_policies)
+        self._policies: Dict[str, RetryPolicy] = {}
+        self._lock = threading.Lock()
+
+    def _create(self, key: str) -> RetryPolicy:
+        """Build the policy for a key (environment overrides win)"""
+        def setting(name: str, default):
+            value = os.getenv(f'{name}_{key.upper()}', os.getenv(name))
+            return type(default)(value) if value else default
+
+        max_attempts, total_deadline = self.default_policies.get(key, (3, 60.0))
+        return RetryPolicy(
+            max_attempts=setting('MCP_RETRY_ATTEMPTS', max_attempts),
+            base_delay=setting('MCP_RETRY_BASE_DELAY', 1.0),
+            max_delay=setting('MCP_RETRY_MAX_DELAY', 30.0),
+            total_deadline=setting('MCP_RETRY_DEADLINE', float(total_deadline))
+        )
+
+    def get(self, key: str) -> RetryPolicy:
+        """Get (creating if needed) the policy for a key"""
+        policy = self._policies.get(key)
+        if policy is None:
+            with self._lock:
+                policy = self._policies.get(key)
+                if policy is None:
+                    policy = self._policies[key] = self._create(key)
+        return policy
+
+    def get_stats(self) -> dict:
+        """Get per-key statistics plus totals across all policies"""
+        with self._lock:
+            policies = dict(self._policies)
+
+        per_key = {key: policy.get_stats() for key, policy in policies.items()}
+        totals = {
+            field: sum(stats[field] for stats in per_key.values())
+            for field in ('calls', 'attempts', 'retries', 'recovered', 'gave_up', 'fatal_errors')
+        }
+        return {'policies': per_key, **totals}
+
+    def reset(self):
+        """Reset every policy's statistics (for testing)"""
+        with self._lock:
+            policies = list(self._policies.values())
+        for policy in policies:
+            policy.reset()
+
+
+# Global retry policy registry
+_registry: Optional[RetryPolicyRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_retry_policy_registry() -> RetryPolicyRegistry:
+    """Get the global retry policy registry"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = RetryPolicyRegistry()
+    return _registry
+
+
+def get_retry_policy(key: str = 'default') -> RetryPolicy:
+    """
+    Get the global retry policy for an API method.
+
+    Configured via environment variables (each also accepts a _<KEY> suffix,
+    e.g. MCP_RETRY_ATTEMPTS_SLACK_FIND_MESSAGE=5):
+    - MCP_RETRY_ATTEMPTS: Total attempts per call (default: per method, or 3)
+    - MCP_RETRY_BASE_DELAY: First backoff delay in seconds (default: 1)
+    - MCP_RETRY_MAX_DELAY: Largest backoff delay in seconds (default: 30)
+    - MCP_RETRY_DEADLINE: Seconds after which no retry starts (default: per method, or 60)
+
+    Args:
+        key: Policy name, normally an MCPAdapter method such as 'slack_find_message'
+    """
+    return get_retry_policy_registry().get(key)
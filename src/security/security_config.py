@@ -38,23 +38,20 @@ class InputValidator:
     SAFE_DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
     SAFE_TIMESTAMP_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z$')
     
-    # Dangerous patterns to block
-    DANGEROUS_PATTERNS = [
-        re.compile(r'[<>"\']', re.IGNORECASE),  # HTML/XML injection
-        re.compile(r'javascript:', re.IGNORECASE),  # JavaScript injection
-        re.compile(r'data:', re.IGNORECASE),  # Data URI injection
-        re.compile(r'vbscript:', re.IGNORECASE),  # VBScript injection
-        re.compile(r'on\w+\s*=', re.IGNORECASE),  # Event handlers
-        re.compile(r'<script', re.IGNORECASE),  # Script tags
-        re.compile(r'<iframe', re.IGNORECASE),  # Iframe tags
-        re.compile(r'<object', re.IGNORECASE),  # Object tags
-        re.compile(r'<embed', re.IGNORECASE),  # Embed tags
-        re.compile(r'<link', re.IGNORECASE),  # Link tags
-        re.compile(r'<meta', re.IGNORECASE),  # Meta tags
-        re.compile(r'\.\./', re.IGNORECASE),  # Directory traversal
-        re.compile(r'\.\.\\', re.IGNORECASE),  # Windows directory traversal
-        re.compile(r'[;&|`$]', re.IGNORECASE),  # Command injection
-    ]
+    # Dangerous characters to delete: HTML/XML injection, command injection
+    # and control characters (newlines and tabs are kept)
+    DANGEROUS_CHARACTERS = re.compile(r'[<>"\';&|`$\x00-\x08\x0B\x0C\x0E-\x1F\x7F]')
+    
+    # Dangerous sequences to remove, as one alternation (tag patterns such as
+    # "<script" are covered by deleting "<"). The lookahead lets the regex
+    # engine skip positions that cannot start a match.
+    DANGEROUS_SEQUENCES = re.compile(
+        r'(?=[jdvo.JDVO])(?:'
+        r'(?i:javascript|data|vbscript):'  # Script and data URI injection
+        r'|(?i:on)\w+\s*='  # Event handlers
+        r'|\.\.[/\\]'  # Directory traversal (Unix and Windows)
+        r')'
+    )
     
     @classmethod
     def validate_name(cls, name: str) -> bool:
@@ -94,12 +91,14 @@ class InputValidator:
         if len(text) > max_length:
             text = text[:max_length]
         
-        # Remove dangerous patterns
-        for pattern in cls.DANGEROUS_PATTERNS:
-            text = pattern.sub('', text)
+        # Delete dangerous characters (including control characters)
+        text = cls.DANGEROUS_CHARACTERS.sub('', text)
         
-        # Remove control characters except newlines and tabs
-        text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
+        # Remove dangerous sequences; repeat only if a removal joined the
+        # surrounding text into a new match (e.g. "javajavascript:script:")
+        text, removed = cls.DANGEROUS_SEQUENCES.subn('', text)
+        while removed:
+            text, removed = cls.DANGEROUS_SEQUENCES.subn('', text)
         
         return text.strip()
     
@@ -182,39 +181,69 @@ class SecurityManager:
         
         return logger
     
+    def _sanitize_name(self, key: str, value: str) -> str:
+        if not self.validator.validate_name(value):
+            self.logger.warning(f"Invalid name field: {key}={value[:50]}")
+            return self.validator.sanitize_text(value, 100)
+        return value
+    
+    def _sanitize_username(self, key: str, value: str) -> str:
+        if not self.validator.validate_username(value):
+            self.logger.warning(f"Invalid username field: {key}={value[:50]}")
+            return self.validator.sanitize_text(value, 50)
+        return value
+    
+    def _sanitize_timestamp(self, key: str, value: str) -> str:
+        if not self.validator.validate_timestamp(value):
+            self.logger.warning(f"Invalid timestamp field: {key}={value[:50]}")
+            return ""
+        return value
+    
+    def _sanitize_general(self, key: str, value: str) -> str:
+        # General sanitization for other text fields
+        return self.validator.sanitize_text(value, self.config.max_input_length)
+    
+    def _field_sanitizers(self) -> Dict[str, Any]:
+        """Map field names to their validation routine"""
+        return {
+            'first_name': self._sanitize_name,
+            'real_name': self._sanitize_name,
+            'username': self._sanitize_username,
+            'user_id': self._sanitize_username,
+            'timestamp': self._sanitize_timestamp,
+            'ts_time': self._sanitize_timestamp,
+        }
+    
     def validate_and_sanitize_input(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate and sanitize input data"""
-        sanitized = {}
+        return self.validate_and_sanitize_batch([input_data])[0]
+    
+    def validate_and_sanitize_batch(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Validate and sanitize a batch of input records with one shared
+        field-to-validator table.
         
-        for key, value in input_data.items():
-            if not isinstance(value, str):
-                sanitized[key] = value
-                continue
-            
-            # Apply specific validation based on field name
-            if key in ['first_name', 'real_name']:
-                if not self.validator.validate_name(value):
-                    self.logger.warning(f"Invalid name field: {key}={value[:50]}")
-                    sanitized[key] = self.validator.sanitize_text(value, 100)
-                else:
-                    sanitized[key] = value
-            elif key in ['username', 'user_id']:
-                if not self.validator.validate_username(value):
-                    self.logger.warning(f"Invalid username field: {key}={value[:50]}")
-                    sanitized[key] = self.validator.sanitize_text(value, 50)
-                else:
-                    sanitized[key] = value
-            elif key in ['timestamp', 'ts_time']:
-                if not self.validator.validate_timestamp(value):
-                    self.logger.warning(f"Invalid timestamp field: {key}={value[:50]}")
-                    sanitized[key] = ""
-                else:
+        Args:
+            records: Input dictionaries (e.g. one per Slack message on a page)
+        
+        Returns:
+            Sanitized dictionaries, in the same order
+        """
+        sanitizers = self._field_sanitizers()
+        general = self._sanitize_general
+        results = []
+        
+        for input_data in records:
+            sanitized = {}
+            for key, value in input_data.items():
+                if not isinstance(value, str):
                     sanitized[key] = value
-            else:
-                # General sanitization for other text fields
-                sanitized[key] = self.validator.sanitize_text(value, self.config.max_input_length)
+                    continue
+                
+                sanitized[key] = sanitizers.get(key, general)(key, value)
+            results.append(sanitized)
         
-        return sanitized
+        return results
     
     def validate_file_operation(self, filepath: str, operation: str = "read") -> bool:
         """Validate file operations for security"""
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Single-Flight Request Coalescing
+
+Concurrent requests for the same key share one in-flight call: the first
+caller (the leader) runs it, later callers wait for and receive the same
+result or exception. Nothing is cached once the call completes; the
+persistent profile cache covers repeated lookups across time.
+
+A call may be registered under several keys (aliases), so a lookup of a
+user by ID can also satisfy a concurrent lookup of the same user's username.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+
+class _Call:
+    """One in-flight call and its outcome"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Thread-based single-flight group.
+
+    Features:
+    - One in-flight call per key (and its aliases)
+    - Followers share the leader's result or exception
+    - Optional wait timeout for followers
+    - Coalescing statistics
+    """
+
+    def __init__(self, name: str = "single-flight"):
+        """
+        Initialize group.
+
+        Args:
+            name: Label used in timeout messages
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def _join_or_lead(self, keys: tuple):
+        """Find the in-flight call for any of the keys, or register a new one"""
+        with self._lock:
+            for key in keys:
+                call = self._calls.get(key)
+                if call is not None:
+                    self.coalesced += 1
+                    return call, False
+            call = _Call()
+            for key in keys:
+                self._calls[key] = call
+            self.leaders += 1
+            return call, True
+
+    def do(self, key: str, fn: Callable[[], Any], aliases: Iterable[str] = (),
+           timeout: Optional[float] = None) -> Any:
+        """
+        Run fn, or wait for an identical call already in flight.
+
+        Args:
+            key: Identity of the request
+            fn: Zero-argument callable performing the request
+            aliases: Other keys the same call answers (e.g. the user's username)
+            timeout: Longest a follower waits for the leader (default: no limit)
+
+        Returns:
+            The result of fn (possibly from another thread's call)
+
+        Raises:
+            Whatever fn raised, in the leader and every follower
+            TimeoutError: If a follower's wait times out
+        """
+        keys = (key, *(alias for alias in aliases if alias and alias != key))
+        call, leader = self._join_or_lead(keys)
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise TimeoutError(f"{self.name}: gave up waiting for in-flight call {key!r}")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                for k in keys:
+                    if self._calls.get(k) is call:
+                        del self._calls[k]
+            call.done.set()
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running"""
+        with self._lock:
+            return len({id(call) for call in self._calls.values()})
+
+    def get_stats(self) -> dict:
+        """Get coalescing statistics"""
+        return {
+            'leaders': self.leaders,
+            'coalesced': self.coalesced,
+            'in_flight': self.in_flight()
+        }
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio single-flight group.
+
+    The shared call runs as a task and is shielded, so one follower being
+    cancelled (e.g. by its deadline) does not cancel it for the others.
+    """
+
+    def __init__(self):
+        # Key -> (loop the call runs on, its task); Task.get_loop() needs Python 3.8
+        self._tasks: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Task]] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, factory: Callable[[], Awaitable[Any]], aliases: Iterable[str] = ()) -> Any:
+        """
+        Await factory(), or an identical call already in flight on this loop.
+
+        Args:
+            key: Identity of the request
+            factory: Zero-argument callable returning the awaitable to run
+            aliases: Other keys the same call answers
+
+        Returns:
+            The awaitable's result (possibly shared with other coroutines)
+        """
+        loop = asyncio.get_running_loop()
+        keys = (key, *(alias for alias in aliases if alias and alias != key))
+
+        for k in keys:
+            task_loop, task = self._tasks.get(k, (None, None))
+            if task is not None and task_loop is loop and not task.done():
+                self.coalesced += 1
+                return await asyncio.shield(task)
+
+        task = loop.create_task(factory())
+        for k in keys:
+            self._tasks[k] = (loop, task)
+        self.leaders += 1
+
+        def _forget(finished: asyncio.Task):
+            for k in keys:
+                if self._tasks.get(k, (None, None))[1] is finished:
+                    del self._tasks[k]
+
+        task.add_done_callback(_forget)
+        return await asyncio.shield(task)
+
+    def get_stats(self) -> dict:
+        """Get coalescing statistics"""
+        return {
+            'leaders': self.leaders,
+            'coalesced': self.coalesced,
+            'in_flight': len({id(task) for _, task in self._tasks.values() if not task.done()})
+        }
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Zapier Task Budget
+
+Every MCP action the bot runs through Zapier consumes a task from the
+account's monthly quota. This module counts the tasks each run consumes,
+persists them in a small JSON file in the output directory, and plans how
+many profile lookups a run can afford before the quota runs out.
+
+When the budget is tight, low-value work is dropped first: the fallback
+lookups (recent-message and username searches) go before the primary
+users.info lookups, and the oldest intros' lookups go before the newest.
+"""
+
+import json
+import os
+import threading
+import time
+import logging
+from datetime import datetime
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from atomic_file import locked, write_json
+
+logger = logging.getLogger(__name__)
+
+# Zapier tasks consumed per unit of work
+SEARCH_PAGE_TASKS = 1  # slack_find_message for one result page
+PRIMARY_LOOKUP_TASKS = 1  # slack_find_user_by_id
+FALLBACK_LOOKUP_TASKS = 2  # from:<user> message search + slack_find_user_by_username
+
+# MCP methods (as counted by record_call) behind each unit of work, one task each
+SEARCH_PAGE_CALLS = ('slack_find_message',)
+PRIMARY_LOOKUP_CALLS = ('slack_find_user_by_id',)
+FALLBACK_LOOKUP_CALLS = ('slack_find_message', 'slack_find_user_by_username')
+
+
+class RunPlan(NamedTuple):
+    """How much profile-lookup work a run (or page of a run) may spend"""
+    lookups_allowed: int
+    use_fallbacks: bool
+    estimated_tasks: int
+    remaining_tasks: Optional[int]  # None when no quota is configured
+
+    @property
+    def is_limited(self) -> bool:
+        """True if the budget forced lookups or fallbacks to be dropped"""
+        return self.remaining_tasks is not None and not self.use_fallbacks
+
+
+def estimate_run_cost(lookups: int, search_pages: int = 1, use_fallbacks: bool = True) -> int:
+    """
+    Estimate the Zapier tasks a run needs (worst case: no lookup is cached).
+
+    Args:
+        lookups: Profile lookups for intros without a LinkedIn link
+        search_pages: Message search result pages to fetch
+        use_fallbacks: Whether lookups fall back to message/username searches
+
+    Returns:
+        Estimated number of tasks
+    """
+    per_lookup = PRIMARY_LOOKUP_TASKS + (FALLBACK_LOOKUP_TASKS if use_fallbacks else 0)
+    return search_pages * SEARCH_PAGE_TASKS + lookups * per_lookup
+
+
+def billing_period_start(now: datetime, billing_day: int = 1) -> datetime:
+    """Start of the monthly quota period containing `now`"""
+    start = now.replace(day=billing_day, hour=0, minute=0, second=0, microsecond=0)
+    if now.day < billing_day:
+        # Period began last month
+        if start.month == 1:
+            start = start.replace(year=start.year - 1, month=12)
+        else:
+            start = start.replace(month=start.month - 1)
+    return start
+
+
+class TaskBudget:
+    """
+    Persistent Zapier task tracker and run planner.
+
+    Features:
+    - Counts tasks per MCP method for the current run
+    - Persists per-run totals across runs (atomic, file-locked JSON writes)
+    - Sums usage over the current monthly billing period
+    - Plans profile lookups within the remaining quota
+    - Safe to share between worker threads
+    """
+
+    def __init__(
+        self,
+        path: str,
+        monthly_task_limit: int = 0,
+        billing_day: int = 1,
+        reserve_tasks: int = 0,
+        max_history: int = 200,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize task budget.
+
+        Args:
+            path: JSON file holding the run history (created on first save)
+            monthly_task_limit: Zapier tasks per billing period (0: track only)
+            billing_day: Day of month the Zapier billing period starts (1-28)
+            reserve_tasks: Tasks kept back for other Zaps on the same account
+            max_history: Number of past runs kept in the file
+            clock: Wall-clock time source (injectable for testing)
+        """
+        self.path = path
+        self.monthly_task_limit = monthly_task_limit
+        self.billing_day = billing_day
+        self.reserve_tasks = reserve_tasks
+        self.max_history = max_history
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self._runs: List[Dict] = self._load()
+        self._run_started_at = clock()
+        self._run_calls: Dict[str, int] = {}
+        self._reserved: Dict[str, int] = {}  # MCP method -> tasks planned but not yet consumed
+        self.lookups_skipped = 0
+        self.exhausted = False
+
+    def _load(self) -> List[Dict]:
+        """Read the run history, treating a missing or corrupt file as empty"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                runs = json.load(f).get('runs', [])
+            return [run for run in runs if isinstance(run, dict)]
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Task budget history unreadable, starting fresh: {e}")
+            return []
+
+    def _save(self, runs: List[Dict]):
+        """Write the run history atomically with owner-only permissions"""
+        write_json(self.path, {'version': 1, 'runs': runs})
+
+    def record_call(self, function_key: str, tasks: int = 1):
+        """Count the tasks consumed by one completed MCP call (consuming its method's reservation, if any)"""
+        with self._lock:
+            self._run_calls[function_key] = self._run_calls.get(function_key, 0) + tasks
+            if function_key in self._reserved:
+                self._reserved[function_key] = max(0, self._reserved[function_key] - tasks)
+
+    def _reserve(self, calls: tuple, count: int):
+        """Reserve one task per call for count units of work (caller holds the lock)"""
+        for function_key in calls:
+            self._reserved[function_key] = self._reserved.get(function_key, 0) + count
+
+    def mark_exhausted(self):
+        """Zapier reported the quota is used up; plan no further lookups this run"""
+        with self._lock:
+            self.exhausted = True
+
+    def run_tasks(self) -> int:
+        """Tasks consumed so far by the current run"""
+        with self._lock:
+            return sum(self._run_calls.values())
+
+    def used_this_period(self) -> int:
+        """Tasks consumed in the current billing period, including this run"""
+        period_start = billing_period_start(
+            datetime.fromtimestamp(self._clock()), self.billing_day
+        ).timestamp()
+        with self._lock:
+            past = sum(run.get('tasks', 0) for run in self._runs
+                       if run.get('finished_at', 0) >= period_start)
+            return past + sum(self._run_calls.values())
+
+    def remaining(self) -> Optional[int]:
+        """Tasks left for the bot this period, or None if no quota is configured"""
+        if self.exhausted:
+            return 0
+        if self.monthly_task_limit <= 0:
+            return None
+        with self._lock:
+            reserved = sum(self._reserved.values())
+        return max(0, self.monthly_task_limit - self.reserve_tasks - self.used_this_period() - reserved)
+
+    def average_run_tasks(self) -> Optional[float]:
+        """Mean tasks per recorded run, or None without history"""
+        with self._lock:
+            if not self._runs:
+                return None
+            return sum(run.get('tasks', 0) for run in self._runs) / len(self._runs)
+
+    def plan_run(self, lookups: int, search_pages: int = 0) -> RunPlan:
+        """
+        Decide how many profile lookups fit in the remaining budget.
+
+        Fallbacks are dropped before any primary lookup; if even primary
+        lookups do not all fit, only the first lookups_allowed (in the
+        caller's priority order) should run. The planned tasks, search pages
+        included, are reserved per MCP method until record_call() consumes
+        them; calls nothing was planned for (e.g. users.list pages) leave the
+        reservations alone.
+
+        Args:
+            lookups: Profile lookups wanted, in priority order
+            search_pages: Further search pages the run still has to fetch
+                (reserved too, so fetching them does not use up lookup reservations)
+
+        Returns:
+            RunPlan for the requested lookups
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return RunPlan(lookups, True, estimate_run_cost(lookups, search_pages), None)
+
+        available = remaining - search_pages * SEARCH_PAGE_TASKS
+        if estimate_run_cost(lookups, 0, use_fallbacks=True) <= available:
+            plan = RunPlan(lookups, True, estimate_run_cost(lookups, search_pages), remaining)
+        else:
+            allowed = max(0, min(lookups, available // PRIMARY_LOOKUP_TASKS))
+            plan = RunPlan(allowed, False, estimate_run_cost(allowed, search_pages, use_fallbacks=False), remaining)
+
+        with self._lock:
+            self._reserve(SEARCH_PAGE_CALLS, search_pages)
+            self._reserve(PRIMARY_LOOKUP_CALLS, plan.lookups_allowed)
+            if plan.use_fallbacks:
+                self._reserve(FALLBACK_LOOKUP_CALLS, plan.lookups_allowed)
+            self.lookups_skipped += lookups - plan.lookups_allowed
+        return plan
+
+    def finish_run(self) -> Dict:
+        """
+        Persist the current run's usage and start counting a new run.
+
+        Tasks reserved by plan_run() but never consumed (cached lookups,
+        searches that stopped early) are released, even if saving fails.
+
+        Returns:
+            The recorded run entry
+        """
+        now = self._clock()
+        with self._lock:
+            self._reserved = {}
+        with self._lock, locked(self.path):
+            run = {
+                'started_at': self._run_started_at,
+                'finished_at': now,
+                'tasks': sum(self._run_calls.values()),
+                'calls': dict(self._run_calls),
+                'lookups_skipped': self.lookups_skipped
+            }
+            # Re-read under the file lock: other runs may have saved since we loaded
+            runs = (self._load() + [run])[-self.max_history:]
+            self._save(runs)
+            self._runs = runs
+            self._run_started_at = now
+            self._run_calls = {}
+            self.lookups_skipped = 0
+            self.exhausted = False
+        return run
+
+    def get_stats(self) -> dict:
+        """Get budget statistics"""
+        average = self.average_run_tasks()
+        return {
+            'path': self.path,
+            'monthly_task_limit': self.monthly_task_limit,
+            'used_this_period': self.used_this_period(),
+            'remaining': self.remaining(),
+            'run_tasks': self.run_tasks(),
+            'lookups_skipped': self.lookups_skipped,
+            'average_run_tasks': round(average, 1) if average is not None else None,
+            'recorded_runs': len(self._runs)
+        }
+
+
+# Global task budget instance
+_task_budget: Optional[TaskBudget] = None
+_task_budget_lock = threading.Lock()
+
+
+def get_task_budget() -> Optional[TaskBudget]:
+    """
+    Get the global task budget, or None if tracking is disabled.
+
+    Configured via environment variables (see TaskBudgetConfig):
+    - TASK_BUDGET_ENABLED: Track Zapier task usage (default: true)
+    - TASK_BUDGET_FILE: History filename inside OUTPUT_DIRECTORY
+    - ZAPIER_MONTHLY_TASK_LIMIT: Tasks per billing period (default: 0, track only)
+    - ZAPIER_BILLING_DAY: Day of month the billing period starts (default: 1)
+    - ZAPIER_TASK_RESERVE: Tasks kept back for other Zaps (default: 0)
+    """
+    global _task_budget
+    if _task_budget is None:
+        with _task_budget_lock:
+            if _task_budget is None:
+                from config import get_config
+                cfg = get_config()
+                if not cfg.task_budget.enabled:
+                    return None
+                _task_budget = TaskBudget(
+                    os.path.join(cfg.output.output_directory, cfg.task_budget.filename),
+                    monthly_task_limit=cfg.task_budget.monthly_task_limit,
+                    billing_day=cfg.task_budget.billing_day,
+                    reserve_tasks=cfg.task_budget.reserve_tasks
+                )
+    return _task_budget
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Slack User Directory Prefetch
+
+Pulls the workspace user directory in bulk (Slack users.list, through the
+Zapier slack_api_request_beta action) and indexes it by user ID and
+username. Profile searches resolve users from the index, so N individual
+users.info round-trips collapse into a handful of users.list pages. Users
+missing from the index still fall back to a per-user lookup.
+
+users.list profiles omit custom profile fields, so a user indexed here
+without a LinkedIn link may still have one in a custom field; profile
+searches look such users up individually too.
+"""
+
+import json
+import threading
+import logging
+from typing import Dict, List, Optional
+from urllib.parse import urlencode
+
+from dual_mode.mcp_adapter import get_mcp_adapter
+
+logger = logging.getLogger(__name__)
+
+USERS_LIST_URL = "https://slack.com/api/users.list"
+
+
+def _slack_payload(result) -> Optional[Dict]:
+    """
+    Unwrap a Slack Web API response from a Zapier API request result.
+
+    The action may return the Slack JSON directly, a JSON string, or the
+    body nested under 'response', 'body' or 'results'.
+    """
+    for _ in range(4):
+        if isinstance(result, str):
+            try:
+                result = json.loads(result)
+            except ValueError:
+                return None
+        if isinstance(result, list):
+            result = result[0] if result else None
+        if not isinstance(result, dict):
+            return None
+        if 'members' in result or 'ok' in result:
+            return result
+        result = result.get('response') or result.get('body') or result.get('results')
+    return None
+
+
+class UserDirectory:
+    """
+    In-memory index of the workspace user directory.
+
+    Features:
+    - Paginated bulk fetch of users.list
+    - Lookups by user ID or username
+    - Lookups made while a prefetch is running wait for it to finish
+    - Safe to share between worker threads
+    """
+
+    def __init__(self, page_size: int = 200):
+        """
+        Initialize user directory.
+
+        Args:
+            page_size: Users requested per users.list page (Slack caps this at 1000)
+        """
+        self.page_size = page_size
+        self._users: Dict[str, Dict] = {}
+        self._ids_by_username: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._prefetched = False
+        self.complete = False
+        self.pages_fetched = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _fetch_page(self, cursor: Optional[str]) -> Optional[Dict]:
+        """Request one users.list page through the MCP adapter"""
+        params = {'limit': self.page_size}
+        if cursor:
+            params['cursor'] = cursor
+        result = get_mcp_adapter().slack_api_request_beta(
+            instructions="List workspace users (users.list) to index their profiles",
+            method="GET",
+            url=f"{USERS_LIST_URL}?{urlencode(params)}"
+        )
+        return _slack_payload(result)
+
+    def _index(self, members: List[Dict]):
+        """Add a page of users to the index"""
+        with self._lock:
+            for member in members:
+                if not isinstance(member, dict) or not member.get('id'):
+                    continue
+                self._users[member['id']] = member
+                if member.get('name'):
+                    self._ids_by_username[member['name'].lower()] = member['id']
+
+    def prefetch(self, max_pages: int = 20) -> int:
+        """
+        Fetch the user directory page by page into the index.
+
+        Runs at most once; concurrent or repeated calls return immediately.
+
+        Args:
+            max_pages: Most users.list pages to fetch (each costs one Zapier task)
+
+        Returns:
+            Number of users indexed
+        """
+        with self._lock:
+            if self._prefetched:
+                return len(self._users)
+            self._prefetched = True
+            self._idle.clear()
+
+        print(f"📇 Prefetching Slack user directory (up to {max_pages} pages of {self.page_size})...")
+        cursor = None
+        try:
+            for _ in range(max_pages):
+                payload = self._fetch_page(cursor)
+                if not payload or not payload.get('ok', True) or 'members' not in payload:
+                    error = payload.get('error') if payload else 'no response'
+                    print(f"⚠️  users.list unavailable ({error}) - profile searches will look users up one by one")
+                    break
+                self._index(payload['members'])
+                self.pages_fetched += 1
+
+                cursor = (payload.get('response_metadata') or {}).get('next_cursor')
+                if not cursor:
+                    self.complete = True
+                    break
+            else:
+                print(f"⚠️  Reached user directory page limit ({max_pages}) - remaining users will be looked up one by one")
+        except Exception as e:
+            logger.warning(f"User directory prefetch failed: {e}")
+            print(f"⚠️  User directory prefetch failed: {e}")
+        finally:
+            self._idle.set()
+
+        print(f"📇 Indexed {len(self._users)} users from {self.pages_fetched} users.list pages")
+        return len(self._users)
+
+    def _wait_for_prefetch(self, timeout: Optional[float]) -> bool:
+        """Wait for a running prefetch; False if the index is not usable yet"""
+        return self._prefetched and self._idle.wait(timeout)
+
+    def get(self, user_id: str, timeout: Optional[float] = None) -> Optional[Dict]:
+        """
+        Look up an indexed user by ID.
+
+        Args:
+            user_id: Slack user ID
+            timeout: Longest to wait for a running prefetch (default: no limit)
+
+        Returns:
+            The users.list member (with its 'profile'), or None if not indexed
+        """
+        if not self._wait_for_prefetch(timeout):
+            return None
+        with self._lock:
+            user = self._users.get(user_id)
+            if user is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return user
+
+    def get_by_username(self, username: str, timeout: Optional[float] = None) -> Optional[Dict]:
+        """Look up an indexed user by username (case-insensitive)"""
+        if not self._wait_for_prefetch(timeout):
+            return None
+        with self._lock:
+            user_id = self._ids_by_username.get(username.lower())
+            return self._users.get(user_id) if user_id else None
+
+    def is_indexed(self, user: Optional[Dict]) -> bool:
+        """Whether a user record came from this index (a partial users.list profile)"""
+        if not isinstance(user, dict):
+            return False
+        with self._lock:
+            return self._users.get(user.get('id')) is user
+
+    def get_stats(self) -> dict:
+        """Get directory statistics"""
+        with self._lock:
+            return {
+                'users': len(self._users),
+                'pages_fetched': self.pages_fetched,
+                'complete': self.complete,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+
+# Global user directory instance
+_user_directory: Optional[UserDirectory] = None
+_user_directory_lock = threading.Lock()
+
+
+def get_user_directory() -> UserDirectory:
+    """Get the global user directory (empty until prefetch() is called)"""
+    global _user_directory
+    if _user_directory is None:
+        with _user_directory_lock:
+            if _user_directory is None:
+                _user_directory = UserDirectory()
+    return _user_directory
@@ -6,20 +6,17 @@ This module handles searching for LinkedIn profiles in Slack user profile detail
 It's called as a fallback when LinkedIn links are not found in message content.
 """
 
-import re
-import signal
-from typing import Optional, Dict
-from dual_mode.mcp_adapter import get_mcp_adapter
-
-# Pre-compile LinkedIn regex patterns for better performance
-_LINKEDIN_PATTERNS = [
-    re.compile(r'<https?://(?:www\.)?linkedin\.com/in/[^>]+>', re.IGNORECASE),
-    re.compile(r'\(https?://(?:www\.)?linkedin\.com/in/[^)]+\)', re.IGNORECASE),
-    re.compile(r'https?://(?:www\.)?linkedin\.com/in/[\w\-\.]+/?(?=\s|$|>|LinkedIn|linkedin)', re.IGNORECASE),
-    re.compile(r'https?://(?:www\.)?linkedin\.com/pub/[\w\-\.]+/?(?=\s|$)', re.IGNORECASE),
-    re.compile(r'linkedin\.com/in/[\w\-\.]+/?(?=\s|$|>)', re.IGNORECASE),
-    re.compile(r'linkedin\.com/pub/[\w\-\.]+/?(?=\s|$|>)', re.IGNORECASE)
-]
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Optional, Dict
+from deadline import Deadline, DeadlineExceeded
+from dual_mode.mcp_adapter import get_mcp_adapter, get_async_mcp_adapter, AsyncMCPAdapter
+from profile_cache import get_profile_cache
+from linkedin_extractor import extract_linkedin_link
+from single_flight import SingleFlight, AsyncSingleFlight
+from user_directory import get_user_directory
 
 # Standard profile fields to check for LinkedIn URLs (as tuple for immutability and performance)
 _STANDARD_PROFILE_FIELDS = (
@@ -27,78 +24,167 @@ _STANDARD_PROFILE_FIELDS = (
     'display_name', 'display_name_normalized', 'real_name', 'email'
 )
 
-def extract_linkedin_link(text: str) -> Optional[str]:
-    """Extract LinkedIn URL from text using pre-compiled regex patterns"""
-    if not text:
-        return None
+# Concurrent requests for the same user share one in-flight call: whole
+# searches by user ID, and MCP user lookups by ID or username
+_profile_searches = SingleFlight("Profile search")
+_user_lookups = SingleFlight("Slack user lookup")
+_async_user_lookups = AsyncSingleFlight()
+
+def _run_into(future: Future, context: contextvars.Context, fn: Callable[..., Any], args, kwargs):
+    """Run fn in a context and settle the future with its result"""
+    try:
+        future.set_result(context.run(fn, *args, **kwargs))
+    except BaseException as e:
+        future.set_exception(e)
+
+def _call_within(deadline: Deadline, fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run a blocking lookup, returning no later than the deadline.
     
-    for pattern in _LINKEDIN_PATTERNS:
-        match = pattern.search(text)
-        if match:
-            url = match.group(0)
-            
-            # Clean up URL by removing angle brackets and parentheses
-            if url.startswith('<') and url.endswith('>'):
-                url = url[1:-1]
-            elif url.startswith('(') and url.endswith(')'):
-                url = url[1:-1]
-            
-            # Ensure URL has protocol and normalize case
-            if not url.startswith('http'):
-                url = 'https://' + url
-            
-            # Normalize to lowercase for consistency
-            url = url.lower()
-            
-            return url
+    The lookup runs on its own daemon thread in the deadline's scope (so
+    adapter retries are bounded by it too). A call that hangs past the
+    deadline is abandoned to that thread and DeadlineExceeded is raised;
+    being a daemon, the thread neither holds up later lookups nor keeps
+    the interpreter from exiting.
+    """
+    deadline.check()
+    with deadline.scope():
+        context = contextvars.copy_context()
+    future = Future()
+    threading.Thread(target=_run_into, args=(future, context, fn, args, kwargs),
+                     name=f"profile-lookup-{getattr(fn, '__name__', 'call')}", daemon=True).start()
+    try:
+        return future.result(timeout=deadline.remaining())
+    except FutureTimeoutError:
+        raise DeadlineExceeded(deadline) from None
+
+def _username_key(username: str) -> str:
+    return f"username:{username.lower()}"
+
+def _check_current_deadline():
+    """Raise DeadlineExceeded if waiting for the user directory used up the search's budget"""
+    deadline = Deadline.current()
+    if deadline is not None:
+        deadline.check()
+
+def _has_linkedin(user: Optional[Dict]) -> bool:
+    """Whether a user record's profile contains a LinkedIn link"""
+    return user is not None and isinstance(user.get('profile'), dict) and bool(_linkedin_from_profile(user['profile']))
+
+def _find_user_by_id(user_id: str, username: Optional[str] = None,
+                     timeout: Optional[float] = None) -> Optional[Dict]:
+    """
+    Look up a user by ID, sharing the MCP call with concurrent lookups.
     
-    return None
+    Users whose prefetched user directory profile has a LinkedIn link are
+    resolved without an MCP call. Others still get users.info, as the
+    directory's users.list profiles omit custom fields. If waiting for the
+    directory used up the current deadline, no call is started. When the
+    username is known the call also answers concurrent username lookups of
+    the same user.
+    """
+    user = get_user_directory().get(user_id, timeout=timeout)
+    if _has_linkedin(user):
+        print(f"📇 Resolved {user_id} from the prefetched user directory")
+        return user
+    _check_current_deadline()
+    
+    mcp = get_mcp_adapter()
+    return _user_lookups.do(
+        f"id:{user_id}",
+        lambda: mcp.slack_find_user_by_id(
+            instructions=f"Get full profile details for user {user_id} to check for LinkedIn URL",
+            user_id=user_id
+        ),
+        aliases=[_username_key(username)] if username else (),
+        timeout=timeout
+    )
 
-class TimeoutError(Exception):
-    """Custom timeout exception"""
-    pass
+def _find_user_by_username(username: str, timeout: Optional[float] = None) -> Optional[Dict]:
+    """Look up a user by username, sharing the MCP call with concurrent lookups (see _find_user_by_id)"""
+    user = get_user_directory().get_by_username(username, timeout=timeout)
+    if _has_linkedin(user):
+        print(f"📇 Resolved {username} from the prefetched user directory")
+        return user
+    _check_current_deadline()
+    
+    mcp = get_mcp_adapter()
+    return _user_lookups.do(
+        _username_key(username),
+        lambda: mcp.slack_find_user_by_username(
+            instructions=f"Get profile details for username {username} to check for LinkedIn URL",
+            username=username
+        ),
+        timeout=timeout
+    )
 
-def timeout_handler(signum, frame):
-    """Signal handler for timeout"""
-    raise TimeoutError("Profile search timed out")
+def _linkedin_from_profile(profile: Dict) -> Optional[str]:
+    """Return the first LinkedIn URL in a profile's standard or custom fields"""
+    for field in _STANDARD_PROFILE_FIELDS:
+        value = profile.get(field, '')
+        if value:
+            linkedin_url = extract_linkedin_link(str(value))
+            if linkedin_url:
+                return linkedin_url
+    
+    for field_data in (profile.get('fields') or {}).values():
+        value = field_data.get('value', '') if isinstance(field_data, dict) else field_data
+        if value:
+            linkedin_url = extract_linkedin_link(str(value))
+            if linkedin_url:
+                return linkedin_url
+    
+    return None
 
-def search_user_profile_for_linkedin(user_id: str, timeout_seconds: int = 30) -> Optional[str]:
+def search_user_profile_for_linkedin(user_id: str, timeout_seconds: int = 30,
+                                     deadline: Optional[Deadline] = None,
+                                     outcome: Optional[Dict] = None,
+                                     use_fallbacks: bool = True,
+                                     username: Optional[str] = None) -> Optional[str]:
     """
     Search for LinkedIn profile in Slack user profile details.
     
     Args:
         user_id: Slack user ID to search
         timeout_seconds: Maximum time to wait for profile search (default: 30)
+        deadline: Enclosing deadline; the search budget never extends past it
+        outcome: Optional dict; 'profile_checked' is set to True once the profile
+            was retrieved, every field scanned and the recent-message fallback
+            finished (a definitive "no LinkedIn"); left unset when the fallback
+            is skipped, fails or runs out of time
+        use_fallbacks: Search the user's recent messages when the profile has
+            no LinkedIn (costs an extra Zapier task)
+        username: The user's username, if known; concurrent username lookups
+            of the same user then share this search's ID lookup
         
     Returns:
         LinkedIn URL if found, None otherwise
         
     Guarantees:
-        - Always returns within timeout_seconds
+        - Returns within timeout_seconds (or the enclosing deadline), even if an MCP call hangs
+        - Safe to call from worker threads and asyncio tasks (no signals)
         - Always prints completion message
-        - Never hangs indefinitely
     """
     search_started = False
     try:
-        # Set up timeout
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(timeout_seconds)
+        # Set up timeout (thread-safe; nested inside any enclosing deadline)
+        search_deadline = Deadline.within(timeout_seconds, name=f"Profile search for {user_id}", parent=deadline)
         search_started = True
         
         print(f"🔍 Searching profile details for user: {user_id}")
         
         # Try to get user profile using Zapier MCP (auto-detected server)
         try:
-            mcp = get_mcp_adapter()
-            result = mcp.slack_find_user_by_id(
-                instructions=f"Get full profile details for user {user_id} to check for LinkedIn URL",
-                user_id=user_id
-            )
+            result = _call_within(search_deadline, _find_user_by_id, user_id, username,
+                                  timeout=search_deadline.remaining())
+            search_deadline.check()
             if result:
                 print(f"✅ Successfully retrieved profile for user {user_id}")
             else:
                 print(f"⚠️  No profile data returned for user {user_id}")
                 return None
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             print(f"⚠️  Error calling MCP function for user {user_id}: {e}")
             return None
@@ -151,17 +237,26 @@ def search_user_profile_for_linkedin(user_id: str, timeout_seconds: int = 30) ->
                     return linkedin_url
         
         print(f"  ❌ No LinkedIn URL found in any profile fields")
+        # users.list profiles lack custom fields, so only a full profile is a definitive "no LinkedIn"
+        profile_checked = not get_user_directory().is_indexed(result)
+        
+        if not use_fallbacks:
+            print(f"💰 Skipping recent-message fallback for {user_id} to save Zapier tasks")
+            print(f"🏁 Profile search completed for {user_id} - No LinkedIn found")
+            return None
         
         # Fallback: Try to get user info from recent messages
         print(f"🔄 Trying fallback: search for recent messages from user {user_id}")
         try:
             mcp = get_mcp_adapter()
-            fallback_result = mcp.slack_find_message(
+            fallback_result = _call_within(
+                search_deadline, mcp.slack_find_message,
                 instructions=f"Find recent messages from user {user_id} to extract profile information",
                 query=f"from:{user_id}",
                 sort_by="timestamp",
                 sort_dir="desc"
             )
+            search_deadline.check()
             
             if fallback_result and 'results' in fallback_result and fallback_result['results']:
                 # Get the most recent message from this user
@@ -169,25 +264,28 @@ def search_user_profile_for_linkedin(user_id: str, timeout_seconds: int = 30) ->
                 user_info = recent_message.get('user', {})
                 if user_info:
                     # Check if we can extract LinkedIn from user's display name or other fields
-                    real_name = user_info.get('real_name', '')
-                    if real_name and 'linkedin' in real_name.lower():
-                        linkedin_match = re.search(r'https?://[^\s]+linkedin[^\s]*', real_name, re.IGNORECASE)
-                        if linkedin_match:
-                            print(f"✅ Found LinkedIn in fallback search: {linkedin_match.group(0)}")
-                            return linkedin_match.group(0)
+                    linkedin_url = extract_linkedin_link(user_info.get('real_name', ''))
+                    if linkedin_url:
+                        print(f"✅ Found LinkedIn in fallback search: {linkedin_url}")
+                        return linkedin_url
                     print(f"ℹ️  Fallback found user info but no LinkedIn in profile fields")
                 else:
                     print(f"ℹ️  Fallback found messages but no user info")
             else:
                 print(f"ℹ️  Fallback: No recent messages found from user {user_id}")
+        except DeadlineExceeded:
+            raise
         except Exception as fallback_error:
             print(f"⚠️  Fallback method also failed: {fallback_error}")
+            profile_checked = False
 
+        if outcome is not None and profile_checked:
+            outcome['profile_checked'] = True
         print(f"🏁 Profile search completed for {user_id} - No LinkedIn found")
         return None
 
-    except TimeoutError:
-        print(f"⏰ Profile search timed out for user {user_id} after {timeout_seconds} seconds")
+    except DeadlineExceeded as e:
+        print(f"⏰ {e}")
         print(f"🏁 Profile search completed for {user_id} - Timed out")
         return None
     except Exception as e:
@@ -195,12 +293,14 @@ def search_user_profile_for_linkedin(user_id: str, timeout_seconds: int = 30) ->
         print(f"🏁 Profile search completed for {user_id} - Error occurred")
         return None
     finally:
-        # Always cancel the alarm and ensure completion message
+        # Always report budget usage and ensure completion message
         if search_started:
-            signal.alarm(0)
-            print(f"✅ Profile search process finished for {user_id}")
+            print(f"✅ Profile search process finished for {user_id} (used {search_deadline.describe_usage()})")
 
-def search_user_profile_for_linkedin_with_fallback(user_id: str, username: str = None, timeout_seconds: int = 45) -> Optional[str]:
+def search_user_profile_for_linkedin_with_fallback(user_id: str, username: str = None, timeout_seconds: int = 45,
+                                                   deadline: Optional[Deadline] = None,
+                                                   outcome: Optional[Dict] = None,
+                                                   use_fallbacks: bool = True) -> Optional[str]:
     """
     Enhanced search for LinkedIn profile with multiple fallback strategies.
     
@@ -208,39 +308,48 @@ def search_user_profile_for_linkedin_with_fallback(user_id: str, username: str =
         user_id: Slack user ID to search
         username: Slack username as fallback
         timeout_seconds: Maximum time to wait for profile search (default: 45)
+        deadline: Enclosing deadline; the search budget never extends past it
+        outcome: Optional dict, filled in as by search_user_profile_for_linkedin
+            once the username search has finished too
+        use_fallbacks: Run the recent-message and username searches after the
+            ID lookup (set False to spend one Zapier task per user)
         
     Returns:
         LinkedIn URL if found, None otherwise
         
     Guarantees:
-        - Always returns within timeout_seconds
+        - Returns within timeout_seconds (or the enclosing deadline), even if an MCP call hangs
+        - Nested searches share this budget instead of overriding it
         - Always prints completion message
-        - Never hangs indefinitely
         - Provides clear feedback to daily intros process
     """
     fallback_started = False
     try:
         # Set up timeout for the entire fallback process
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(timeout_seconds)
+        fallback_deadline = Deadline.within(
+            timeout_seconds, name=f"Comprehensive profile search for {user_id}", parent=deadline
+        )
         fallback_started = True
         
         print(f"🚀 Starting comprehensive profile search for {user_id} (timeout: {timeout_seconds}s)")
         
-        # First try the main profile search
-        linkedin_url = search_user_profile_for_linkedin(user_id, timeout_seconds=30)
+        # First try the main profile search (its 30s budget is capped by ours)
+        search_outcome = {}
+        linkedin_url = search_user_profile_for_linkedin(
+            user_id, timeout_seconds=30, deadline=fallback_deadline, outcome=search_outcome,
+            use_fallbacks=use_fallbacks, username=username
+        )
         if linkedin_url:
             return linkedin_url
+        profile_checked = search_outcome.get('profile_checked', False)
         
         # If no LinkedIn found and we have a username, try searching by username
-        if username and username != user_id:
+        if use_fallbacks and username and username != user_id:
             print(f"🔄 Trying username-based search: {username}")
             try:
-                mcp = get_mcp_adapter()
-                result = mcp.slack_find_user_by_username(
-                    instructions=f"Get profile details for username {username} to check for LinkedIn URL",
-                    username=username
-                )
+                result = _call_within(fallback_deadline, _find_user_by_username, username,
+                                      timeout=fallback_deadline.remaining())
+                fallback_deadline.check()
                 
                 if result and 'profile' in result:
                     profile = result['profile']
@@ -252,14 +361,19 @@ def search_user_profile_for_linkedin_with_fallback(user_id: str, username: str =
                             if linkedin_url:
                                 print(f"✅ Found LinkedIn URL via username search: {linkedin_url}")
                                 return linkedin_url
+            except DeadlineExceeded:
+                raise
             except Exception as e:
                 print(f"⚠️  Username-based search failed: {e}")
+                profile_checked = False
         
+        if outcome is not None and profile_checked:
+            outcome['profile_checked'] = True
         print(f"🏁 Comprehensive profile search completed for {user_id} - No LinkedIn found")
         return None
     
-    except TimeoutError:
-        print(f"⏰ Comprehensive profile search timed out for user {user_id} after {timeout_seconds} seconds")
+    except DeadlineExceeded as e:
+        print(f"⏰ {e}")
         print(f"🏁 Profile search completed for {user_id} - Timed out")
         return None
     except Exception as e:
@@ -267,39 +381,162 @@ def search_user_profile_for_linkedin_with_fallback(user_id: str, username: str =
         print(f"🏁 Profile search completed for {user_id} - Error occurred")
         return None
     finally:
-        # Always cancel the alarm and ensure completion message
+        # Always report budget usage and ensure completion message
         if fallback_started:
-            signal.alarm(0)
-            print(f"✅ Comprehensive profile search process finished for {user_id}")
+            print(f"✅ Comprehensive profile search process finished for {user_id} "
+                  f"(used {fallback_deadline.describe_usage()})")
+
+async def search_user_profile_for_linkedin_async(user_id: str, username: str = None, timeout_seconds: int = 45,
+                                                 adapter: Optional[AsyncMCPAdapter] = None,
+                                                 deadline: Optional[Deadline] = None) -> Optional[str]:
+    """
+    Async profile search that overlaps the ID lookup and the username fallback.
+    
+    Both lookups are issued at once through the AsyncMCPAdapter; the ID-based
+    profile still takes priority when both contain a LinkedIn URL. Each lookup
+    shares its call with concurrent async lookups of the same ID or username
+    (the two lookups of one search are kept separate, as mutual fallbacks).
+    
+    Args:
+        user_id: Slack user ID to search
+        username: Slack username looked up concurrently as fallback
+        timeout_seconds: Maximum time to wait for both lookups (default: 45)
+        adapter: Async adapter to use (default: global async adapter)
+        deadline: Enclosing deadline; the search budget never extends past it
+        
+    Returns:
+        LinkedIn URL if found, None otherwise
+    """
+    adapter = adapter or get_async_mcp_adapter()
+    search_deadline = Deadline.within(timeout_seconds, name=f"Async profile search for {user_id}", parent=deadline)
+    
+    lookups = [_async_user_lookups.do(f"id:{user_id}", lambda: adapter.slack_find_user_by_id(
+        instructions=f"Get full profile details for user {user_id} to check for LinkedIn URL",
+        user_id=user_id
+    ))]
+    if username and username != user_id:
+        lookups.append(_async_user_lookups.do(_username_key(username), lambda: adapter.slack_find_user_by_username(
+            instructions=f"Get profile details for username {username} to check for LinkedIn URL",
+            username=username
+        )))
+    
+    print(f"🔍 Searching profile for {user_id} with {len(lookups)} concurrent lookup(s)")
+    try:
+        # The lookup tasks copy the scoped deadline, which bounds the adapter's retries
+        with search_deadline.scope():
+            gathered = asyncio.gather(*lookups, return_exceptions=True)
+        results = await search_deadline.wait_for(gathered)
+    except DeadlineExceeded as e:
+        print(f"⏰ {e}")
+        return None
+    
+    # Results are in request order, so the ID lookup wins over the username lookup
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"⚠️  Profile lookup failed for {user_id}: {result}")
+        elif isinstance(result, dict) and isinstance(result.get('profile'), dict):
+            linkedin_url = _linkedin_from_profile(result['profile'])
+            if linkedin_url:
+                print(f"✅ Found LinkedIn URL for {user_id}: {linkedin_url} (used {search_deadline.describe_usage()})")
+                return linkedin_url
+    
+    print(f"🏁 Async profile search completed for {user_id} - No LinkedIn found")
+    return None
 
-def safe_profile_search_for_daily_intros(user_id: str, username: str = None) -> Optional[str]:
+def _cache_lookup(user_id: str, username: str = None):
+    """Look up the persistent profile cache, treating cache failures as a miss"""
+    try:
+        cache = get_profile_cache()
+        return cache.get(user_id, username) if cache is not None else None
+    except Exception as e:
+        print(f"⚠️  Profile cache lookup failed for {user_id}: {e}")
+        return None
+
+def _cache_store(user_id: str, username: str, linkedin_url: Optional[str]):
+    """Write a lookup result to the persistent profile cache (best effort)"""
+    try:
+        cache = get_profile_cache()
+        if cache is not None:
+            cache.put(user_id, username, linkedin_url)
+    except Exception as e:
+        print(f"⚠️  Profile cache update failed for {user_id}: {e}")
+
+def _search_and_cache(user_id: str, username: Optional[str], deadline: Optional[Deadline],
+                      use_fallbacks: bool) -> Optional[str]:
+    """Run the full profile search and cache a definitive result (never one cut short by the deadline or budget)"""
+    # Use a maximum timeout of 60 seconds as absolute safety net
+    outcome = {}
+    result = search_user_profile_for_linkedin_with_fallback(
+        user_id, 
+        username, 
+        timeout_seconds=60,
+        deadline=deadline,
+        outcome=outcome,
+        use_fallbacks=use_fallbacks
+    )
+    
+    # Only cache definitive answers, never errors or timeouts
+    if result or outcome.get('profile_checked'):
+        _cache_store(user_id, username, result)
+    return result
+
+def _search_key(user_id: str, deadline: Optional[Deadline], use_fallbacks: bool) -> str:
+    """
+    Single-flight key of a whole search.
+    
+    Only searches with the same settings share a result: a caller that may
+    not spend tasks on fallbacks never waits on (or is charged for) one that
+    does, and callers under different enclosing deadlines never inherit
+    each other's timeouts.
+    """
+    scope = f"deadline-{id(deadline)}" if deadline is not None else "no-deadline"
+    return f"{user_id}:{'fallbacks' if use_fallbacks else 'primary'}:{scope}"
+
+def safe_profile_search_for_daily_intros(user_id: str, username: str = None,
+                                        deadline: Optional[Deadline] = None,
+                                        use_fallbacks: bool = True) -> Optional[str]:
     """
     Safe wrapper for profile search that guarantees completion for daily intros process.
     
     This function provides an additional safety net to ensure the daily intros process
-    never hangs waiting for profile search results.
+    never hangs waiting for profile search results. The persistent profile cache is
+    consulted before any MCP call, and definitive results are written back to it.
+    Concurrent searches for the same user with the same settings share one
+    search and its result.
     
     Args:
         user_id: Slack user ID to search
         username: Slack username as fallback
+        deadline: Enclosing deadline; the search budget never extends past it
+        use_fallbacks: Allow fallback searches after the ID lookup (False when
+            the Zapier task budget is tight)
         
     Returns:
         LinkedIn URL if found, None otherwise
         
     Guarantees:
-        - Always returns within 60 seconds maximum
+        - Returns within 60 seconds (or the enclosing deadline), even if an MCP call hangs
         - Always prints completion message
-        - Never hangs indefinitely
+        - Safe to call from worker threads
         - Provides clear feedback to daily intros process
     """
     print(f"🛡️  Starting SAFE profile search for {user_id}")
     
     try:
-        # Use a maximum timeout of 60 seconds as absolute safety net
-        result = search_user_profile_for_linkedin_with_fallback(
-            user_id, 
-            username, 
-            timeout_seconds=60
+        # Skip the MCP round-trips entirely for users looked up on a recent run
+        cached = _cache_lookup(user_id, username)
+        if cached is not None:
+            if cached.linkedin_url:
+                print(f"💾 Cached LinkedIn for {user_id}: {cached.linkedin_url}")
+            else:
+                print(f"💾 Cached result for {user_id}: No LinkedIn in profile")
+            return cached.linkedin_url
+        
+        # Duplicate intros from the same user share one in-flight search
+        result = _profile_searches.do(
+            _search_key(user_id, deadline, use_fallbacks),
+            lambda: _search_and_cache(user_id, username, deadline, use_fallbacks),
+            timeout=deadline.remaining() if deadline is not None else None
         )
         
         if result:
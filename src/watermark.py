@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Run Watermarks
+
+Records, per Slack channel, the newest message a successful run processed
+(its ts_time and message ID) in a small JSON sidecar next to the reports.
+The next run reads its cutoff from here in O(1) instead of scanning the
+report directory and regex-parsing the latest markdown report.
+
+Before the first watermark is recorded, the newest message in the report
+index (see report_index) seeds it once.
+"""
+
+import json
+import os
+import threading
+import time
+import logging
+from typing import Callable, Dict, NamedTuple, Optional
+
+from atomic_file import locked, write_json
+
+logger = logging.getLogger(__name__)
+
+
+class Watermark(NamedTuple):
+    """Newest message processed for a channel"""
+    ts: str  # ts_time of the message (ISO 8601, e.g. 2025-09-18T10:00:00.000Z)
+    message_id: str  # Slack message ts, or the permalink if unavailable
+    updated_at: float
+
+
+class WatermarkStore:
+    """
+    Persistent per-channel watermarks.
+
+    Features:
+    - O(1) reads from a small JSON file (loaded once)
+    - Watermarks only move forward
+    - Atomic writes with owner-only permissions
+    - Updates are serialized across threads and processes by a file lock
+    """
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time):
+        """
+        Initialize watermark store.
+
+        Args:
+            path: JSON file holding the watermarks (created on first advance)
+            clock: Wall-clock time source (injectable for testing)
+        """
+        self.path = path
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._channels: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        """Read the watermarks, treating a missing or corrupt file as empty"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                channels = json.load(f).get('channels', {})
+            return {name: entry for name, entry in channels.items()
+                    if isinstance(entry, dict) and entry.get('ts')}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Watermark file unreadable, starting fresh: {e}")
+            return {}
+
+    def _save(self, channels: Dict[str, Dict]):
+        """Write the watermarks atomically with owner-only permissions"""
+        write_json(self.path, {'version': 1, 'channels': channels})
+
+    def get(self, channel: str) -> Optional[Watermark]:
+        """Get the watermark for a channel, or None if no run has recorded one"""
+        with self._lock:
+            entry = self._channels.get(channel)
+        if entry is None:
+            return None
+        return Watermark(entry['ts'], entry.get('message_id', ''), entry.get('updated_at', 0.0))
+
+    def advance(self, channel: str, ts: str, message_id: str = '') -> bool:
+        """
+        Move a channel's watermark forward to a newer message and persist it.
+
+        Args:
+            channel: Slack channel name
+            ts: ts_time of the newest processed message
+            message_id: Slack message ts (or permalink) of that message
+
+        Returns:
+            True if the watermark moved, False if ts is not newer than the stored one
+        """
+        with self._lock, locked(self.path):
+            # Re-read under the file lock: another run may have saved since we loaded
+            channels = self._load()
+            current = channels.get(channel)
+            if current is not None and current['ts'] >= ts:
+                self._channels = channels
+                return False
+            channels[channel] = {'ts': ts, 'message_id': message_id, 'updated_at': self._clock()}
+            self._save(channels)
+            self._channels = channels
+        return True
+
+
+# Global watermark store instance
+_watermark_store: Optional[WatermarkStore] = None
+_watermark_store_lock = threading.Lock()
+
+
+def get_watermark_store() -> WatermarkStore:
+    """
+    Get the global watermark store.
+
+    Configured via environment variables:
+    - OUTPUT_DIRECTORY: Directory holding the reports and the watermark file
+    - WATERMARK_FILE: Watermark filename inside OUTPUT_DIRECTORY (default: watermark.json)
+    """
+    global _watermark_store
+    if _watermark_store is None:
+        with _watermark_store_lock:
+            if _watermark_store is None:
+                from config import get_config
+                cfg = get_config()
+                _watermark_store = WatermarkStore(
+                    os.path.join(cfg.output.output_directory, cfg.output.watermark_filename)
+                )
+    return _watermark_store
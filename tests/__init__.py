@@ -1 +1,14 @@
 # Test package for Slack Intro Bot
+#
+# Put the source directories ahead of the project root, so that test modules
+# import src/daily_intros.py rather than the root-level entry point shim, and
+# the security and dual_mode modules resolve the way they do when the bot runs.
+import os
+import sys
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+for _path in ('src/dual_mode', 'src/security', 'src'):
+    _path = os.path.join(_PROJECT_ROOT, _path)
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
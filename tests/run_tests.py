@@ -17,14 +17,14 @@ def run_tests():
     print("🧪 Starting Slack Intro Bot Test Suite")
     print("=" * 50)
     
-    # Add project root to Python path
-    project_root = Path(__file__).parent
+    # Add project root to Python path (importing the tests package adds src/)
+    project_root = Path(__file__).parent.parent
     sys.path.insert(0, str(project_root))
     
     # Discover and run tests
     loader = unittest.TestLoader()
     start_dir = project_root / 'tests'
-    suite = loader.discover(start_dir, pattern='test_*.py')
+    suite = loader.discover(start_dir, pattern='test_*.py', top_level_dir=str(project_root))
     
     # Run tests with detailed output
     runner = unittest.TextTestRunner(
@@ -55,7 +55,7 @@ def run_tests():
     if result.errors:
         print("\n🚨 Test Errors:")
         for test, traceback in result.errors:
-            print(f"  - {test}: {traceback.split('\\n')[-2].strip()}")
+            print(f"  - {test}: {traceback.splitlines()[-1].strip()}")
     
     # Success/failure status
     if result.wasSuccessful():
@@ -96,8 +96,8 @@ def run_specific_test(test_name):
     """Run a specific test module"""
     print(f"🎯 Running specific test: {test_name}")
     
-    # Add project root to Python path
-    project_root = Path(__file__).parent
+    # Add project root to Python path (importing the tests package adds src/)
+    project_root = Path(__file__).parent.parent
     sys.path.insert(0, str(project_root))
     
     # Load specific test
@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Test suite for the daily intros pipeline
+"""
+
+import unittest
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from io import StringIO
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import daily_intros
+from daily_intros import iter_message_pages, get_messages_for_timestamp_range, MessageFetchError
+from config import SlackConfig
+from task_budget import RunPlan, TaskBudget
+from watermark import WatermarkStore
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+def _raw_message(n):
+    """Build a Zapier-style search result"""
+    return {
+        'user': {'id': f'U{n:03d}', 'real_name': f'User {n}', 'name': f'user{n}'},
+        'raw_text': f'Hi everyone, I am user {n}',
+        'ts_time': f'2025-09-18T10:00:{n:02d}.000Z',
+        'permalink': f'https://slack.example/p{n}',
+    }
+
+
+def _no_reports():
+    """A report index with nothing reported yet"""
+    index = MagicMock()
+    index.partition.side_effect = lambda intros, exclude_report=None: (intros, [])
+    return index
+
+
+class TestMessagePagination(unittest.TestCase):
+    """Test streaming, paginated message fetch"""
+
+    def _adapter(self, responses):
+        adapter = MagicMock()
+        adapter.slack_find_message.side_effect = responses
+        return adapter
+
+    def test_follows_cursor_pagination(self):
+        """Each page is yielded separately and the cursor is passed on"""
+        adapter = self._adapter([
+            {'results': [_raw_message(1), _raw_message(2)], 'response_metadata': {'next_cursor': 'abc'}},
+            {'results': [_raw_message(3)], 'response_metadata': {'next_cursor': ''}},
+        ])
+        with patch.object(daily_intros, 'get_mcp_adapter', return_value=adapter):
+            pages = list(iter_message_pages('2025-09-18T00:00:00.000Z', max_pages=5))
+
+        self.assertEqual([len(page) for page in pages], [2, 1])
+        self.assertEqual(pages[0][0]['user']['id'], 'U001')
+        self.assertEqual(pages[0][0]['text'], 'Hi everyone, I am user 1')
+        self.assertNotIn('cursor', adapter.slack_find_message.call_args_list[0].kwargs)
+        self.assertEqual(adapter.slack_find_message.call_args_list[1].kwargs['cursor'], 'abc')
+
+    def test_follows_page_numbers(self):
+        """Page-based paging metadata is followed until the last page"""
+        adapter = self._adapter([
+            {'results': [_raw_message(1)], 'paging': {'page': 1, 'pages': 2}},
+            {'results': [_raw_message(2)], 'paging': {'page': 2, 'pages': 2}},
+        ])
+        with patch.object(daily_intros, 'get_mcp_adapter', return_value=adapter):
+            pages = list(iter_message_pages('2025-09-18T00:00:00.000Z', max_pages=5))
+
+        self.assertEqual(len(pages), 2)
+        self.assertEqual(adapter.slack_find_message.call_args_list[1].kwargs['page'], 2)
+
+    def test_stops_at_page_limit_and_repeated_cursor(self):
+        """Runaway pagination is bounded"""
+        looping = {'results': [_raw_message(1)], 'response_metadata': {'next_cursor': 'same'}}
+        adapter = self._adapter([looping] * 10)
+        with patch.object(daily_intros, 'get_mcp_adapter', return_value=adapter):
+            pages = list(iter_message_pages('2025-09-18T00:00:00.000Z', max_pages=5))
+        self.assertEqual(len(pages), 2)
+
+        adapter = self._adapter([
+            {'results': [_raw_message(n)], 'response_metadata': {'next_cursor': f'c{n}'}} for n in range(10)
+        ])
+        outcome = {}
+        with patch.object(daily_intros, 'get_mcp_adapter', return_value=adapter):
+            pages = list(iter_message_pages('2025-09-18T00:00:00.000Z', max_pages=3, outcome=outcome))
+        self.assertEqual(len(pages), 3)
+        self.assertTrue(outcome['truncated'])
+
+    def test_last_page_within_limit_is_not_truncated(self):
+        """Fetching every page, even exactly max_pages of them, is not reported as truncated"""
+        adapter = self._adapter([
+            {'results': [_raw_message(1)], 'response_metadata': {'next_cursor': 'abc'}},
+            {'results': [_raw_message(2)], 'response_metadata': {'next_cursor': ''}},
+        ])
+        outcome = {}
+        with patch.object(daily_intros, 'get_mcp_adapter', return_value=adapter):
+            list(iter_message_pages('2025-09-18T00:00:00.000Z', max_pages=2, outcome=outcome))
+        self.assertNotIn('truncated', outcome)
+
+    def test_filters_exact_timestamp_range(self):
+        """Messages outside the cutoff and end bounds never reach the caller"""
+        adapter = self._adapter([
+            {'results': [_raw_message(n) for n in (9, 5, 3)], 'response_metadata': {'next_cursor': 'abc'}},
+            {'results': [_raw_message(n) for n in (2, 1)], 'response_metadata': {'next_cursor': 'def'}},
+        ])
+        with patch.object(daily_intros, 'get_mcp_adapter', return_value=adapter):
+            pages = list(iter_message_pages('2025-09-18T10:00:03.000Z', '2025-09-18T10:00:05.000Z', max_pages=5))
+
+        # Strictly after the cutoff, up to and including the end timestamp
+        self.assertEqual([m['ts_time'] for m in pages[0]], ['2025-09-18T10:00:05.000Z'])
+        # The second page is entirely before the cutoff, so paging stops there
+        self.assertEqual((len(pages), adapter.slack_find_message.call_count), (1, 2))
+
+        in_range = daily_intros.message_time_filter('2025-09-17T23:00:00.000Z', '2025-09-18')
+        self.assertEqual([in_range({'ts_time': ts}) for ts in
+                          ('2025-09-17T22:59:59.000Z', '2025-09-18T23:59:59.999Z', '2025-09-19T00:00:00.000Z')],
+                         [False, True, False])
+
+    def test_quota_error_raises(self):
+        """A None result from the adapter is reported as a quota error"""
+        adapter = self._adapter([None])
+        with patch.object(daily_intros, 'get_mcp_adapter', return_value=adapter):
+            with self.assertRaises(MessageFetchError) as ctx:
+                list(iter_message_pages('2025-09-18T00:00:00.000Z', max_pages=5))
+        self.assertIn('Insufficient Tasks', str(ctx.exception))
+
+    def test_collecting_wrapper(self):
+        """get_messages_for_timestamp_range keeps its (messages, error) contract"""
+        adapter = self._adapter([
+            {'results': [_raw_message(1)], 'response_metadata': {'next_cursor': 'abc'}},
+            None,
+        ])
+        with patch.object(daily_intros, 'get_mcp_adapter', return_value=adapter), \
+                patch.object(daily_intros, 'iter_message_pages',
+                             lambda *a, **kw: iter_message_pages(*a, max_pages=5, **kw)):
+            messages, error = get_messages_for_timestamp_range('2025-09-18T00:00:00.000Z')
+        self.assertEqual(messages, [])
+        self.assertIn('Insufficient Tasks', error)
+
+
+class TestBatchParsing(unittest.TestCase):
+    """Test page-at-a-time intro parsing"""
+
+    def test_filters_before_sanitizing(self):
+        """Only intro messages reach the security manager, in one batch"""
+        page = [_raw_message(1), {'user': {'id': 'U9'}, 'text': 'Quarterly numbers attached'}, _raw_message(2)]
+        security = daily_intros._get_cached_security_manager()
+
+        with patch.object(security, 'validate_and_sanitize_batch',
+                          wraps=security.validate_and_sanitize_batch) as batch:
+            records = daily_intros.parse_intro_messages(page)
+
+        batch.assert_called_once()
+        self.assertEqual(len(batch.call_args[0][0]), 2)
+        self.assertEqual([r['user_id'] for r in records], ['U001', 'U002'])
+        self.assertEqual(records[0]['first_name'], 'User')
+        self.assertFalse(records[0]['profile_checked'])
+
+    def test_matches_single_message_parser(self):
+        """Batch records are identical to parsing messages one at a time"""
+        page = [_raw_message(n) for n in range(1, 4)]
+        page[1]['raw_text'] += ' https://linkedin.com/in/user2'
+        self.assertEqual(daily_intros.parse_intro_messages(page),
+                         [daily_intros.parse_intro_message(m) for m in page])
+        self.assertEqual(daily_intros.parse_intro_messages([]), [])
+
+
+class TestConcurrentProfileSearch(unittest.TestCase):
+    """Test the concurrent Phase 2 of main()"""
+
+    def test_results_merged_in_original_order(self):
+        """Slow and fast lookups overlap but land on the right intro"""
+        pages = [[daily_intros.normalize_message(_raw_message(n)) for n in (1, 2)],
+                 [daily_intros.normalize_message(_raw_message(3))]]
+        delays = {'U001': 0.2, 'U002': 0.0, 'U003': 0.1}
+
+        def fake_search(user_id, username, use_fallbacks=True):
+            time.sleep(delays[user_id])
+            return None if user_id == 'U002' else f'https://linkedin.com/in/{username}'
+
+        saved = {}
+
+        def fake_save(welcome_messages, **kwargs):
+            saved['intros'] = [intro for intro, _ in welcome_messages]
+            return 'report.md'
+
+        slack_config = SlackConfig()
+        slack_config.profile_search_workers = 3
+        with patch.object(sys, 'argv', ['daily_intros.py']), \
+                patch.object(daily_intros, '_get_cached_config', return_value=SimpleNamespace(slack=slack_config)), \
+                patch.object(daily_intros, 'get_cutoff_timestamp', return_value='2025-09-18T00:00:00.000Z'), \
+                patch.object(daily_intros, 'iter_message_pages', return_value=iter(pages)), \
+                patch.object(daily_intros, 'safe_profile_search_for_daily_intros', side_effect=fake_search), \
+                patch.object(daily_intros, 'get_task_budget', return_value=None), \
+                patch.object(daily_intros, 'generate_welcome_message', return_value='Welcome!'), \
+                patch.object(daily_intros, 'save_daily_intro_report', side_effect=fake_save), \
+                patch.object(daily_intros, 'get_report_index', return_value=_no_reports()), \
+                patch.object(daily_intros, 'get_watermark_store') as get_store:
+            daily_intros.main()
+
+        self.assertEqual([intro['username'] for intro in saved['intros']], ['user1', 'user2', 'user3'])
+        self.assertEqual([intro['linkedin_link'] for intro in saved['intros']],
+                         ['https://linkedin.com/in/user1', None, 'https://linkedin.com/in/user3'])
+        # The newest fetched message becomes the channel watermark
+        get_store.return_value.advance.assert_called_once_with(
+            'intros', '2025-09-18T10:00:03.000Z', 'https://slack.example/p3')
+
+    def test_page_limit_keeps_the_watermark(self):
+        """A fetch stopped by the page limit does not move the watermark past the messages it missed"""
+        adapter = MagicMock()
+        adapter.slack_find_message.side_effect = [
+            {'results': [_raw_message(n)], 'response_metadata': {'next_cursor': f'c{n}'}} for n in (9, 8, 7)
+        ]
+        slack_config = SlackConfig()
+        slack_config.max_search_pages = 2
+        store = MagicMock()
+        with patch.object(sys, 'argv', ['daily_intros.py']), \
+                patch.object(daily_intros, '_get_cached_config', return_value=SimpleNamespace(slack=slack_config)), \
+                patch.object(daily_intros, 'get_cutoff_timestamp', return_value='2025-09-18T00:00:00.000Z'), \
+                patch.object(daily_intros, 'get_mcp_adapter', return_value=adapter), \
+                patch.object(daily_intros, 'safe_profile_search_for_daily_intros', return_value=None), \
+                patch.object(daily_intros, 'get_task_budget', return_value=None), \
+                patch.object(daily_intros, 'generate_welcome_message', return_value='Welcome!'), \
+                patch.object(daily_intros, 'save_daily_intro_report', return_value='report.md'), \
+                patch.object(daily_intros, 'get_report_index', return_value=_no_reports()), \
+                patch.object(daily_intros, 'get_watermark_store', return_value=store):
+            daily_intros.main()
+
+        self.assertEqual(adapter.slack_find_message.call_count, 2)
+        store.advance.assert_not_called()
+
+    def test_phase_two_shares_one_deadline(self):
+        """A hung search uses up the phase budget once; queued searches are reported as never started"""
+        pages = [[daily_intros.normalize_message(_raw_message(n)) for n in (1, 2, 3)]]
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def fake_search(user_id, username, use_fallbacks=True):
+            if user_id == 'U002':
+                release.wait()
+            return f'https://linkedin.com/in/{username}'
+
+        saved = {}
+
+        def fake_save(welcome_messages, **kwargs):
+            saved['links'] = [intro['linkedin_link'] for intro, _ in welcome_messages]
+            return 'report.md'
+
+        slack_config = SlackConfig()
+        slack_config.profile_search_workers = 1
+        slack_config.safe_wrapper_timeout = 1
+        start = time.monotonic()
+        with patch.object(sys, 'argv', ['daily_intros.py']), \
+                patch.object(sys, 'stdout', new_callable=StringIO) as output, \
+                patch.object(daily_intros, '_get_cached_config', return_value=SimpleNamespace(slack=slack_config)), \
+                patch.object(daily_intros, 'get_cutoff_timestamp', return_value='2025-09-18T00:00:00.000Z'), \
+                patch.object(daily_intros, 'iter_message_pages', return_value=iter(pages)), \
+                patch.object(daily_intros, 'safe_profile_search_for_daily_intros', side_effect=fake_search), \
+                patch.object(daily_intros, 'get_task_budget', return_value=None), \
+                patch.object(daily_intros, 'generate_welcome_message', return_value='Welcome!'), \
+                patch.object(daily_intros, 'save_daily_intro_report', side_effect=fake_save), \
+                patch.object(daily_intros, 'get_report_index', return_value=_no_reports()), \
+                patch.object(daily_intros, 'get_watermark_store'):
+            daily_intros.main()
+
+        self.assertLess(time.monotonic() - start, 1.8)
+        self.assertEqual(saved['links'], ['https://linkedin.com/in/user1', None, None])
+        self.assertIn('Profile search for U002 did not finish', output.getvalue())
+        self.assertIn('Profile search for U003 never started', output.getvalue())
+        self.assertIn('1 searches timed out, 1 never started', output.getvalue())
+
+    def test_tight_task_budget_limits_lookups(self):
+        """A tight Zapier budget skips fallbacks and the lookups that do not fit"""
+        pages = [[daily_intros.normalize_message(_raw_message(n)) for n in (1, 2, 3)]]
+        budget = MagicMock()
+        budget.remaining.return_value = 3
+        budget.average_run_tasks.return_value = None
+        budget.plan_run.return_value = RunPlan(2, False, 3, 3)
+        budget.finish_run.return_value = {'tasks': 2, 'lookups_skipped': 1}
+        search = MagicMock(return_value=None)
+
+        with patch.object(sys, 'argv', ['daily_intros.py']), \
+                patch.object(daily_intros, 'get_cutoff_timestamp', return_value='2025-09-18T00:00:00.000Z'), \
+                patch.object(daily_intros, 'iter_message_pages', return_value=iter(pages)), \
+                patch.object(daily_intros, 'safe_profile_search_for_daily_intros', search), \
+                patch.object(daily_intros, 'get_task_budget', return_value=budget), \
+                patch.object(daily_intros, 'generate_welcome_message', return_value='Welcome!'), \
+                patch.object(daily_intros, 'save_daily_intro_report', return_value='report.md'), \
+                patch.object(daily_intros, 'get_report_index', return_value=_no_reports()), \
+                patch.object(daily_intros, 'get_watermark_store'):
+            daily_intros.main()
+
+        budget.plan_run.assert_called_once_with(3, search_pages=1)
+        self.assertEqual([c.args[0] for c in search.call_args_list], ['U001', 'U002'])
+        self.assertTrue(all(c.kwargs == {'use_fallbacks': False} for c in search.call_args_list))
+        budget.finish_run.assert_called_once_with()
+
+    def test_task_reservation_is_released_after_the_run(self):
+        """Cached lookups consume no tasks, and a failed run does not keep its reservation either"""
+        test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, test_dir)
+        budget = TaskBudget(os.path.join(test_dir, 'task_budget.json'), monthly_task_limit=50)
+        page = [daily_intros.normalize_message(_raw_message(n)) for n in (1, 2)]
+
+        def failing_pages(*args, **kwargs):
+            yield page
+            raise RuntimeError('connection lost')
+
+        for pages, failure in ((iter([page]), None), (failing_pages(), RuntimeError)):
+            with patch.object(sys, 'argv', ['daily_intros.py']), \
+                    patch.object(daily_intros, 'get_cutoff_timestamp', return_value='2025-09-18T00:00:00.000Z'), \
+                    patch.object(daily_intros, 'iter_message_pages', return_value=pages), \
+                    patch.object(daily_intros, 'safe_profile_search_for_daily_intros', return_value=None), \
+                    patch.object(daily_intros, 'get_task_budget', return_value=budget), \
+                    patch.object(daily_intros, 'generate_welcome_message', return_value='Welcome!'), \
+                    patch.object(daily_intros, 'save_daily_intro_report', return_value='report.md'), \
+                    patch.object(daily_intros, 'get_report_index', return_value=_no_reports()), \
+                    patch.object(daily_intros, 'get_watermark_store'):
+                if failure:
+                    with self.assertRaises(failure):
+                        daily_intros.main()
+                else:
+                    daily_intros.main()
+            self.assertEqual(budget.remaining(), 50)
+        self.assertEqual(budget.average_run_tasks(), 0)
+
+
+class TestRunDeduplication(unittest.TestCase):
+    """Test that main() skips intros an earlier report already contains"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir)
+        previous_cwd = os.getcwd()
+        os.chdir(self.test_dir)
+        self.addCleanup(os.chdir, previous_cwd)
+        earlier = daily_intros.normalize_message(_raw_message(1))
+        daily_intros.save_daily_intro_report([(daily_intros.parse_intro_messages([earlier])[0], 'Welcome!')],
+                                             output_date='2025-09-17')
+
+    def _run(self, argv):
+        pages = [[daily_intros.normalize_message(_raw_message(n)) for n in (1, 2)]]
+        search = MagicMock(return_value=None)
+
+        with patch.object(sys, 'argv', ['daily_intros.py'] + argv), \
+                patch.object(daily_intros, '_get_cached_config', return_value=SimpleNamespace(slack=SlackConfig())), \
+                patch.object(daily_intros, 'iter_message_pages', return_value=iter(pages)), \
+                patch.object(daily_intros, 'safe_profile_search_for_daily_intros', search), \
+                patch.object(daily_intros, 'get_task_budget', return_value=None), \
+                patch.object(daily_intros, 'generate_welcome_message', return_value='Welcome!'), \
+                patch.object(daily_intros, 'get_watermark_store'):
+            filename = daily_intros.main()
+        entry = daily_intros.get_report_index().get(os.path.basename(filename))
+        return [intro['user_id'] for intro in entry['intros']], [c.args[0] for c in search.call_args_list]
+
+    def test_reported_intros_are_skipped(self):
+        """Only new intros are looked up and reported; a rerun of the same date keeps them"""
+        self.assertEqual(self._run(['2025-09-18', '', '2025-09-18']), (['U002'], ['U002']))
+        self.assertEqual(self._run(['2025-09-18', '', '2025-09-18']), (['U002'], ['U002']))
+        self.assertEqual(self._run(['2025-09-18', '', '2025-09-19']), ([], []))
+
+    def test_include_seen_reports_everything(self):
+        """--include-seen reports and looks up already reported intros too"""
+        self.assertEqual(self._run(['--include-seen', '2025-09-18', '', '2025-09-18']),
+                         (['U001', 'U002'], ['U001', 'U002']))
+
+
+class TestSameDayRerun(unittest.TestCase):
+    """Test that rerunning main() for the same report date keeps earlier intros"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir)
+        previous_cwd = os.getcwd()
+        os.chdir(self.test_dir)
+        self.addCleanup(os.chdir, previous_cwd)
+        self.channel = []
+        self.store = WatermarkStore(os.path.join(self.test_dir, 'watermark.json'))
+
+    def _fetch(self, start_timestamp, end_date=None, outcome=None):
+        in_range = daily_intros.message_time_filter(start_timestamp, end_date)
+        messages = [message for message in self.channel if in_range(message)]
+        return iter([messages] if messages else [])
+
+    def _run(self):
+        with patch.object(sys, 'argv', ['daily_intros.py', 'auto', '', '2025-09-18']), \
+                patch.object(daily_intros, '_get_cached_config', return_value=SimpleNamespace(slack=SlackConfig())), \
+                patch.object(daily_intros, 'iter_message_pages', side_effect=self._fetch), \
+                patch.object(daily_intros, 'safe_profile_search_for_daily_intros', return_value=None), \
+                patch.object(daily_intros, 'get_task_budget', return_value=None), \
+                patch.object(daily_intros, 'generate_welcome_message', return_value='Welcome!'), \
+                patch.object(daily_intros, 'get_watermark_store', return_value=self.store):
+            return daily_intros.main()
+
+    def test_rerun_keeps_intros_from_the_first_run(self):
+        """The second run re-covers the report's window instead of only newer messages"""
+        self.channel.append(daily_intros.normalize_message(_raw_message(1)))
+        filename = self._run()
+        self.channel.append(daily_intros.normalize_message(_raw_message(2)))
+        self.assertEqual(self._run(), filename)
+
+        with open(filename, encoding='utf-8') as f:
+            report = f.read()
+        self.assertIn('@user1', report)
+        self.assertIn('@user2', report)
+        self.assertEqual(self.store.get('intros').ts, '2025-09-18T10:00:02.000Z')
+
+
+class TestCliExit(unittest.TestCase):
+    """Test that the command line entry point does not wait for abandoned searches"""
+
+    def _run(self, main_body):
+        script = (
+            "import sys, threading\n"
+            "from concurrent.futures import ThreadPoolExecutor\n"
+            "import daily_intros\n"
+            "def main():\n"
+            "    ThreadPoolExecutor(max_workers=1).submit(threading.Event().wait)  # A search that never returns\n"
+            f"    {main_body}\n"
+            "daily_intros.main = main\n"
+            "daily_intros.run_cli()\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+            os.path.join(SRC_DIR, path) for path in ('', 'security', 'dual_mode')))
+        start = time.monotonic()
+        result = subprocess.run([sys.executable, '-c', script], env=env,
+                                capture_output=True, text=True, timeout=30)
+        return result, time.monotonic() - start
+
+    def test_exits_after_the_report_with_a_hung_search(self):
+        """A worker stuck in a call that never returns does not keep the process alive"""
+        result, elapsed = self._run("print('report written')")
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn('report written', result.stdout)
+        self.assertIn('abandoned worker thread', result.stdout)
+        self.assertLess(elapsed, 20)
+
+    def test_failed_run_still_reports_its_error(self):
+        """A run that fails with a search still hung exits non-zero with its traceback"""
+        result, _ = self._run("raise RuntimeError('connection lost')")
+        self.assertEqual(result.returncode, 1)
+        self.assertIn('RuntimeError: connection lost', result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
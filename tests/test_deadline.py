@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test suite for thread-safe deadlines
+"""
+
+import asyncio
+import threading
+import unittest
+import os
+import sys
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from deadline import Deadline, DeadlineExceeded
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDeadline(unittest.TestCase):
+    """Test deadline budgets, nesting and cancellation"""
+
+    def test_budget_and_usage(self):
+        """Remaining time and usage reporting follow the clock"""
+        clock = FakeClock()
+        deadline = Deadline(30, name="search", clock=clock)
+        clock.now += 12
+
+        self.assertAlmostEqual(deadline.remaining(), 18)
+        usage = deadline.usage()
+        self.assertEqual(usage['name'], "search")
+        self.assertEqual(usage['consumed_percent'], 40.0)
+        self.assertFalse(usage['expired'])
+
+        clock.now += 20
+        self.assertTrue(deadline.expired())
+        with self.assertRaises(DeadlineExceeded):
+            deadline.check()
+
+    def test_child_cannot_outlive_parent(self):
+        """A nested 30s budget inside a 10s budget expires with the parent"""
+        clock = FakeClock()
+        outer = Deadline(10, clock=clock)
+        inner = outer.child(30)
+
+        self.assertTrue(inner.bounded_by_parent)
+        clock.now += 10
+        self.assertTrue(inner.expired())
+
+        # A shorter child keeps its own budget
+        outer = Deadline(60, clock=clock)
+        inner = outer.child(5)
+        self.assertFalse(inner.bounded_by_parent)
+        self.assertAlmostEqual(inner.remaining(), 5)
+
+    def test_cancellation_propagates(self):
+        """Cancelling a parent cancels its children"""
+        outer = Deadline(60)
+        inner = outer.child(30)
+        outer.cancel()
+
+        self.assertTrue(inner.cancelled())
+        self.assertEqual(inner.remaining(), 0.0)
+        with self.assertRaises(DeadlineExceeded) as ctx:
+            inner.check()
+        self.assertIn("cancelled", str(ctx.exception))
+
+    def test_scope_sets_current_deadline(self):
+        """Deadline.within() nests under the scoped deadline"""
+        self.assertIsNone(Deadline.current())
+        outer = Deadline(5)
+        with outer.scope():
+            self.assertIs(Deadline.current(), outer)
+            inner = Deadline.within(30)
+            self.assertIs(inner.parent, outer)
+        self.assertIsNone(Deadline.current())
+
+    def test_works_in_worker_thread(self):
+        """Deadlines are usable outside the main thread"""
+        errors = []
+
+        def worker():
+            try:
+                deadline = Deadline(0)
+                deadline.check()
+            except DeadlineExceeded:
+                return
+            except Exception as e:  # pragma: no cover - failure path
+                errors.append(e)
+            errors.append("deadline did not expire")
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        self.assertEqual(errors, [])
+
+    def test_wait_for_in_asyncio(self):
+        """Awaiting past the budget raises DeadlineExceeded"""
+        async def run():
+            deadline = Deadline(0.05)
+            with self.assertRaises(DeadlineExceeded):
+                await deadline.wait_for(asyncio.sleep(1))
+            return await Deadline(1).wait_for(asyncio.sleep(0, result="done"))
+
+        self.assertEqual(asyncio.run(run()), "done")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for the daily intros CLI
+
+Runs `python -X importtime src/daily_intros.py --help` in a fresh
+interpreter and fails if the imports it pays for grow past a budget, or if
+importing has side effects (creating the output directory, probing the MCP
+server).
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DAILY_INTROS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src', 'daily_intros.py')
+
+# Cumulative import time budget in milliseconds (about 50ms today; override
+# with IMPORT_TIME_BUDGET_MS on slow machines)
+IMPORT_TIME_BUDGET_MS = float(os.getenv('IMPORT_TIME_BUDGET_MS', '250'))
+
+
+def parse_importtime(stderr: str) -> dict:
+    """
+    Parse `-X importtime` output into top-level imports.
+
+    Returns:
+        Cumulative microseconds per top-level module (nested imports are
+        already included in their importer's cumulative time)
+    """
+    totals = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name = fields[2]
+        if name.startswith('  '):
+            continue
+        totals[name.strip()] = int(fields[1])
+    return totals
+
+
+class TestCliImportTime(unittest.TestCase):
+    """Test that `daily_intros.py --help` starts fast and without side effects"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.work_dir = tempfile.mkdtemp()
+        env = {key: value for key, value in os.environ.items()
+               if key not in ('PYTHONPATH', 'OUTPUT_DIRECTORY')}
+        cls.result = subprocess.run(
+            [sys.executable, '-X', 'importtime', DAILY_INTROS, '--help'],
+            cwd=cls.work_dir, env=env, capture_output=True, text=True, timeout=60
+        )
+        cls.imports = parse_importtime(cls.result.stderr)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.work_dir)
+
+    def test_help_succeeds(self):
+        """--help prints usage and exits cleanly"""
+        self.assertEqual(self.result.returncode, 0, self.result.stderr[-2000:])
+        self.assertIn('Usage:', self.result.stdout)
+        self.assertNotIn('Generating introduction report', self.result.stdout)
+
+    def test_import_time_within_budget(self):
+        """Cold-start imports stay within the budget"""
+        self.assertIn('user_profile_search', self.imports)
+        total_ms = sum(self.imports.values()) / 1000
+        slowest = sorted(self.imports.items(), key=lambda item: item[1], reverse=True)[:5]
+        self.assertLess(
+            total_ms, IMPORT_TIME_BUDGET_MS,
+            f"Imports took {total_ms:.1f}ms (budget {IMPORT_TIME_BUDGET_MS:.0f}ms); slowest: {slowest}"
+        )
+
+    def test_imports_have_no_side_effects(self):
+        """Nothing is created or probed until the report actually runs"""
+        self.assertEqual(os.listdir(self.work_dir), [])
+        self.assertNotIn('MCP Server detected', self.result.stdout)
+
+
+class TestParseImporttime(unittest.TestCase):
+    """Test the -X importtime parser"""
+
+    def test_only_top_level_imports_count(self):
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   _json\n"
+            "import time:       300 |        420 | json\n"
+            "import time:        80 |         80 | config\n"
+            "Traceback noise\n"
+        )
+        self.assertEqual(parse_importtime(stderr), {'json': 420, 'config': 80})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test suite for the intro keyword classifier
+"""
+
+import random
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from intro_classifier import INTRO_KEYWORDS, IntroClassifier, get_intro_classifier
+from daily_intros import is_intro_message
+from dual_mode.claude_code_executor import process_mcp_search_results
+
+
+class TestIntroClassifier(unittest.TestCase):
+    """Test single-scan keyword classification"""
+
+    def test_matches_substring_semantics(self):
+        """Classification agrees with a per-keyword substring check"""
+        classifier = IntroClassifier()
+        rng = random.Random(7)
+        vocabulary = ["Hi", "everyone", "I'm", "Sam", "based", "in", "Oslo", "hey", "all",
+                      "nice", "to", "meet", "you", "fun", "fact", "data", "base", "I", "am"]
+        for _ in range(500):
+            text = " ".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 8)))
+            with self.subTest(text=text):
+                expected = any(keyword in text.lower() for keyword in INTRO_KEYWORDS)
+                self.assertEqual(classifier.is_intro(text), expected)
+
+    def test_matched_keywords(self):
+        """Matched keywords are distinct and in order of first occurrence"""
+        classifier = IntroClassifier()
+        text = "Hi everyone! My name is Sam, I'm based in Oslo. Hi everyone again, fun fact: I am tall"
+        self.assertEqual(
+            classifier.matched_keywords(text),
+            ['hi everyone', 'my name is', "i'm ", 'based', 'fun fact', 'i am']
+        )
+        self.assertEqual(classifier.matched_keywords("Quarterly numbers attached"), [])
+        self.assertEqual(classifier.matched_keywords(None), [])
+
+    def test_shared_prefix_keywords(self):
+        """Keywords that prefix each other are both recognized"""
+        classifier = IntroClassifier(['hi', 'hi all', 'HELLO'])
+        self.assertEqual(classifier.matched_keywords("hi there, hi all, hello"), ['hi', 'hi all', 'hello'])
+
+    def test_requires_keywords(self):
+        """An empty keyword list is rejected"""
+        with self.assertRaises(ValueError):
+            IntroClassifier([])
+
+    def test_shared_by_both_pipelines(self):
+        """The daily pipeline and the executor classify with the same keywords"""
+        self.assertIs(get_intro_classifier(), get_intro_classifier())
+        text = "I have been lurking for a while"
+        self.assertTrue(is_intro_message(text))
+        results = process_mcp_search_results({'results': [{'text': text, 'user': {}}]})
+        self.assertEqual(results[0]['matched_keywords'], ['i have been'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,6 +12,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from user_profile_search import extract_linkedin_link, search_user_profile_for_linkedin
 from daily_intros import extract_linkedin_link as daily_extract_linkedin_link
+from dual_mode.claude_code_executor import process_mcp_search_results
+from linkedin_extractor import LinkedInExtractor, get_linkedin_extractor
 
 class TestLinkedInExtraction(unittest.TestCase):
     """Test LinkedIn URL extraction functionality"""
@@ -163,6 +165,61 @@ class TestDailyIntrosLinkedInExtraction(unittest.TestCase):
                 result = daily_extract_linkedin_link(text)
                 self.assertEqual(result, expected)
 
+    def test_daily_intros_suffix_cleanup(self):
+        """Test trailing punctuation, labels and slashes are normalized"""
+        test_cases = [
+            ("Find me at https://linkedin.com/in/casey.", "https://linkedin.com/in/casey"),
+            ("https://linkedin.com/in/casey//", "https://linkedin.com/in/casey/"),
+            ("https://linkedin.com/in/caseyThis is me", "https://linkedin.com/in/casey"),
+            ("www.linkedin.com/in/casey LinkedIn", "https://www.linkedin.com/in/casey"),
+            ("https://www.linkedin.com/posts/casey_activity-1, thanks", "https://www.linkedin.com/posts/casey_activity-1"),
+            ("linkedin.com/in/casey,", None),
+            ("İstanbul based! https://linkedin.com/in/casey", "https://linkedin.com/in/casey"),
+        ]
+
+        for text, expected in test_cases:
+            with self.subTest(text=text):
+                self.assertEqual(daily_extract_linkedin_link(text), expected)
+
+    def test_daily_intros_leftmost_url_wins(self):
+        """Test the first URL in the message is returned whatever its form"""
+        text = "Me: https://linkedin.com/in/first/|linkedin.com/in/first and <https://linkedin.com/in/second>"
+        self.assertEqual(daily_extract_linkedin_link(text), "https://linkedin.com/in/first/")
+
+class TestSharedLinkedInExtractor(unittest.TestCase):
+    """Test the single extraction engine behind every call site"""
+
+    def test_call_sites_agree(self):
+        """Message parsing, profile search and the executor return the same URL"""
+        texts = [
+            "Hi all! https://www.LinkedIn.com/in/Jane-Smith/ - say hello",
+            "Hi everyone, old profile: https://linkedin.com/pub/bob-wilson-123",
+            "Hello everyone <https://linkedin.com/in/casey>",
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                executor_result = process_mcp_search_results(
+                    {'results': [{'text': text, 'user': {'id': 'U1'}}]}
+                )[0]['linkedin']
+                self.assertEqual(daily_extract_linkedin_link(text), extract_linkedin_link(text))
+                self.assertEqual(executor_result, extract_linkedin_link(text))
+
+    def test_results_are_memoized(self):
+        """Repeated texts are served from the LRU cache"""
+        extractor = LinkedInExtractor(get_linkedin_extractor().url_patterns, cache_size=8)
+        for _ in range(3):
+            self.assertEqual(extractor.extract("hi all linkedin.com/in/alex"), "https://linkedin.com/in/alex")
+        info = extractor.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 1))
+
+        self.assertIsNone(LinkedInExtractor(extractor.url_patterns, cache_size=0).cache_info())
+
+    def test_patterns_come_from_config(self):
+        """Only the configured patterns are matched"""
+        extractor = LinkedInExtractor([r'https?://(?:www\.)?linkedin\.com/in/[\w\-]+'])
+        self.assertEqual(extractor.extract("see https://linkedin.com/in/alex"), "https://linkedin.com/in/alex")
+        self.assertIsNone(extractor.extract("see https://linkedin.com/pub/alex"))
+
 class TestLinkedInExtractionEdgeCases(unittest.TestCase):
     """Test edge cases for LinkedIn extraction"""
     
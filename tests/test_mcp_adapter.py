@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Test suite for the MCP server adapter
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dual_mode.mcp_adapter as mcp_adapter_module
+from dual_mode.mcp_adapter import AsyncMCPAdapter, MCPAdapter, classify_rate_limit
+from deadline import Deadline
+from rate_limiter import RateLimiter
+from retry_policy import RetryPolicy
+from user_profile_search import search_user_profile_for_linkedin_async
+
+
+def _unlimited():
+    """Limiter that never throttles, so tests measure concurrency only"""
+    return RateLimiter(calls_per_minute=10_000, burst_limit=10_000)
+
+
+class ConcurrencyTracker:
+    """Fake synchronous adapter that records how many calls overlap"""
+
+    def __init__(self, delay=0.05, responses=None):
+        self.delay = delay
+        self.responses = responses or {}
+        self.active = 0
+        self.max_active = 0
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def call_function(self, function_key, **kwargs):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.calls.append(function_key)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return self.responses.get(function_key, {'ok': function_key})
+
+
+class TestMCPDetectionCache(unittest.TestCase):
+    """Test that MCP server detection is resolved once and reused"""
+
+    def setUp(self):
+        self.fake_find = MagicMock(return_value={'ok': True})
+        patcher = patch.dict(mcp_adapter_module.__dict__, {'mcp__zapier__slack_find_message': self.fake_find})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        limiter = patch.object(mcp_adapter_module, 'get_rate_limiter')
+        self.get_rate_limiter = limiter.start()
+        self.addCleanup(limiter.stop)
+
+    def test_detection_runs_once(self):
+        """Repeated calls reuse the bound function without re-detecting"""
+        adapter = MCPAdapter()
+        with patch.object(adapter, '_detect_mcp_server', wraps=adapter._detect_mcp_server) as detect:
+            for _ in range(5):
+                self.assertEqual(adapter.slack_find_message(query="hi"), {'ok': True})
+            adapter.call_function('slack_find_message', query="hi")
+
+        detect.assert_not_called()
+        self.assertEqual(self.fake_find.call_count, 6)
+        # Each call draws on its own method's rate limit bucket
+        self.get_rate_limiter.assert_called_with('slack_find_message')
+
+    def test_invalidate_and_ttl_trigger_redetection(self):
+        """invalidate() and an expired TTL both re-run detection on the next call"""
+        adapter = MCPAdapter()
+        with patch.object(adapter, '_detect_mcp_server', return_value='claude') as detect:
+            adapter.invalidate()
+            adapter.slack_find_message(query="hi")
+            adapter.slack_find_message(query="hi")
+            self.assertEqual(detect.call_count, 1)
+
+        adapter = MCPAdapter(detection_ttl=0)
+        with patch.object(adapter, '_detect_mcp_server', return_value='claude') as detect:
+            adapter.slack_find_message(query="hi")
+            time.sleep(0.01)
+            adapter.slack_find_message(query="hi")
+            self.assertEqual(detect.call_count, 2)
+
+    def test_late_registered_function_is_found(self):
+        """A function missing at detection time is picked up once it exists"""
+        adapter = MCPAdapter()
+        self.assertIsNone(adapter.slack_find_user_by_id(user_id="U1"))
+
+        fake_user = MagicMock(return_value={'id': 'U1'})
+        with patch.dict(mcp_adapter_module.__dict__, {'mcp__zapier__slack_find_user_by_id': fake_user}):
+            self.assertEqual(adapter.slack_find_user_by_id(user_id="U1"), {'id': 'U1'})
+            self.assertEqual(adapter.slack_find_user_by_id(user_id="U1"), {'id': 'U1'})
+        self.assertEqual(fake_user.call_count, 2)
+
+
+class TestRateLimitFeedback(unittest.TestCase):
+    """Test that Slack rate-limit responses reach the method's limiter"""
+
+    def setUp(self):
+        self.fake_find = MagicMock(return_value={'ok': True})
+        patcher = patch.dict(mcp_adapter_module.__dict__, {'mcp__zapier__slack_find_message': self.fake_find})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.limiter = MagicMock()
+        limiter = patch.object(mcp_adapter_module, 'get_rate_limiter', return_value=self.limiter)
+        limiter.start()
+        self.addCleanup(limiter.stop)
+        # Single attempts: retries are covered by TestRetries
+        retries = patch.object(mcp_adapter_module, 'get_retry_policy', return_value=RetryPolicy(max_attempts=1))
+        retries.start()
+        self.addCleanup(retries.stop)
+
+    def test_classification(self):
+        """429s, Slack's ratelimited error and Zapier wording are recognized"""
+        class HTTPError(Exception):
+            status_code = 429
+            headers = {'retry-after': '30'}
+
+        cases = [
+            ({'ok': False, 'error': 'ratelimited'}, (True, None)),
+            ({'isError': True, 'error': ['Too Many Requests, retry after 12 seconds']}, (True, 12.0)),
+            ({'isError': True, 'error': ['rate limit'], 'headers': {'Retry-After': '5'}}, (True, 5.0)),
+            (HTTPError('slow down'), (True, 30.0)),
+            (RuntimeError('HTTP 429: retry_after=2.5'), (True, 2.5)),
+            ({'messages': [{'text': 'we hit the rate limit again'}]}, (False, None)),
+            ({'isError': True, 'error': ['insufficient tasks']}, (False, None)),
+            (ValueError('bad channel'), (False, None)),
+            (None, (False, None)),
+        ]
+        for outcome, expected in cases:
+            with self.subTest(outcome=outcome):
+                self.assertEqual(classify_rate_limit(outcome), expected)
+
+    def test_rate_limited_result_backs_off(self):
+        """A rate-limited response is reported with its Retry-After and returns None"""
+        self.fake_find.return_value = {'isError': True, 'error': ['429 Too Many Requests'], 'retry_after': 7}
+        self.assertIsNone(MCPAdapter().slack_find_message(query="hi"))
+        self.limiter.record_rate_limited.assert_called_once_with(7.0)
+        self.limiter.record_success.assert_not_called()
+
+    def test_rate_limited_exception_backs_off(self):
+        """Rate-limit exceptions are reported instead of treated as opaque errors"""
+        self.fake_find.side_effect = RuntimeError('ratelimited')
+        self.assertIsNone(MCPAdapter().slack_find_message(query="hi"))
+        self.limiter.record_rate_limited.assert_called_once_with(None)
+
+    def test_success_is_reported(self):
+        """Accepted calls let the limiter raise its rate again"""
+        self.assertEqual(MCPAdapter().slack_find_message(query="hi"), {'ok': True})
+        self.limiter.record_success.assert_called_once_with()
+        self.limiter.record_rate_limited.assert_not_called()
+
+
+class TestRetries(unittest.TestCase):
+    """Test retry handling of transient and fatal MCP errors"""
+
+    def setUp(self):
+        self.fake_find = MagicMock()
+        self.sleeps = []
+        self.policy = RetryPolicy(max_attempts=3, base_delay=1.0, jitter=0.0, sleep=self.sleeps.append)
+        patches = [
+            patch.dict(mcp_adapter_module.__dict__, {'mcp__zapier__slack_find_message': self.fake_find}),
+            patch.object(mcp_adapter_module, 'get_rate_limiter', return_value=_unlimited()),
+            patch.object(mcp_adapter_module, 'get_retry_policy', return_value=self.policy),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_transient_errors_are_retried(self):
+        """Network blips are retried with backoff until the call succeeds"""
+        self.fake_find.side_effect = [ConnectionError('reset by peer'),
+                                      {'isError': True, 'error': ['503 Service Unavailable']},
+                                      {'ok': True}]
+        self.assertEqual(MCPAdapter().slack_find_message(query="hi"), {'ok': True})
+        self.assertEqual(self.sleeps, [1.0, 2.0])
+        stats = self.policy.get_stats()
+        self.assertEqual((stats['retries'], stats['recovered']), (2, 1))
+
+    def test_fatal_errors_are_not_retried(self):
+        """Bad arguments and an exhausted quota fail immediately"""
+        self.fake_find.side_effect = [ValueError('invalid channel'),
+                                      {'isError': True, 'error': ['insufficient tasks']}]
+        adapter = MCPAdapter()
+        self.assertIsNone(adapter.slack_find_message(query="hi"))
+        self.assertIsNone(adapter.slack_find_message(query="hi"))
+        self.assertEqual(self.fake_find.call_count, 2)
+        self.assertEqual((self.sleeps, self.policy.get_stats()['fatal_errors']), ([], 2))
+
+    def test_gives_up_after_max_attempts(self):
+        """Persistent transient errors give up after the attempt limit"""
+        self.fake_find.side_effect = TimeoutError('read timed out')
+        self.assertIsNone(MCPAdapter().slack_find_message(query="hi"))
+        self.assertEqual(self.fake_find.call_count, 3)
+        self.assertEqual(self.policy.get_stats()['gave_up'], 1)
+
+    def test_no_retry_past_the_deadline(self):
+        """A retry that would start after the total deadline is not attempted"""
+        self.policy.total_deadline = 0.5
+        self.fake_find.side_effect = ConnectionError('down')
+        self.assertIsNone(MCPAdapter().slack_find_message(query="hi"))
+        self.assertEqual(self.fake_find.call_count, 1)
+
+    def test_retries_stay_within_the_callers_deadline(self):
+        """A scoped caller deadline caps the retry budget below the policy's own"""
+        self.fake_find.side_effect = ConnectionError('down')
+        with Deadline(0.5, name="profile search").scope():
+            self.assertIsNone(MCPAdapter().slack_find_message(query="hi"))
+        self.assertEqual((self.fake_find.call_count, self.sleeps), (1, []))
+
+
+class TestAsyncMCPAdapter(unittest.TestCase):
+    """Test awaitable MCP calls with bounded concurrency"""
+
+    def test_calls_overlap_up_to_the_limit(self):
+        """Concurrent calls run in parallel but never exceed max_concurrency"""
+        tracker = ConcurrencyTracker()
+        adapter = AsyncMCPAdapter(adapter=tracker, max_concurrency=3, rate_limiter=_unlimited())
+
+        async def run():
+            return await asyncio.gather(*[
+                adapter.slack_find_user_by_id(user_id=f"U{i}") for i in range(9)
+            ])
+
+        start = time.monotonic()
+        results = asyncio.run(run())
+        elapsed = time.monotonic() - start
+        adapter.close()
+
+        self.assertEqual(len(results), 9)
+        self.assertEqual(tracker.max_active, 3)
+        self.assertLess(elapsed, 9 * tracker.delay)
+
+    def test_rate_budget_awaited_on_event_loop(self):
+        """Calls draw on the shared limiter and skip the adapter's blocking wait"""
+        limiter = _unlimited()
+        sync_adapter = MagicMock()
+        sync_adapter.call_function_unthrottled.return_value = {'ok': True}
+        adapter = AsyncMCPAdapter(adapter=sync_adapter, max_concurrency=2, rate_limiter=limiter)
+
+        async def run():
+            return await asyncio.gather(*[adapter.slack_find_message(query=str(i)) for i in range(3)])
+
+        results = asyncio.run(run())
+        adapter.close()
+
+        self.assertEqual(results, [{'ok': True}] * 3)
+        self.assertEqual(limiter.get_stats()['total_calls'], 3)
+        self.assertEqual(sync_adapter.call_function_unthrottled.call_count, 3)
+        sync_adapter.call_function.assert_not_called()
+
+    def test_calls_run_in_the_callers_deadline(self):
+        """The worker thread sees the deadline scoped around the awaiting task"""
+        sync_adapter = MagicMock()
+        sync_adapter.call_function_unthrottled.side_effect = lambda key, **kwargs: Deadline.current()
+        adapter = AsyncMCPAdapter(adapter=sync_adapter, max_concurrency=1, rate_limiter=_unlimited())
+        outer = Deadline(30, name="profile search")
+
+        async def run():
+            with outer.scope():
+                return await adapter.slack_find_message(query="hi")
+
+        self.assertIs(asyncio.run(run()), outer)
+        adapter.close()
+
+    def test_semaphores_do_not_outlive_their_loops(self):
+        """Each asyncio.run() gets its own semaphore; closed loops' semaphores are dropped"""
+        tracker = ConcurrencyTracker(delay=0.01)
+        adapter = AsyncMCPAdapter(adapter=tracker, max_concurrency=1, rate_limiter=_unlimited())
+
+        async def run():
+            return await asyncio.gather(*[adapter.slack_find_message(query=str(i)) for i in range(3)])
+
+        for _ in range(5):
+            asyncio.run(run())
+        adapter.close()
+
+        self.assertEqual(tracker.max_active, 1)
+        self.assertEqual(len(adapter._semaphores), 1)
+
+    def test_invalid_concurrency(self):
+        """A concurrency limit below one is rejected"""
+        with self.assertRaises(ValueError):
+            AsyncMCPAdapter(adapter=MagicMock(), max_concurrency=-1)
+
+    def test_async_profile_search_prefers_id_lookup(self):
+        """ID and username lookups run together; the ID profile wins"""
+        tracker = ConcurrencyTracker(responses={
+            'slack_find_user_by_id': {'profile': {'title': 'https://linkedin.com/in/by-id'}},
+            'slack_find_user_by_username': {'profile': {'title': 'https://linkedin.com/in/by-name'}},
+        })
+        adapter = AsyncMCPAdapter(adapter=tracker, max_concurrency=2, rate_limiter=_unlimited())
+
+        result = asyncio.run(search_user_profile_for_linkedin_async("U1", "alice", adapter=adapter))
+        adapter.close()
+
+        self.assertEqual(result, "https://linkedin.com/in/by-id")
+        self.assertEqual(tracker.max_active, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Test suite for the persistent user profile cache
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import user_profile_search
+from deadline import Deadline
+from profile_cache import ProfileCache
+
+
+class FakeClock:
+    """Manually advanced wall clock"""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestProfileCache(unittest.TestCase):
+    """Test cache storage and TTL handling"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.clock = FakeClock()
+        self.cache = ProfileCache(
+            os.path.join(self.test_dir, "profile_cache.sqlite3"),
+            ttl_seconds=100, negative_ttl_seconds=10, clock=self.clock
+        )
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_positive_and_negative_ttls(self):
+        """Found URLs and negative results expire independently"""
+        self.cache.put("U1", "alice", "https://linkedin.com/in/alice")
+        self.cache.put("U2", "bob", None)
+
+        self.assertEqual(self.cache.get("U1").linkedin_url, "https://linkedin.com/in/alice")
+        negative = self.cache.get("U2")
+        self.assertIsNotNone(negative)
+        self.assertIsNone(negative.linkedin_url)
+
+        self.clock.now += 50
+        self.assertIsNone(self.cache.get("U2"))
+        self.assertIsNotNone(self.cache.get("U1"))
+
+        self.clock.now += 60
+        self.assertIsNone(self.cache.get("U1"))
+        self.assertEqual(self.cache.purge_expired(), 4)
+
+    def test_lookup_by_username(self):
+        """Entries are reachable by username when the ID is unknown"""
+        self.cache.put("U1", "Alice", "https://linkedin.com/in/alice")
+        self.assertEqual(self.cache.get(None, "alice").linkedin_url, "https://linkedin.com/in/alice")
+        self.assertIsNone(self.cache.get("U9"))
+
+    def test_persists_across_instances(self):
+        """A new cache on the same file sees earlier results"""
+        self.cache.put("U1", "alice", "https://linkedin.com/in/alice")
+        reopened = ProfileCache(self.cache.path, clock=self.clock)
+        try:
+            self.assertEqual(reopened.get("U1").linkedin_url, "https://linkedin.com/in/alice")
+        finally:
+            reopened.close()
+
+
+class TestCachedProfileSearch(unittest.TestCase):
+    """Test that the safe profile search consults the cache first"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.cache = ProfileCache(os.path.join(self.test_dir, "profile_cache.sqlite3"))
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_cache_hit_skips_mcp(self):
+        """A cached negative result makes no MCP calls"""
+        self.cache.put("U1", "alice", None)
+        adapter = MagicMock()
+        with patch.object(user_profile_search, 'get_profile_cache', return_value=self.cache), \
+                patch.object(user_profile_search, 'get_mcp_adapter', return_value=adapter):
+            result = user_profile_search.safe_profile_search_for_daily_intros("U1", "alice")
+
+        self.assertIsNone(result)
+        adapter.slack_find_user_by_id.assert_not_called()
+
+    def test_results_are_written_back(self):
+        """A found URL and a checked profile without LinkedIn are cached; errors are not"""
+        adapter = MagicMock()
+        adapter.slack_find_user_by_id.side_effect = lambda **kw: {
+            'U1': {'profile': {'title': 'PM https://linkedin.com/in/alice'}},
+            'U2': {'profile': {'title': 'Engineer'}},
+            'U3': None,
+        }[kw['user_id']]
+        adapter.slack_find_message.return_value = {'results': []}
+        adapter.slack_find_user_by_username.return_value = None
+
+        with patch.object(user_profile_search, 'get_profile_cache', return_value=self.cache), \
+                patch.object(user_profile_search, 'get_mcp_adapter', return_value=adapter):
+            self.assertEqual(user_profile_search.safe_profile_search_for_daily_intros("U1", "alice"),
+                             "https://linkedin.com/in/alice")
+            self.assertIsNone(user_profile_search.safe_profile_search_for_daily_intros("U2", "bob"))
+            self.assertIsNone(user_profile_search.safe_profile_search_for_daily_intros("U3", "carol"))
+
+        self.assertEqual(self.cache.get("U1").linkedin_url, "https://linkedin.com/in/alice")
+        self.assertIsNone(self.cache.get("U2").linkedin_url)
+        self.assertIsNone(self.cache.get("U3"))
+
+    def test_hung_lookup_returns_at_the_deadline(self):
+        """A call that never returns is abandoned when the caller's deadline passes"""
+        release = threading.Event()
+        self.addCleanup(release.set)
+        adapter = MagicMock()
+        adapter.slack_find_user_by_id.side_effect = lambda **kw: release.wait()
+
+        start = time.monotonic()
+        with patch.object(user_profile_search, 'get_profile_cache', return_value=self.cache), \
+                patch.object(user_profile_search, 'get_mcp_adapter', return_value=adapter):
+            result = user_profile_search.safe_profile_search_for_daily_intros("U4", "dave", deadline=Deadline(0.2))
+
+        self.assertIsNone(result)
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertIsNone(self.cache.get("U4"))
+
+    def test_cut_short_search_is_not_cached(self):
+        """A miss whose fallbacks timed out or were skipped for the task budget is not cached"""
+        release = threading.Event()
+        self.addCleanup(release.set)
+        adapter = MagicMock()
+        adapter.slack_find_user_by_id.return_value = {'profile': {'title': 'Engineer'}}
+        adapter.slack_find_message.side_effect = lambda **kw: release.wait()
+
+        with patch.object(user_profile_search, 'get_profile_cache', return_value=self.cache), \
+                patch.object(user_profile_search, 'get_mcp_adapter', return_value=adapter):
+            self.assertIsNone(user_profile_search.safe_profile_search_for_daily_intros(
+                "U5", "erin", deadline=Deadline(0.3)))
+            self.assertIsNone(user_profile_search.safe_profile_search_for_daily_intros(
+                "U6", "frank", use_fallbacks=False))
+
+        adapter.slack_find_message.assert_called_once()
+        self.assertIsNone(self.cache.get("U5"))
+        self.assertIsNone(self.cache.get("U6"))
+
+    def test_hung_lookup_does_not_block_exit(self):
+        """An abandoned call that never returns does not keep the interpreter from exiting"""
+        src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+        script = (
+            "import threading\n"
+            "from deadline import Deadline, DeadlineExceeded\n"
+            "from user_profile_search import _call_within\n"
+            "try:\n"
+            "    _call_within(Deadline(0.1), threading.Event().wait)\n"
+            "except DeadlineExceeded:\n"
+            "    print('abandoned')\n"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+            os.path.join(src, path) for path in ('', 'security', 'dual_mode')))
+        result = subprocess.run([sys.executable, '-c', script], env=env,
+                                capture_output=True, text=True, timeout=30)
+        self.assertEqual((result.returncode, result.stdout.strip()), (0, 'abandoned'), result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Test suite for the bucketed sliding-window rate limiter
+"""
+
+import asyncio
+import multiprocessing
+import tempfile
+import threading
+import unittest
+import os
+import sys
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import rate_limiter
+from rate_limiter import RateLimiter, RateLimiterRegistry
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.05
+
+    def __call__(self):
+        return self.now
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test limits, expiry and statistics"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_burst_limit(self):
+        """Calls beyond the burst limit wait until the burst second has passed"""
+        limiter = RateLimiter(calls_per_minute=100, burst_limit=2, clock=self.clock)
+        self.assertEqual(limiter.try_acquire(), 0.0)
+        self.assertEqual(limiter.try_acquire(), 0.0)
+
+        wait = limiter.try_acquire()
+        self.assertGreaterEqual(wait, 1.0)
+        self.assertLessEqual(wait, 1.0 + limiter.resolution)
+
+        self.clock.now += wait
+        self.assertEqual(limiter.try_acquire(), 0.0)
+
+    def test_window_limit(self):
+        """Calls beyond the per-window limit wait for the oldest call to expire"""
+        limiter = RateLimiter(calls_per_minute=3, burst_limit=10, clock=self.clock)
+        for _ in range(3):
+            self.assertEqual(limiter.try_acquire(), 0.0)
+            self.clock.now += 5
+
+        wait = limiter.try_acquire()
+        self.assertGreaterEqual(wait, 45.0)
+        self.assertLessEqual(wait, 45.0 + limiter.resolution)
+
+        self.clock.now += wait
+        self.assertEqual(limiter.try_acquire(), 0.0)
+        self.assertEqual(limiter.get_stats()['calls_last_minute'], 3)
+
+    def test_stats_follow_the_clock(self):
+        """Counts for each horizon expire independently"""
+        limiter = RateLimiter(calls_per_minute=100, burst_limit=100, clock=self.clock)
+        for _ in range(4):
+            limiter.try_acquire()
+        self.clock.now += 5
+        limiter.try_acquire()
+
+        stats = limiter.get_stats()
+        self.assertEqual((stats['calls_last_second'], stats['calls_last_10_seconds'], stats['calls_last_minute']),
+                         (1, 5, 5))
+        self.assertEqual(stats['available_capacity'], 95)
+
+        self.clock.now += 10 + limiter.resolution
+        stats = limiter.get_stats()
+        self.assertEqual((stats['calls_last_second'], stats['calls_last_10_seconds'], stats['calls_last_minute']),
+                         (0, 0, 5))
+
+        self.clock.now += 3600
+        self.assertEqual(limiter.get_stats()['total_calls'], 0)
+
+    def test_reset(self):
+        """Reset clears all counts"""
+        limiter = RateLimiter(calls_per_minute=2, burst_limit=2, clock=self.clock)
+        limiter.try_acquire()
+        limiter.try_acquire()
+        limiter.reset()
+        self.assertEqual(limiter.try_acquire(), 0.0)
+        self.assertEqual(limiter.get_stats()['total_calls'], 1)
+
+    def test_never_sleeps_holding_the_lock(self):
+        """Waiting happens outside the lock so other callers are not blocked"""
+        limiter = RateLimiter(calls_per_minute=100, burst_limit=1, clock=self.clock)
+        limiter.try_acquire()
+        lock_states = []
+
+        def fake_sleep(seconds):
+            lock_states.append(limiter._state._lock.locked())
+            self.clock.now += seconds
+
+        with patch.object(rate_limiter.time, 'sleep', side_effect=fake_sleep):
+            waited = limiter.wait_if_needed()
+
+        self.assertGreater(waited, 0)
+        self.assertEqual(lock_states, [False])
+
+    def test_concurrent_callers_never_exceed_limit(self):
+        """Concurrent threads reserve exactly the allowed number of slots"""
+        limiter = RateLimiter(calls_per_minute=50, burst_limit=50, clock=self.clock)
+        granted = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            for _ in range(20):
+                if limiter.try_acquire() == 0.0:
+                    granted.append(1)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(granted), 50)
+        self.assertEqual(limiter.get_stats()['total_calls'], 50)
+
+
+
+class TestAdaptiveRateLimiter(unittest.TestCase):
+    """Test AIMD adaptation to server rate-limit feedback"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_rate_limited_halves_limit_and_honours_retry_after(self):
+        """A rejection halves the limit and blocks calls for Retry-After seconds"""
+        limiter = RateLimiter(calls_per_minute=20, burst_limit=20, clock=self.clock)
+        limiter.record_rate_limited(retry_after=5)
+
+        self.assertAlmostEqual(limiter.try_acquire(), 5.0, places=3)
+        self.assertEqual(limiter.get_stats()['effective_calls_per_minute'], 10)
+
+        self.clock.now += 5
+        granted = sum(1 for _ in range(20) if limiter.try_acquire() == 0.0)
+        self.assertEqual(granted, 10)
+
+    def test_concurrent_rejections_decrease_once(self):
+        """Rejections arriving during the pause extend it without compounding"""
+        limiter = RateLimiter(calls_per_minute=20, clock=self.clock)
+        limiter.record_rate_limited(retry_after=1)
+        limiter.record_rate_limited(retry_after=3)
+        self.assertEqual(limiter.get_stats()['effective_calls_per_minute'], 10)
+        self.assertAlmostEqual(limiter.try_acquire(), 3.0, places=3)
+
+        self.clock.now += 3
+        limiter.record_rate_limited()
+        self.assertEqual(limiter.get_stats()['effective_calls_per_minute'], 5)
+        # Without Retry-After, pause for one call's spacing at the new rate
+        self.assertAlmostEqual(limiter.try_acquire(), 12.0, places=3)
+
+    def test_successes_grow_limit_up_to_ceiling(self):
+        """Additive increase of about one call per window of successes, capped"""
+        limiter = RateLimiter(calls_per_minute=10, max_calls_per_minute=12, clock=self.clock)
+        for _ in range(10):
+            limiter.record_success()
+        self.assertEqual(limiter.get_stats()['effective_calls_per_minute'], 10)
+        self.assertGreater(limiter._current_limit(), 10.9)
+
+        for _ in range(100):
+            limiter.record_success()
+        self.assertEqual(limiter._current_limit(), 12)
+
+    def test_default_ceiling_lets_the_rate_grow(self):
+        """A streak of successes raises the rate above the configured one by default"""
+        limiter = RateLimiter(calls_per_minute=10, burst_limit=100, clock=self.clock)
+        for _ in range(30):
+            limiter.record_success()
+        self.assertEqual(limiter.get_stats()['effective_calls_per_minute'], 12)
+
+        granted = sum(1 for _ in range(20) if limiter.try_acquire() == 0.0)
+        self.assertEqual(granted, 12)
+        for _ in range(1000):
+            limiter.record_success()
+        self.assertEqual(limiter._current_limit(), 15)
+
+    def test_limit_stays_within_bounds(self):
+        """A ceiling equal to the start rate caps it; the floor is one call"""
+        limiter = RateLimiter(calls_per_minute=4, max_calls_per_minute=4, clock=self.clock)
+        limiter.record_success()
+        self.assertEqual(limiter._current_limit(), 4)
+        for _ in range(5):
+            self.clock.now += 100
+            limiter.record_rate_limited(retry_after=0)
+        self.assertEqual(limiter._current_limit(), 1)
+
+        limiter.reset()
+        self.assertEqual(limiter.get_stats()['effective_calls_per_minute'], 4)
+
+
+class TestAsyncRateLimiter(unittest.TestCase):
+    """Test the awaitable API against the shared window state"""
+
+    def test_async_and_threaded_callers_share_budget(self):
+        """acquire() and wait_if_needed() count against the same window"""
+        clock = FakeClock()
+        limiter = RateLimiter(calls_per_minute=100, burst_limit=2, clock=clock)
+        limiter.wait_if_needed()
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock.now += seconds
+
+        async def run():
+            with patch.object(rate_limiter.asyncio, 'sleep', side_effect=fake_sleep):
+                first = await limiter.acquire()
+                second = await limiter.acquire()
+            return first, second
+
+        first, second = asyncio.run(run())
+        self.assertIsNone(first)
+        self.assertGreaterEqual(second, 1.0)
+        self.assertEqual(len(sleeps), 1)
+        self.assertEqual(limiter.get_stats()['calls_last_minute'], 3)
+
+    def test_decorators_wrap_coroutines(self):
+        """Coroutine functions are rate limited without blocking the loop"""
+        limiter = RateLimiter(calls_per_minute=100, burst_limit=100)
+
+        @limiter
+        async def fetch(value):
+            await asyncio.sleep(0)
+            return value
+
+        @rate_limiter.async_rate_limited
+        async def fetch_global(value):
+            return value
+
+        self.assertEqual(asyncio.run(fetch(1)), 1)
+        self.assertEqual(asyncio.run(fetch_global(2)), 2)
+        self.assertEqual(limiter.get_stats()['total_calls'], 1)
+
+
+
+def _acquire_in_process(path, attempts, results):
+    """Child-process worker: count calls granted by a shared-state limiter"""
+    limiter = RateLimiter(calls_per_minute=30, burst_limit=30, shared_state_path=path)
+    results.put(sum(1 for _ in range(attempts) if limiter.try_acquire() == 0.0))
+
+
+@unittest.skipIf(rate_limiter.fcntl is None, "shared state requires fcntl")
+class TestSharedRateLimiter(unittest.TestCase):
+    """Test limiters drawing from one window through a state file"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'state.bin')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_instances_share_one_window(self):
+        """Calls through one instance count against every instance on the file"""
+        first = RateLimiter(calls_per_minute=3, burst_limit=3, clock=self.clock, shared_state_path=self.path)
+        second = RateLimiter(calls_per_minute=3, burst_limit=3, clock=self.clock, shared_state_path=self.path)
+        first.try_acquire()
+        first.try_acquire()
+        self.assertEqual(second.try_acquire(), 0.0)
+        self.assertGreater(first.try_acquire(), 0)
+
+        stats = second.get_stats()
+        self.assertEqual(stats, first.get_stats())
+        self.assertEqual((stats['total_calls'], stats['available_capacity']), (3, 0))
+
+        self.clock.now += 61
+        self.assertEqual(first.get_stats()['total_calls'], 0)
+
+    def test_reset_and_layout_change(self):
+        """Reset clears the shared window; a different bucket layout starts fresh"""
+        limiter = RateLimiter(calls_per_minute=5, burst_limit=5, clock=self.clock, shared_state_path=self.path)
+        limiter.try_acquire()
+        limiter.reset()
+        self.assertEqual(limiter.get_stats()['total_calls'], 0)
+
+        limiter.try_acquire()
+        other = RateLimiter(window_seconds=30, clock=self.clock, shared_state_path=self.path)
+        self.assertEqual(other.get_stats()['total_calls'], 0)
+
+    def test_processes_never_exceed_limit(self):
+        """Separate processes together get exactly the shared budget"""
+        context = multiprocessing.get_context('spawn')
+        results = context.Queue()
+        processes = [
+            context.Process(target=_acquire_in_process, args=(self.path, 20, results))
+            for _ in range(3)
+        ]
+        for process in processes:
+            process.start()
+        granted = sum(results.get(timeout=30) for _ in processes)
+        for process in processes:
+            process.join()
+
+        self.assertEqual(granted, 30)
+
+    def test_registry_uses_shared_dir(self):
+        """Registries on the same directory share each key's budget"""
+        first = RateLimiterRegistry({'search': (2, 2)}, shared_dir=self.tmpdir.name)
+        second = RateLimiterRegistry({'search': (2, 2)}, shared_dir=self.tmpdir.name)
+        first.get('search').try_acquire()
+        first.get('search').try_acquire()
+        self.assertGreater(second.get('search').try_acquire(), 0)
+        self.assertTrue(os.path.exists(os.path.join(self.tmpdir.name, 'rate_limit_search.bin')))
+
+    def test_backoff_is_shared(self):
+        """A rejection seen by one process pauses every process on the file"""
+        first = RateLimiter(calls_per_minute=8, clock=self.clock, shared_state_path=self.path)
+        second = RateLimiter(calls_per_minute=8, clock=self.clock, shared_state_path=self.path)
+        first.record_rate_limited(retry_after=2)
+        self.assertAlmostEqual(second.try_acquire(), 2.0, places=3)
+        self.assertEqual(second.get_stats()['effective_calls_per_minute'], 4)
+
+    def test_registry_falls_back_to_local_state(self):
+        """An unusable shared directory degrades to per-process limits"""
+        blocker = os.path.join(self.tmpdir.name, 'not_a_dir')
+        open(blocker, 'w').close()
+        registry = RateLimiterRegistry({'search': (2, 2)}, shared_dir=blocker)
+        limiter = registry.get('search')
+        self.assertIsNone(limiter.shared_state_path)
+        self.assertEqual(limiter.try_acquire(), 0.0)
+
+
+class TestRateLimiterRegistry(unittest.TestCase):
+    """Test per-method limiter buckets"""
+
+    def test_methods_get_separate_budgets(self):
+        """Exhausting one method's budget leaves the others available"""
+        registry = RateLimiterRegistry({'search': (2, 2), 'lookup': (100, 10)})
+        search, lookup = registry.get('search'), registry.get('lookup')
+
+        self.assertIs(registry.get('search'), search)
+        self.assertEqual((search.calls_per_minute, lookup.calls_per_minute), (2, 100))
+        search.try_acquire()
+        search.try_acquire()
+        self.assertGreater(search.try_acquire(), 0)
+        self.assertEqual(lookup.try_acquire(), 0.0)
+
+    def test_environment_overrides(self):
+        """Per-method variables beat the global limits, which beat the method defaults"""
+        env = {'SLACK_API_RATE_LIMIT_SEARCH': '7', 'SLACK_API_RATE_LIMIT': '30', 'SLACK_API_BURST_LIMIT': '3'}
+        with patch.dict(os.environ, env):
+            registry = RateLimiterRegistry({'search': (2, 2), 'lookup': (100, 10)})
+            search, lookup, other = registry.get('search'), registry.get('lookup'), registry.get('other')
+        self.assertEqual((search.calls_per_minute, search.burst_limit), (7, 3))
+        self.assertEqual((lookup.calls_per_minute, lookup.burst_limit), (30, 3))
+        self.assertEqual((other.calls_per_minute, other.burst_limit), (30, 3))
+
+        with patch.dict(os.environ, {}, clear=True):
+            lookup = RateLimiterRegistry({'lookup': (100, 10)}).get('lookup')
+        self.assertEqual((lookup.calls_per_minute, lookup.burst_limit), (100, 10))
+
+    def test_adaptive_ceiling_from_environment(self):
+        """SLACK_API_MAX_RATE_LIMIT lets adapted limits grow past the start rate"""
+        env = {'SLACK_API_MAX_RATE_LIMIT': '40', 'SLACK_API_MAX_RATE_LIMIT_LOOKUP': '150'}
+        with patch.dict(os.environ, env):
+            registry = RateLimiterRegistry({'search': (20, 5), 'lookup': (100, 10)})
+            self.assertEqual(registry.get('search').max_calls_per_minute, 40)
+            self.assertEqual(registry.get('lookup').max_calls_per_minute, 150)
+        self.assertEqual(RateLimiterRegistry().get('other').max_calls_per_minute, 30)
+
+    def test_aggregate_stats(self):
+        """Registry stats report each limiter and totals across all of them"""
+        registry = RateLimiterRegistry({'a': (10, 10), 'b': (10, 10)})
+        registry.get('a').try_acquire()
+        registry.get('b').try_acquire()
+        registry.get('b').try_acquire()
+
+        stats = registry.get_stats()
+        self.assertEqual(stats['limiters']['b']['total_calls'], 2)
+        self.assertEqual((stats['total_calls'], stats['calls_last_second']), (3, 3))
+
+        registry.reset()
+        self.assertEqual(registry.get_stats()['total_calls'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
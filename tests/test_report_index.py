@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test suite for the report index
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import get_config
+from daily_intros import save_daily_intro_report
+from report_index import ReportIndex, build_report_entry, get_report_index
+
+
+def _intro(n, linkedin=None):
+    return {
+        'first_name': f'User{n}',
+        'real_name': f'User {n} Müller',
+        'username': f'user{n}',
+        'linkedin_link': linkedin,
+        'message_text': f'Hi, I am user {n} 👋\nNice to meet you',
+        'timestamp': f'2025-09-18T10:00:{n:02d}.000Z',
+        'user_id': f'U{n:03d}',
+        'permalink': f'https://slack.example/p{n}'
+    }
+
+
+class TestReportIndex(unittest.TestCase):
+    """Test index maintenance by save_daily_intro_report and index lookups"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp(dir=os.getcwd())
+        self.addCleanup(shutil.rmtree, self.test_dir)
+        self.report_dir = os.path.relpath(self.test_dir)
+
+    def _save(self, intros, date='2025-09-18', **kwargs):
+        return save_daily_intro_report([(intro, 'Welcome!') for intro in intros],
+                                       output_dir=self.report_dir, output_date=date, **kwargs)
+
+    def _section(self, report, intro):
+        """Read one intro's section by its byte range"""
+        with open(os.path.join(self.report_dir, report), 'rb') as f:
+            f.seek(intro['offset'])
+            return f.read(intro['length']).decode('utf-8')
+
+    def test_saved_report_is_indexed_with_byte_offsets(self):
+        """Each intro's byte range covers exactly its section of the report"""
+        self._save([_intro(1, 'https://linkedin.com/in/user1'), _intro(2)])
+
+        index = ReportIndex(self.report_dir)
+        entry = index.get('daily_intros_2025-09-18.md')
+        self.assertEqual((entry['date'], entry['intro_count']), ('2025-09-18', 2))
+        self.assertEqual([intro['user_id'] for intro in entry['intros']], ['U001', 'U002'])
+
+        section = self._section(entry['report'], entry['intros'][1])
+        self.assertTrue(section.startswith('## 2. User 2 Müller'))
+        self.assertIn('@user2', section)
+        self.assertNotIn('user1', section)
+        self.assertEqual(index.latest_timestamp(), '2025-09-18T10:00:02.000Z')
+
+    def test_partition_uses_the_latest_report(self):
+        """A rewritten report supersedes its earlier entry; its own intros can be excluded"""
+        self._save([_intro(1)], date='2025-09-17')
+        self._save([_intro(2)], date='2025-09-18')
+        self._save([_intro(3)], date='2025-09-18')
+
+        index = ReportIndex(self.report_dir)
+        intros = [_intro(1), _intro(2), _intro(3), _intro(4)]
+        self.assertEqual([i['user_id'] for i in index.partition(intros)[0]], ['U002', 'U004'])
+        new, reported = index.partition(intros, exclude_report='daily_intros_2025-09-18.md')
+        self.assertEqual([i['user_id'] for i in reported], ['U001'])
+        self.assertEqual(index.get_stats()['reports'], 2)
+
+    def test_existing_reports_are_indexed_once(self):
+        """Reports written before the index are indexed from their markdown"""
+        self._save([_intro(1), _intro(2)])
+        self._save([], date='2025-09-19', error_info='Search failed')
+        os.unlink(os.path.join(self.report_dir, 'report_index.jsonl'))
+
+        index = ReportIndex(self.report_dir)
+        entry = index.get('daily_intros_2025-09-18.md')
+        self.assertTrue(index.get('daily_intros_2025-09-19.md')['error'])
+        self.assertEqual([(i['username'], i['timestamp']) for i in entry['intros']],
+                         [('user1', '2025-09-18T10:00:01.000Z'), ('user2', '2025-09-18T10:00:02.000Z')])
+        self.assertIn('@user2', self._section(entry['report'], entry['intros'][1]))
+        self.assertTrue(os.path.exists(index.path))
+
+        # Without user IDs, intros are matched by username
+        self.assertEqual(index.partition([_intro(2)]), ([], [_intro(2)]))
+
+    def test_compacts_superseded_lines(self):
+        """Many rewrites of one report do not grow the index without bound"""
+        index = ReportIndex(self.report_dir)
+        for n in range(30):
+            index.record(build_report_entry('daily_intros_2025-09-18.md', '2025-09-18', [], n))
+        with open(index.path) as f:
+            self.assertLess(len(f.readlines()), 15)
+        self.assertEqual(ReportIndex(self.report_dir).get('daily_intros_2025-09-18.md')['size'], 29)
+
+    def test_reports_and_index_follow_the_output_directory(self):
+        """Without an explicit directory, reports and their index go to OUTPUT_DIRECTORY with the other state"""
+        previous_cwd = os.getcwd()
+        os.chdir(self.test_dir)
+        self.addCleanup(os.chdir, previous_cwd)
+        os.mkdir('custom_output')  # Created by Config() when it validates OUTPUT_DIRECTORY
+        with patch.object(get_config().output, 'output_directory', 'custom_output'):
+            filepath = save_daily_intro_report([(_intro(1), 'Welcome!')], output_date='2025-09-18')
+            index = get_report_index()
+
+        self.assertEqual(filepath, os.path.join('custom_output', 'daily_intros_2025-09-18.md'))
+        self.assertEqual(os.path.dirname(index.path), 'custom_output')
+        self.assertEqual(index.get('daily_intros_2025-09-18.md')['intros'][0]['user_id'], 'U001')
+        self.assertFalse(os.path.exists(os.path.join('welcome_messages', 'report_index.jsonl')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test suite for MCP retry policies
+"""
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from retry_policy import CallFailure, RetryPolicy, RetryPolicyRegistry
+
+TRANSIENT = CallFailure(True, "ConnectionError")
+FATAL = CallFailure(False, "ValueError")
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Test backoff, jitter and retry decisions"""
+
+    def test_exponential_backoff_is_capped(self):
+        """Delays double per retry up to max_delay"""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=0.0)
+        self.assertEqual([policy.backoff(n) for n in range(1, 6)], [1.0, 2.0, 4.0, 5.0, 5.0])
+
+    def test_jitter_only_shortens_delay(self):
+        """Jitter removes up to the configured fraction of the delay"""
+        policy = RetryPolicy(base_delay=4.0, jitter=0.5, rng=lambda: 0.999999)
+        self.assertAlmostEqual(policy.backoff(1), 2.0, places=3)
+        policy = RetryPolicy(base_delay=4.0, jitter=0.5, rng=lambda: 0.0)
+        self.assertEqual(policy.backoff(1), 4.0)
+
+    def test_retry_after_is_never_undercut(self):
+        """A server-requested wait beats a shorter backoff"""
+        policy = RetryPolicy(base_delay=1.0, jitter=0.0)
+        self.assertEqual(policy.backoff(1, retry_after=9.0), 9.0)
+
+    def test_retry_decisions(self):
+        """Fatal errors, used-up attempts and the deadline all stop retries"""
+        policy = RetryPolicy(max_attempts=3, base_delay=1.0, jitter=0.0)
+        self.assertEqual(policy.next_delay(1, TRANSIENT, remaining=60), 1.0)
+        self.assertEqual(policy.next_delay(2, TRANSIENT, remaining=60), 2.0)
+        self.assertIsNone(policy.next_delay(3, TRANSIENT, remaining=60))
+        self.assertIsNone(policy.next_delay(1, FATAL, remaining=60))
+        self.assertIsNone(policy.next_delay(2, TRANSIENT, remaining=1.5))
+
+    def test_stats(self):
+        """Retries, recoveries, give-ups and fatal errors are counted"""
+        policy = RetryPolicy()
+        policy.record(1, succeeded=True)
+        policy.record(3, succeeded=True)
+        policy.record(2, succeeded=False)
+        policy.record(1, succeeded=False, fatal=True)
+        stats = policy.get_stats()
+        self.assertEqual(
+            (stats['calls'], stats['attempts'], stats['retries'], stats['recovered'], stats['gave_up'], stats['fatal_errors']),
+            (4, 7, 3, 1, 1, 1)
+        )
+        policy.reset()
+        self.assertEqual(policy.get_stats()['calls'], 0)
+
+    def test_invalid_settings(self):
+        """Policies need at least one attempt and a jitter fraction"""
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_attempts=0)
+        with self.assertRaises(ValueError):
+            RetryPolicy(jitter=1.5)
+
+
+class TestRetryPolicyRegistry(unittest.TestCase):
+    """Test per-method policies"""
+
+    def test_defaults_and_environment_overrides(self):
+        """Per-method variables beat global ones, which beat the defaults"""
+        env = {'MCP_RETRY_ATTEMPTS': '2', 'MCP_RETRY_ATTEMPTS_SEARCH': '6', 'MCP_RETRY_DEADLINE_SEARCH': '120'}
+        with patch.dict(os.environ, env):
+            registry = RetryPolicyRegistry({'search': (4, 90.0)})
+            search, other = registry.get('search'), registry.get('other')
+        self.assertIs(registry.get('search'), search)
+        self.assertEqual((search.max_attempts, search.total_deadline), (6, 120.0))
+        self.assertEqual((other.max_attempts, other.total_deadline), (2, 60.0))
+
+    def test_aggregate_stats(self):
+        """Registry stats report each policy and totals across all of them"""
+        registry = RetryPolicyRegistry({})
+        registry.get('a').record(2, succeeded=True)
+        registry.get('b').record(3, succeeded=False)
+        stats = registry.get_stats()
+        self.assertEqual((stats['retries'], stats['recovered'], stats['gave_up']), (3, 1, 1))
+        self.assertEqual(stats['policies']['b']['attempts'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
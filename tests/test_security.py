@@ -162,6 +162,37 @@ class TestInputValidation:
         assert '\x01' not in sanitized
         assert '\x1F' not in sanitized
 
+    def test_sanitize_text_output(self):
+        """Test exact sanitized output for ordinary and malicious text"""
+        validator = InputValidator()
+        cases = [
+            ("Hi all! I'm Sam; based in Oslo & London.", "Hi all! Im Sam based in Oslo  London."),
+            ("Tabs\tand\nnewlines stay\x07", "Tabs\tand\nnewlines stay"),
+            ('<a href="javascript:alert(1)" onclick = x>', "a href=alert(1)  x"),
+            ("see ../../etc and ..\\..\\win", "see etc and win"),
+            ("java'script:alert(1)", "alert(1)"),
+        ]
+        for text, expected in cases:
+            assert validator.sanitize_text(text) == expected
+
+    def test_sanitize_text_removes_nested_sequences(self):
+        """Test sequences formed by removing an inner sequence are removed too"""
+        validator = InputValidator()
+        assert validator.sanitize_text("javajavascript:script:alert(1)") == "alert(1)"
+        assert validator.sanitize_text("....//secret") == "secret"
+
+    def test_sanitize_text_removes_split_sequences(self):
+        """Test sequences split by a removed character are removed (the old sequential sanitizer kept them)"""
+        validator = InputValidator()
+        cases = [
+            ("java;script:alert(1)", "alert(1)"),  # Previously "javascript:alert(1)"
+            (".\x1f./etc", "etc"),  # Previously "../etc"
+            ("on\x01load = x", "x"),  # Previously "onload = x"
+            ("a'<\x01>b", "ab"),
+        ]
+        for text, expected in cases:
+            assert validator.sanitize_text(text) == expected
+
 
 class TestFileOperations:
     """Test file operation security"""
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Test suite for single-flight request coalescing
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import user_profile_search
+from single_flight import AsyncSingleFlight, SingleFlight
+
+
+def _run_concurrently(*targets):
+    """Start every target on its own thread and collect the results in order"""
+    results = [None] * len(targets)
+
+    def run(index, target):
+        results[index] = target()
+
+    threads = [threading.Thread(target=run, args=(i, t)) for i, t in enumerate(targets)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test the thread-based group"""
+
+    def setUp(self):
+        self.flight = SingleFlight()
+        self.release = threading.Event()
+        self.calls = []
+
+    def _slow(self, value):
+        def call():
+            self.calls.append(value)
+            self.release.wait(5)
+            return value
+        return call
+
+    def _release_when_joined(self, followers):
+        deadline = time.monotonic() + 5
+        while self.flight.coalesced < followers and time.monotonic() < deadline:
+            time.sleep(0.001)
+        self.release.set()
+        return None
+
+    def test_concurrent_calls_share_one_result(self):
+        """Followers wait for the leader instead of calling again"""
+        results = _run_concurrently(
+            lambda: self.flight.do('U1', self._slow('first')),
+            lambda: self.flight.do('U1', self._slow('second')),
+            lambda: self.flight.do('U1', self._slow('third')),
+            lambda: self._release_when_joined(2),
+        )
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(len(set(results[:3])), 1)
+        self.assertEqual(self.flight.get_stats(), {'leaders': 1, 'coalesced': 2, 'in_flight': 0})
+
+    def test_alias_joins_call(self):
+        """A request for an alias key joins the call registered under it"""
+        results = _run_concurrently(
+            lambda: self.flight.do('id:U1', self._slow('by-id'), aliases=['username:alice']),
+            lambda: (time.sleep(0.05), self.flight.do('username:alice', self._slow('by-name')))[1],
+            lambda: self._release_when_joined(1),
+        )
+        self.assertEqual(results[:2], ['by-id', 'by-id'])
+        self.assertEqual(self.calls, ['by-id'])
+
+    def test_errors_are_shared_and_not_remembered(self):
+        """Followers see the leader's exception; later calls run afresh"""
+        def failing():
+            self.release.wait(5)
+            raise ConnectionError('down')
+
+        def attempt():
+            try:
+                self.flight.do('U1', failing)
+            except ConnectionError as e:
+                return str(e)
+
+        results = _run_concurrently(attempt, attempt, lambda: self._release_when_joined(1))
+        self.assertEqual(results[:2], ['down', 'down'])
+        self.assertEqual(self.flight.do('U1', lambda: 'fresh'), 'fresh')
+
+    def test_follower_timeout(self):
+        """A follower stops waiting after its timeout"""
+        leader = threading.Thread(target=self.flight.do, args=('U1', self._slow('x')))
+        leader.start()
+        while not self.calls:
+            time.sleep(0.001)
+        with self.assertRaises(TimeoutError):
+            self.flight.do('U1', self._slow('y'), timeout=0.01)
+        self.release.set()
+        leader.join()
+
+
+class TestAsyncSingleFlight(unittest.TestCase):
+    """Test the asyncio group"""
+
+    def test_concurrent_coroutines_share_one_call(self):
+        """Identical awaits on one loop share a task; cancelling one does not cancel it"""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def lookup():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return 'profile'
+
+        async def run():
+            impatient = asyncio.ensure_future(flight.do('U1', lookup))
+            others = [flight.do('U1', lookup) for _ in range(2)]
+            await asyncio.sleep(0)
+            impatient.cancel()
+            return await asyncio.gather(*others)
+
+        self.assertEqual(asyncio.run(run()), ['profile', 'profile'])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.get_stats(), {'leaders': 1, 'coalesced': 2, 'in_flight': 0})
+
+    def test_calls_on_another_loop_are_not_joined(self):
+        """A task in flight on one event loop is never awaited from another"""
+        flight = AsyncSingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        async def slow_lookup():
+            started.set()
+            while not release.is_set():
+                await asyncio.sleep(0.01)
+            return 'first loop'
+
+        async def fast_lookup():
+            return 'second loop'
+
+        other = threading.Thread(target=lambda: asyncio.run(flight.do('U1', slow_lookup)))
+        other.start()
+        started.wait(5)
+        try:
+            self.assertEqual(asyncio.run(flight.do('U1', fast_lookup)), 'second loop')
+        finally:
+            release.set()
+            other.join()
+        self.assertEqual(flight.get_stats()['leaders'], 2)
+
+
+class TestProfileSearchCoalescing(unittest.TestCase):
+    """Test duplicate user lookups in the profile search layer"""
+
+    def setUp(self):
+        self.release = threading.Event()
+        self.adapter = MagicMock()
+        patches = [
+            patch.object(user_profile_search, 'get_mcp_adapter', return_value=self.adapter),
+            patch.object(user_profile_search, 'get_profile_cache', return_value=None),
+            patch.object(user_profile_search, '_profile_searches', SingleFlight()),
+            patch.object(user_profile_search, '_user_lookups', SingleFlight()),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _slow_profile(self, title):
+        def lookup(**kwargs):
+            self.release.wait(5)
+            return {'profile': {'title': title}}
+        return lookup
+
+    def _release_when_joined(self, group, followers):
+        deadline = time.monotonic() + 5
+        while group.coalesced < followers and time.monotonic() < deadline:
+            time.sleep(0.001)
+        self.release.set()
+
+    def test_duplicate_intros_share_one_search(self):
+        """Two intros from the same user run one profile search"""
+        self.adapter.slack_find_user_by_id.side_effect = self._slow_profile('https://linkedin.com/in/alice')
+        search = user_profile_search.safe_profile_search_for_daily_intros
+        results = _run_concurrently(
+            lambda: search('U1', 'alice'),
+            lambda: search('U1', 'alice'),
+            lambda: self._release_when_joined(user_profile_search._profile_searches, 1),
+        )
+        self.assertEqual(results[:2], ['https://linkedin.com/in/alice'] * 2)
+        self.assertEqual(self.adapter.slack_find_user_by_id.call_count, 1)
+
+    def test_searches_with_different_settings_are_not_shared(self):
+        """A search without fallbacks does not join (or get charged for) one with them"""
+        self.adapter.slack_find_user_by_id.side_effect = self._slow_profile('Engineer')
+        self.adapter.slack_find_message.return_value = {'results': []}
+        search = user_profile_search.safe_profile_search_for_daily_intros
+        results = _run_concurrently(
+            lambda: search('U1', 'alice'),
+            lambda: search('U1', 'alice', use_fallbacks=False),
+            lambda: self._release_when_joined(user_profile_search._user_lookups, 1),
+        )
+        self.assertEqual(results[:2], [None, None])
+        self.assertEqual(user_profile_search._profile_searches.coalesced, 0)
+        # The users.info call itself is still shared; only the full search falls back
+        self.assertEqual(self.adapter.slack_find_user_by_id.call_count, 1)
+        self.adapter.slack_find_message.assert_called_once()
+
+    def test_username_fallback_joins_id_lookup(self):
+        """A username lookup for a user already being fetched by ID shares that call"""
+        self.adapter.slack_find_user_by_id.side_effect = self._slow_profile('https://linkedin.com/in/alice')
+        results = _run_concurrently(
+            lambda: user_profile_search._find_user_by_id('U1', 'Alice'),
+            lambda: (time.sleep(0.05), user_profile_search._find_user_by_username('alice'))[1],
+            lambda: self._release_when_joined(user_profile_search._user_lookups, 1),
+        )
+        self.assertEqual(results[0], results[1])
+        self.adapter.slack_find_user_by_username.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
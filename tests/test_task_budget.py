@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Test suite for the Zapier task budget
+"""
+
+import json
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dual_mode.mcp_adapter as mcp_adapter_module
+from dual_mode.mcp_adapter import MCPAdapter
+from task_budget import TaskBudget, billing_period_start, estimate_run_cost
+
+
+class FakeClock:
+    """Manually advanced wall clock"""
+
+    def __init__(self):
+        self.now = datetime(2025, 9, 20, 12, 0).timestamp()
+
+    def __call__(self):
+        return self.now
+
+
+class TestTaskBudget(unittest.TestCase):
+    """Test usage tracking, persistence and run planning"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, "task_budget.json")
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _budget(self, **kwargs):
+        return TaskBudget(self.path, clock=self.clock, **kwargs)
+
+    def test_cost_estimate(self):
+        """A run costs one task per page plus one or three per lookup"""
+        self.assertEqual(estimate_run_cost(4, search_pages=2), 2 + 4 * 3)
+        self.assertEqual(estimate_run_cost(4, search_pages=2, use_fallbacks=False), 2 + 4)
+
+    def test_billing_period_start(self):
+        """Periods start on the billing day, rolling back across months and years"""
+        self.assertEqual(billing_period_start(datetime(2025, 9, 20, 8), 15), datetime(2025, 9, 15))
+        self.assertEqual(billing_period_start(datetime(2025, 9, 10, 8), 15), datetime(2025, 8, 15))
+        self.assertEqual(billing_period_start(datetime(2025, 1, 3), 5), datetime(2024, 12, 5))
+
+    def test_usage_persists_across_runs(self):
+        """Finished runs are saved with owner-only permissions and summed per period"""
+        budget = self._budget(monthly_task_limit=100)
+        budget.record_call('slack_find_message')
+        budget.record_call('slack_find_user_by_id', tasks=2)
+        run = budget.finish_run()
+
+        self.assertEqual((run['tasks'], run['calls']['slack_find_user_by_id']), (3, 2))
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+
+        reloaded = self._budget(monthly_task_limit=100)
+        reloaded.record_call('slack_find_message')
+        self.assertEqual(reloaded.used_this_period(), 4)
+        self.assertEqual(reloaded.remaining(), 96)
+        self.assertEqual(reloaded.average_run_tasks(), 3)
+
+        # Runs from an earlier billing period no longer count
+        self.clock.now = datetime(2025, 10, 2).timestamp()
+        self.assertEqual(reloaded.used_this_period(), 1)
+
+    def test_corrupt_history_starts_fresh(self):
+        """An unreadable history file is treated as no usage"""
+        with open(self.path, 'w') as f:
+            f.write('{not json')
+        budget = self._budget(monthly_task_limit=10)
+        self.assertEqual(budget.remaining(), 10)
+        budget.finish_run()
+        with open(self.path) as f:
+            self.assertEqual(len(json.load(f)['runs']), 1)
+
+    def test_unlimited_budget_plans_everything(self):
+        """Without a configured quota every lookup runs with fallbacks"""
+        plan = self._budget().plan_run(50, search_pages=1)
+        self.assertEqual((plan.lookups_allowed, plan.use_fallbacks, plan.remaining_tasks), (50, True, None))
+        self.assertFalse(plan.is_limited)
+
+    def test_tight_budget_drops_fallbacks_then_lookups(self):
+        """Fallbacks go first, then lookups beyond the remaining tasks"""
+        budget = self._budget(monthly_task_limit=20, reserve_tasks=2)
+
+        plan = budget.plan_run(5, search_pages=1)
+        self.assertEqual((plan.lookups_allowed, plan.use_fallbacks), (5, True))
+
+        # The next page uses its reserved task: 2 left after the first plan's 15,
+        # one kept for the page after
+        budget.record_call('slack_find_message')
+        plan = budget.plan_run(3, search_pages=1)
+        self.assertEqual((plan.remaining_tasks, plan.lookups_allowed, plan.use_fallbacks), (2, 1, False))
+        self.assertTrue(plan.is_limited)
+        self.assertEqual(budget.lookups_skipped, 2)
+
+        # Spending reserved tasks does not free more budget
+        budget.record_call('slack_find_user_by_id')
+        self.assertEqual(budget.remaining(), 0)
+
+    def test_cache_hit_run_releases_reservation(self):
+        """Tasks planned for lookups that never called Zapier are freed when the run finishes"""
+        budget = self._budget(monthly_task_limit=100)
+        budget.plan_run(3, search_pages=1)
+        # One lookup reaches Zapier, the other two are served from the cache
+        budget.record_call('slack_find_user_by_id')
+        self.assertEqual(budget.remaining(), 100 - 1 - 9)
+
+        self.assertEqual(budget.finish_run()['tasks'], 1)
+        self.assertEqual(budget.remaining(), 99)
+
+    def test_unplanned_calls_keep_lookup_reservations(self):
+        """Search and users.list pages do not release the reservations of lookups still pending"""
+        budget = self._budget(monthly_task_limit=100)
+        budget.plan_run(2, search_pages=1)
+        self.assertEqual(budget.remaining(), 100 - 1 - 2 * 3)
+
+        # The reserved next page, then users.list pages nothing was planned for
+        budget.record_call('slack_find_message')
+        self.assertEqual(budget.remaining(), 93)
+        budget.record_call('slack_api_request_beta', tasks=2)
+        self.assertEqual(budget.remaining(), 91)
+
+        # The lookups consume their own reservations
+        for function_key in ('slack_find_user_by_id', 'slack_find_user_by_username', 'slack_find_message') * 2:
+            budget.record_call(function_key)
+            self.assertEqual(budget.remaining(), 91)
+
+    def test_exhausted_budget_plans_nothing(self):
+        """Once Zapier reports insufficient tasks, no lookups are planned"""
+        budget = self._budget()
+        budget.mark_exhausted()
+        self.assertEqual(budget.plan_run(3).lookups_allowed, 0)
+        self.assertFalse(budget.finish_run()['tasks'])
+        self.assertFalse(budget.exhausted)
+
+
+class TestAdapterTaskAccounting(unittest.TestCase):
+    """Test that completed MCP calls are counted against the budget"""
+
+    def setUp(self):
+        self.fake_find = MagicMock(return_value={'ok': True})
+        self.budget = MagicMock()
+        patches = [
+            patch.dict(mcp_adapter_module.__dict__, {'mcp__zapier__slack_find_message': self.fake_find}),
+            patch.object(mcp_adapter_module, 'get_rate_limiter'),
+            patch.object(mcp_adapter_module, 'get_task_budget', return_value=self.budget),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_successful_call_is_recorded(self):
+        """Each completed call counts one task for its method"""
+        MCPAdapter().slack_find_message(query="hi")
+        self.budget.record_call.assert_called_once_with('slack_find_message')
+
+    def test_insufficient_tasks_marks_budget_exhausted(self):
+        """Zapier's quota error stops further lookups instead of counting a task"""
+        self.fake_find.return_value = {'isError': True, 'error': ['Insufficient tasks remaining']}
+        self.assertIsNone(MCPAdapter().slack_find_message(query="hi"))
+        self.budget.mark_exhausted.assert_called_once_with()
+        self.budget.record_call.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Test suite for the bulk user directory prefetch
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import user_directory
+import user_profile_search
+from single_flight import SingleFlight
+from user_directory import UserDirectory, _slack_payload
+
+
+def _member(n, title=''):
+    return {'id': f'U{n:03d}', 'name': f'user{n}', 'profile': {'title': title}}
+
+
+def _page(members, next_cursor=''):
+    return {'ok': True, 'members': members, 'response_metadata': {'next_cursor': next_cursor}}
+
+
+class TestUserDirectory(unittest.TestCase):
+    """Test paginated prefetch and index lookups"""
+
+    def setUp(self):
+        self.adapter = MagicMock()
+        patcher = patch.object(user_directory, 'get_mcp_adapter', return_value=self.adapter)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_response_unwrapping(self):
+        """Slack JSON is found directly, as a string, or nested by Zapier"""
+        page = _page([_member(1)])
+        for result in (page, json.dumps(page), {'response': {'body': json.dumps(page)}}, {'results': [page]}):
+            self.assertEqual(_slack_payload(result), page)
+        self.assertIsNone(_slack_payload({'status': 500}))
+        self.assertIsNone(_slack_payload('<html>'))
+
+    def test_prefetch_follows_cursors(self):
+        """Pages are fetched until the cursor runs out, then indexed by ID and username"""
+        self.adapter.slack_api_request_beta.side_effect = [
+            _page([_member(1), _member(2)], next_cursor='c2'),
+            {'response': {'body': json.dumps(_page([_member(3)]))}},
+        ]
+        directory = UserDirectory(page_size=2)
+        self.assertEqual(directory.prefetch(), 3)
+        self.assertEqual(directory.prefetch(), 3)
+
+        urls = [c.kwargs['url'] for c in self.adapter.slack_api_request_beta.call_args_list]
+        self.assertEqual(urls, ['https://slack.com/api/users.list?limit=2',
+                                'https://slack.com/api/users.list?limit=2&cursor=c2'])
+        self.assertEqual(directory.get('U003')['name'], 'user3')
+        self.assertEqual(directory.get_by_username('USER2')['id'], 'U002')
+        self.assertIsNone(directory.get('U999'))
+        stats = directory.get_stats()
+        self.assertEqual((stats['pages_fetched'], stats['complete'], stats['hits'], stats['misses']), (2, True, 1, 1))
+
+    def test_page_limit_and_errors_leave_partial_index(self):
+        """A page limit or failed page stops the prefetch with what was indexed"""
+        self.adapter.slack_api_request_beta.return_value = _page([_member(1)], next_cursor='more')
+        directory = UserDirectory()
+        directory.prefetch(max_pages=2)
+        self.assertFalse(directory.complete)
+        self.assertEqual(directory.pages_fetched, 2)
+
+        self.adapter.slack_api_request_beta.return_value = {'ok': False, 'error': 'missing_scope'}
+        failed = UserDirectory()
+        self.assertEqual(failed.prefetch(), 0)
+        self.assertIsNone(failed.get('U001'))
+
+    def test_lookups_wait_for_running_prefetch(self):
+        """A lookup made during the prefetch waits for it instead of missing"""
+        release = threading.Event()
+
+        def slow_page(**kwargs):
+            release.wait(5)
+            return _page([_member(1)])
+
+        self.adapter.slack_api_request_beta.side_effect = slow_page
+        directory = UserDirectory()
+        self.assertIsNone(directory.get('U001'))  # No prefetch started: immediate miss
+
+        prefetch = threading.Thread(target=directory.prefetch)
+        prefetch.start()
+        while not self.adapter.slack_api_request_beta.called:
+            time.sleep(0.001)
+        self.assertIsNone(directory.get('U001', timeout=0.01))
+        release.set()
+        self.assertEqual(directory.get('U001', timeout=5)['id'], 'U001')
+        prefetch.join()
+
+
+class TestProfileSearchUsesDirectory(unittest.TestCase):
+    """Test profile searches resolving users from the prefetched index"""
+
+    def setUp(self):
+        self.adapter = MagicMock()
+        self.adapter.slack_api_request_beta.return_value = _page([
+            _member(1, title='PM https://linkedin.com/in/one'), _member(2),
+        ])
+        self.directory = UserDirectory()
+        patches = [
+            patch.object(user_directory, 'get_mcp_adapter', return_value=self.adapter),
+            patch.object(user_profile_search, 'get_mcp_adapter', return_value=self.adapter),
+            patch.object(user_profile_search, 'get_user_directory', return_value=self.directory),
+            patch.object(user_profile_search, '_user_lookups', SingleFlight()),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_indexed_users_need_no_lookup_call(self):
+        """Indexed users resolve from the index; others fall back to users.info"""
+        self.directory.prefetch()
+        self.adapter.slack_find_user_by_id.return_value = {'profile': {'title': 'https://linkedin.com/in/three'}}
+
+        self.assertEqual(user_profile_search.search_user_profile_for_linkedin('U001'),
+                         'https://linkedin.com/in/one')
+        self.adapter.slack_find_user_by_id.assert_not_called()
+
+        self.assertEqual(user_profile_search.search_user_profile_for_linkedin('U003'),
+                         'https://linkedin.com/in/three')
+        self.adapter.slack_find_user_by_id.assert_called_once()
+
+    def test_no_lookup_call_after_directory_wait_uses_the_deadline(self):
+        """A search whose budget ran out waiting for the prefetch does not fall through to users.info"""
+        release = threading.Event()
+        self.adapter.slack_api_request_beta.side_effect = lambda **kwargs: (release.wait(5), _page([]))[1]
+        prefetch = threading.Thread(target=self.directory.prefetch)
+        prefetch.start()
+        self.addCleanup(prefetch.join)
+        self.addCleanup(release.set)
+        while not self.adapter.slack_api_request_beta.called:
+            time.sleep(0.001)
+
+        self.assertIsNone(user_profile_search.search_user_profile_for_linkedin('U003', timeout_seconds=0.1))
+        time.sleep(0.2)
+        self.adapter.slack_find_user_by_id.assert_not_called()
+
+    def test_indexed_user_without_link_is_looked_up(self):
+        """users.list profiles lack custom fields, so an indexed user without LinkedIn still gets users.info"""
+        self.directory.prefetch()
+        self.adapter.slack_find_user_by_id.return_value = {
+            'id': 'U002', 'profile': {'fields': {'Xf01': {'label': 'LinkedIn', 'value': 'https://linkedin.com/in/two'}}}
+        }
+        self.assertEqual(user_profile_search.search_user_profile_for_linkedin('U002', use_fallbacks=False),
+                         'https://linkedin.com/in/two')
+        self.adapter.slack_find_user_by_id.assert_called_once()
+
+        # A full profile without LinkedIn is a definitive answer
+        self.adapter.slack_find_user_by_id.return_value = {'id': 'U002', 'profile': {'fields': {}}}
+        self.adapter.slack_find_message.return_value = {'results': []}
+        outcome = {}
+        self.assertIsNone(user_profile_search.search_user_profile_for_linkedin('U002', outcome=outcome))
+        self.assertTrue(outcome['profile_checked'])
+
+    def test_username_fallback_uses_index(self):
+        """The username fallback resolves users with a LinkedIn link from the index too"""
+        self.directory.prefetch()
+        self.assertEqual(user_profile_search._find_user_by_username('User1')['id'], 'U001')
+        self.adapter.slack_find_user_by_username.assert_not_called()
+
+        self.adapter.slack_find_user_by_username.return_value = {'id': 'U002', 'profile': {}}
+        user_profile_search._find_user_by_username('User2')
+        self.adapter.slack_find_user_by_username.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test suite for run watermarks
+"""
+
+import json
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import daily_intros
+from config import SlackConfig
+from report_index import ReportIndex
+from watermark import WatermarkStore
+
+
+class TestWatermarkStore(unittest.TestCase):
+    """Test persistence and forward-only updates"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, "watermark.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_advance_persists_per_channel(self):
+        """Watermarks survive a reload, per channel, with owner-only permissions"""
+        store = WatermarkStore(self.path, clock=lambda: 100.0)
+        self.assertIsNone(store.get('intros'))
+        self.assertTrue(store.advance('intros', '2025-09-18T10:00:00.000Z', '1758189600.000100'))
+        store.advance('general', '2025-09-10T08:00:00.000Z')
+
+        reloaded = WatermarkStore(self.path)
+        self.assertEqual(reloaded.get('intros'), ('2025-09-18T10:00:00.000Z', '1758189600.000100', 100.0))
+        self.assertEqual(reloaded.get('general').ts, '2025-09-10T08:00:00.000Z')
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+
+    def test_only_moves_forward(self):
+        """An older or equal timestamp leaves the watermark alone"""
+        store = WatermarkStore(self.path)
+        store.advance('intros', '2025-09-18T10:00:00.000Z', 'new')
+        self.assertFalse(store.advance('intros', '2025-09-17T10:00:00.000Z', 'old'))
+        self.assertFalse(store.advance('intros', '2025-09-18T10:00:00.000Z', 'same'))
+        self.assertEqual(WatermarkStore(self.path).get('intros').message_id, 'new')
+
+    def test_merges_concurrent_writers(self):
+        """Advancing one channel keeps channels another process saved meanwhile"""
+        first = WatermarkStore(self.path)
+        second = WatermarkStore(self.path)
+        first.advance('intros', '2025-09-18T10:00:00.000Z')
+        second.advance('general', '2025-09-18T11:00:00.000Z')
+        self.assertEqual(set(WatermarkStore(self.path).get(c).ts for c in ('intros', 'general')),
+                         {'2025-09-18T10:00:00.000Z', '2025-09-18T11:00:00.000Z'})
+
+    def test_corrupt_file_starts_fresh(self):
+        """An unreadable watermark file is treated as no watermark"""
+        with open(self.path, 'w') as f:
+            f.write('{not json')
+        store = WatermarkStore(self.path)
+        self.assertIsNone(store.get('intros'))
+        store.advance('intros', '2025-09-18T10:00:00.000Z')
+        with open(self.path) as f:
+            self.assertIn('intros', json.load(f)['channels'])
+
+
+class TestCutoffDetection(unittest.TestCase):
+    """Test get_cutoff_timestamp with the watermark and the report index migration"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.report_dir = os.path.join(self.test_dir, "welcome_messages")
+        os.makedirs(self.report_dir)
+        self.store = WatermarkStore(os.path.join(self.report_dir, "watermark.json"))
+        previous_cwd = os.getcwd()
+        os.chdir(self.test_dir)
+        self.addCleanup(os.chdir, previous_cwd)
+        patches = [
+            patch.object(daily_intros, 'get_watermark_store', return_value=self.store),
+            patch.object(daily_intros, 'get_report_index', return_value=ReportIndex(self.report_dir)),
+            patch.object(daily_intros, '_get_cached_config', return_value=SimpleNamespace(slack=SlackConfig())),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _write_report(self, date, *timestamps):
+        with open(os.path.join(self.report_dir, f"daily_intros_{date}.md"), 'w') as f:
+            f.write("".join(f"## {n}. User {n}\n\n- **Posted:** {ts}\n\n"
+                            for n, ts in enumerate(timestamps, 1)))
+
+    def test_reports_seed_watermark_once(self):
+        """Without a watermark the newest reported message is used and stored"""
+        self._write_report('2025-09-17', '2025-09-16T09:00:00.000Z')
+        self._write_report('2025-09-18', '2025-09-17T12:00:00.000Z', '2025-09-17T15:30:00.000Z')
+
+        self.assertEqual(daily_intros.get_cutoff_timestamp(), '2025-09-17T15:30:00.000Z')
+        self.assertEqual(self.store.get('intros').ts, '2025-09-17T15:30:00.000Z')
+
+        # Later runs read the watermark and ignore (even hand-edited) reports
+        self._write_report('2025-09-18', 'edited by hand')
+        with patch.object(daily_intros, 'get_report_index') as get_index:
+            get_index.return_value.get.return_value = None
+            self.assertEqual(daily_intros.get_cutoff_timestamp(), '2025-09-17T15:30:00.000Z')
+        get_index.return_value.latest_timestamp.assert_not_called()
+
+    def test_rewritten_report_searches_its_window_again(self):
+        """Re-running a date whose report exists starts from that report's cutoff, not the watermark"""
+        self._write_report('2025-09-18', '2025-09-18T09:00:00.000Z')
+        self.store.advance('intros', '2025-09-18T11:00:00.000Z')
+        self.assertEqual(daily_intros.get_cutoff_timestamp(output_date='2025-09-18'), '2025-09-18T00:00:00.000Z')
+
+        daily_intros.save_daily_intro_report([], output_dir=self.report_dir, output_date='2025-09-19',
+                                             cutoff='2025-09-18T09:00:00.000Z')
+        self.assertEqual(daily_intros.get_cutoff_timestamp(output_date='2025-09-19'), '2025-09-18T09:00:00.000Z')
+        self.assertEqual(daily_intros.get_cutoff_timestamp(output_date='2025-09-20'), '2025-09-18T11:00:00.000Z')
+
+    def test_explicit_start_date_and_default(self):
+        """A start date bypasses the watermark; an empty directory uses the default"""
+        self.assertEqual(daily_intros.get_cutoff_timestamp('2025-09-01'), '2025-09-01T00:00:00.000Z')
+        self.assertEqual(daily_intros.get_cutoff_timestamp(), '2025-09-17T00:00:00.000Z')
+        self.assertIsNone(self.store.get('intros'))
+
+
+if __name__ == '__main__':
+    unittest.main()